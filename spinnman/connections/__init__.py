@@ -12,8 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .async_scp_engine import AsyncSCPEngine
+from .batch_connection_listener import BatchConnectionListener
 from .connection_listener import ConnectionListener
+from .listener_queue_policy import ListenerQueuePolicy
 from .scp_request_pipeline import SCPRequestPipeLine
+from .send_queue import SendQueue
 from .token_bucket import TokenBucket
 
-__all__ = ["ConnectionListener", "SCPRequestPipeLine", "TokenBucket"]
+__all__ = [
+    "AsyncSCPEngine", "BatchConnectionListener", "ConnectionListener",
+    "ListenerQueuePolicy", "SCPRequestPipeLine", "SendQueue", "TokenBucket"]
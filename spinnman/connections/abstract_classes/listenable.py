@@ -11,7 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Callable, Generic, TypeVar
+from typing import Callable, Generic, Optional, TypeVar
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 #: :meta private:
 T = TypeVar("T")
@@ -35,6 +35,17 @@ class Listenable(Generic[T], metaclass=AbstractBase):
         """
         raise NotImplementedError
 
+    def get_read_method(self) -> Optional[Callable[[bytes], T]]:
+        """
+        Get the method that reads a message from the data of a datagram
+        received by this connection, so that a listener can receive many
+        datagrams at once and read each of them.
+
+        :return: The method, or `None` if messages must be received one at
+            a time with the receive method
+        """
+        return None
+
     @abstractmethod
     def is_ready_to_receive(self, timeout: float = 0) -> bool:
         """
@@ -0,0 +1,418 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from contextlib import suppress
+import struct
+from types import TracebackType
+from typing import (
+    Dict, Iterable, List, Optional, Set, Type, TYPE_CHECKING, cast)
+from spinn_utilities.typing.coords import XYP
+from spinnman.constants import (
+    CPU_INFO_BYTES, CPU_INFO_OFFSET, N_RETRIES, SCP_TIMEOUT,
+    UDP_MESSAGE_MAX_SIZE)
+from spinnman.exceptions import (
+    SpinnmanEOFException, SpinnmanIOException, SpinnmanTimeoutException)
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.messages.scp.abstract_messages import AbstractSCPRequest
+from spinnman.messages.scp.enums import SCPResult
+from spinnman.messages.scp.impl.read_memory import ReadMemory
+from spinnman.messages.scp.impl.write_memory import WriteMemory
+from spinnman.model import CPUInfos
+from .scp_request_pipeline import (
+    R, RETRY_CODES, get_next_sequence_number)
+if TYPE_CHECKING:
+    from spinn_machine import CoreSubsets
+    from spinnman.processes import ConnectionSelector
+
+#: The delay before resending a request that got a retry code, matching
+#: :py:class:`SCPRequestPipeLine`
+_RETRY_CODE_DELAY = 0.1
+
+
+class _Outstanding(object):
+    """
+    The record of a single request that has been sent but not answered.
+    """
+    __slots__ = (
+        "future", "reasons", "request", "request_data", "retries", "timer")
+
+    def __init__(
+            self, request: AbstractSCPRequest, request_data: bytes,
+            future: asyncio.Future, retries: int):
+        self.request = request
+        self.request_data = request_data
+        self.future = future
+        self.retries = retries
+        self.reasons: List[str] = list()
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class _ConnectionState(object):
+    """
+    The state of the engine for one connection.
+    """
+    __slots__ = ("outstanding", "window")
+
+    def __init__(self, n_channels: int):
+        # The send window; a request must hold a slot until it is answered
+        self.window = asyncio.Semaphore(n_channels)
+        # A dictionary of sequence number -> outstanding request
+        self.outstanding: Dict[int, _Outstanding] = dict()
+
+
+class AsyncSCPEngine(object):
+    """
+    An :py:mod:`asyncio` equivalent of :py:class:`SCPRequestPipeLine`.
+
+    Requests are sent as coroutines, so many independent operations (on the
+    same or different connections) can be in flight at once, without one
+    thread per connection.  Each connection has its own window of
+    outstanding requests, its own retry timers, and is read from the event
+    loop only when the socket is readable.
+
+    Each engine belongs to the event loop in which it is first used, and
+    the connections it uses must not be read by anything else while it is
+    open.  Use it as an asynchronous context manager, or call :py:meth:`close`
+    when done::
+
+        async with AsyncSCPEngine(
+                transceiver.get_scamp_connection_selector()) as engine:
+            data = await engine.read_memory(0, 0, address, length)
+    """
+    __slots__ = (
+        "_conn_selector",
+        "_loop",
+        "_n_bad_packets",
+        "_n_channels",
+        "_n_resent",
+        "_n_retries",
+        "_n_retry_code_resent",
+        "_n_timeouts",
+        "_non_fail_retry_codes",
+        "_states",
+        "_timeout")
+
+    def __init__(
+            self, connection_selector: "ConnectionSelector",
+            n_channels: int = 8, n_retries: int = N_RETRIES,
+            timeout: float = SCP_TIMEOUT,
+            non_fail_retry_codes: Optional[Set[SCPResult]] = None):
+        """
+        :param ConnectionSelector connection_selector:
+            How to choose the connection for each request
+        :param int n_channels:
+            The maximum number of outstanding requests per connection
+        :param int n_retries:
+            The number of times to resend any request for any reason before
+            an error is raised
+        :param float timeout:
+            The number of seconds after sending a request before it is
+            considered to have timed out
+        :param non_fail_retry_codes: Codes that could retry but won't fail, or
+            None if there are no such codes
+        :type non_fail_retry_codes: set(SCPResult) or None
+        """
+        self._conn_selector = connection_selector
+        self._n_channels = n_channels
+        self._n_retries = n_retries
+        self._timeout = timeout
+        self._non_fail_retry_codes = non_fail_retry_codes or set()
+        self._states: Dict[SCAMPConnection, _ConnectionState] = dict()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._n_bad_packets = 0
+        self._n_timeouts = 0
+        self._n_resent = 0
+        self._n_retry_code_resent = 0
+
+    async def __aenter__(self) -> "AsyncSCPEngine":
+        return self
+
+    async def __aexit__(
+            self, exc_type: Optional[Type[BaseException]],
+            exc_val: Optional[BaseException],
+            exc_tb: Optional[TracebackType]) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop listening on the connections and fail any requests that are
+        still outstanding.  The connections themselves are not closed.
+        """
+        for connection, state in self._states.items():
+            if self._loop is not None:
+                with suppress(SpinnmanEOFException):
+                    self._loop.remove_reader(connection.fileno())
+            self.__fail_all(state, SpinnmanIOException(
+                "SCP engine closed before a response was received"))
+        self._states.clear()
+
+    @property
+    def n_timeouts(self) -> int:
+        """
+        The number of timeouts that occurred.
+
+        :rtype: int
+        """
+        return self._n_timeouts
+
+    @property
+    def n_bad_packets(self) -> int:
+        """
+        The number of packets received that could not be read as SCP
+        responses, and so were dropped.
+
+        :rtype: int
+        """
+        return self._n_bad_packets
+
+    @property
+    def n_resent(self) -> int:
+        """
+        The number of packets that have been resent.
+
+        :rtype: int
+        """
+        return self._n_resent
+
+    @property
+    def n_retry_code_resent(self) -> int:
+        """
+        The number of resends due to reasons for which automated retry is
+        the correct response in-protocol.
+
+        :rtype: int
+        """
+        return self._n_retry_code_resent
+
+    def __state(self, connection: SCAMPConnection) -> _ConnectionState:
+        state = self._states.get(connection)
+        if state is None:
+            state = _ConnectionState(self._n_channels)
+            self._states[connection] = state
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(
+                connection.fileno(), self.__on_readable, connection, state)
+        return state
+
+    async def send_request(self, request: AbstractSCPRequest[R]) -> R:
+        """
+        Send a request and wait for its response, retrying as needed.
+
+        :param AbstractSCPRequest request: The request to send
+        :return: The parsed response to the request
+        :rtype: AbstractSCPResponse
+        :raise SpinnmanTimeoutException:
+            If every attempt to send the request timed out
+        :raise SpinnmanIOException: If the request failed for other reasons
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If the response indicates an error
+        """
+        connection = self._conn_selector.get_next_connection(request)
+        state = self.__state(connection)
+        async with state.window:
+            sequence = get_next_sequence_number()
+            request.scp_request_header.sequence = sequence
+            record = _Outstanding(
+                request, connection.get_scp_data(request),
+                asyncio.get_running_loop().create_future(), self._n_retries)
+            state.outstanding[sequence] = record
+            try:
+                self.__transmit(connection, state, sequence, record)
+                return cast(R, await record.future)
+            finally:
+                if record.timer is not None:
+                    record.timer.cancel()
+                if state.outstanding.get(sequence) is record:
+                    del state.outstanding[sequence]
+
+    def __transmit(
+            self, connection: SCAMPConnection, state: _ConnectionState,
+            sequence: int, record: _Outstanding):
+        connection.send(record.request_data)
+        record.timer = asyncio.get_running_loop().call_later(
+            self._timeout, self.__on_timeout, connection, state, sequence)
+
+    def __resend(
+            self, connection: SCAMPConnection, state: _ConnectionState,
+            sequence: int, reason: str) -> None:
+        """
+        Resend a request, or fail it if it has run out of retries.
+        """
+        record = state.outstanding.get(sequence)
+        if record is None or record.future.done():
+            return
+        record.reasons.append(reason)
+        if record.retries <= 0:
+            record.future.set_exception(self.__failure(record))
+            return
+        record.retries -= 1
+        self._n_resent += 1
+        try:
+            self.__transmit(connection, state, sequence, record)
+        except Exception as e:  # pylint: disable=broad-except
+            record.future.set_exception(e)
+
+    def __failure(self, record: _Outstanding) -> Exception:
+        request = record.request
+        if all(reason == "timeout" for reason in record.reasons):
+            return SpinnmanTimeoutException(str(request), self._timeout)
+        return SpinnmanIOException(
+            f"Errors sending request {request} to "
+            f"{request.sdp_header.destination_chip_x}, "
+            f"{request.sdp_header.destination_chip_y}, "
+            f"{request.sdp_header.destination_cpu} over "
+            f"{self._n_retries} retries: {record.reasons}")
+
+    def __on_timeout(
+            self, connection: SCAMPConnection, state: _ConnectionState,
+            sequence: int) -> None:
+        self._n_timeouts += 1
+        self.__resend(connection, state, sequence, "timeout")
+
+    def __on_readable(
+            self, connection: SCAMPConnection,
+            state: _ConnectionState) -> None:
+        # Drain everything that is ready; the reader is called once per
+        # wakeup, not once per datagram
+        try:
+            while connection.is_ready_to_receive():
+                try:
+                    response = connection.receive_scp_response(self._timeout)
+                except (struct.error, ValueError):
+                    # A packet that is not an SCP response is dropped; any
+                    # request it should have answered will time out
+                    self._n_bad_packets += 1
+                    continue
+                self.__handle_response(connection, state, *response)
+        except Exception as e:  # pylint: disable=broad-except
+            with suppress(SpinnmanEOFException):
+                asyncio.get_running_loop().remove_reader(connection.fileno())
+            del self._states[connection]
+            self.__fail_all(state, e)
+
+    def __handle_response(
+            self, connection: SCAMPConnection, state: _ConnectionState,
+            result: SCPResult, sequence: int, data: bytes,
+            offset: int) -> None:
+        record = state.outstanding.get(sequence)
+
+        # Ignore responses to requests that are no longer wanted
+        if record is None or record.future.done():
+            return
+        if record.timer is not None:
+            record.timer.cancel()
+            record.timer = None
+
+        if result in RETRY_CODES and (
+                record.retries > 0 or
+                result not in self._non_fail_retry_codes):
+            self._n_retry_code_resent += 1
+            record.timer = asyncio.get_running_loop().call_later(
+                _RETRY_CODE_DELAY, self.__resend, connection, state,
+                sequence, str(result))
+            return
+
+        try:
+            response = record.request.get_scp_response()
+            response.read_bytestring(data, offset)
+            record.future.set_result(response)
+        except Exception as e:  # pylint: disable=broad-except
+            record.future.set_exception(e)
+
+    @staticmethod
+    def __fail_all(state: _ConnectionState, exception: Exception) -> None:
+        for record in state.outstanding.values():
+            if record.timer is not None:
+                record.timer.cancel()
+            if not record.future.done():
+                record.future.set_exception(exception)
+
+    async def read_memory(
+            self, x: int, y: int, base_address: int, length: int,
+            cpu: int = 0) -> bytearray:
+        """
+        Read some memory from SpiNNaker, with all the packets of the read
+        in flight at once.
+
+        :param int x: The x-coordinate of the chip
+        :param int y: The y-coordinate of the chip
+        :param int base_address: The address in SDRAM where the region starts
+        :param int length: The length of the data to be read in bytes
+        :param int cpu: The CPU to read via
+        :return: The data read
+        :rtype: bytearray
+        """
+        data = bytearray(length)
+        view = memoryview(data)
+
+        async def read_chunk(offset: int, n_bytes: int):
+            response = await self.send_request(
+                ReadMemory((x, y, cpu), base_address + offset, n_bytes))
+            view[offset:offset + n_bytes] = response.data[
+                response.offset:response.offset + n_bytes]
+
+        await asyncio.gather(*(
+            read_chunk(offset, min(length - offset, UDP_MESSAGE_MAX_SIZE))
+            for offset in range(0, length, UDP_MESSAGE_MAX_SIZE)))
+        return data
+
+    async def write_memory(
+            self, x: int, y: int, base_address: int, data: bytes,
+            cpu: int = 0) -> None:
+        """
+        Write some memory on SpiNNaker, with all the packets of the write
+        in flight at once.
+
+        :param int x: The x-coordinate of the chip
+        :param int y: The y-coordinate of the chip
+        :param int base_address: The address in SDRAM where the region starts
+        :param data: The data to write
+        :type data: bytes or bytearray
+        :param int cpu: The CPU to write via
+        """
+        length = len(data)
+        await asyncio.gather(*(
+            self.send_request(WriteMemory(
+                (x, y, cpu), base_address + offset,
+                data[offset:offset + UDP_MESSAGE_MAX_SIZE]))
+            for offset in range(0, length, UDP_MESSAGE_MAX_SIZE)))
+
+    async def get_cpu_infos(
+            self, core_subsets: "CoreSubsets") -> CPUInfos:
+        """
+        Get information about the processors on the board.
+
+        :param ~spinn_machine.CoreSubsets core_subsets:
+            The cores to get the information about
+        :rtype: CPUInfos
+        """
+        cores: Iterable[XYP] = [
+            (core_subset.x, core_subset.y, p)
+            for core_subset in core_subsets
+            for p in core_subset.processor_ids]
+
+        async def read_info(x: int, y: int, p: int) -> bytes:
+            response = await self.send_request(ReadMemory(
+                (x, y, 0), CPU_INFO_OFFSET + CPU_INFO_BYTES * p,
+                CPU_INFO_BYTES))
+            return bytes(response.data[
+                response.offset:response.offset + CPU_INFO_BYTES])
+
+        cpu_infos = CPUInfos()
+        infos: List[bytes] = await asyncio.gather(*(
+            read_info(x, y, p) for (x, y, p) in cores))
+        for (x, y, p), vcpu_data in zip(cores, infos):
+            cpu_infos.add_vcpu_data(x, y, p, vcpu_data)
+        return cpu_infos
@@ -0,0 +1,340 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+import logging
+from threading import Condition, Thread
+from typing import Callable, Deque, Generic, List, TypeVar
+from spinn_utilities.log import FormatAdapter
+from spinnman.exceptions import (
+    SpinnmanEOFException, SpinnmanInvalidParameterException,
+    SpinnmanTimeoutException)
+from spinnman.connections.abstract_classes import Listenable
+from spinnman.connections.udp_packet_connections import UDPConnection
+from .listener_queue_policy import ListenerQueuePolicy
+
+#: :meta private:
+T = TypeVar("T")
+logger = FormatAdapter(logging.getLogger(__name__))
+_TIMEOUT = 1
+_MAX_BATCH = 256
+_QUEUE_SIZE = 65536
+
+
+class BatchConnectionListener(Thread, Generic[T]):
+    """
+    Thread that listens to a connection and calls callbacks with lists of
+    the messages that have arrived, in the order that they arrived.
+
+    Each time the connection is ready, every message that is waiting is
+    received, and the messages are queued for a single worker thread that
+    calls the callbacks.  A UDP connection that can read messages from
+    datagrams receives every waiting datagram with one call to
+    :py:meth:`~spinnman.connections.udp_packet_connections.UDPConnection.receive_many`.
+    Messages that cannot be read are logged and counted, and the others
+    are still passed on.  This avoids the cost of calling a callback for
+    each message when messages arrive quickly.  The queue holds a limited
+    number of messages; what happens when it is full is decided by the
+    :py:class:`ListenerQueuePolicy`.
+    """
+    __slots__ = (
+        "__batches",
+        "__callbacks",
+        "__condition",
+        "__connection",
+        "__done",
+        "__max_batch",
+        "__max_queue_depth",
+        "__n_dropped",
+        "__n_invalid",
+        "__n_received",
+        "__policy",
+        "__queue_depth",
+        "__queue_size",
+        "__timeout",
+        "__worker")
+
+    def __init__(self, connection: Listenable[T],
+                 timeout: float = _TIMEOUT, max_batch: int = _MAX_BATCH,
+                 queue_size: int = _QUEUE_SIZE,
+                 policy: ListenerQueuePolicy = ListenerQueuePolicy.BLOCK):
+        """
+        :param Listenable connection: A connection to listen to
+        :param float timeout:
+            How long to wait for messages before checking to see if the
+            connection is to be terminated.
+        :param int max_batch:
+            The most messages to queue at once; up to this many are
+            received from connections that receive one message at a time
+        :param int queue_size:
+            The most messages to hold that have not yet been passed to the
+            callbacks
+        :param ListenerQueuePolicy policy:
+            What to do with messages when the queue is full
+        """
+        super().__init__(
+            name=f"Batch connection listener for connection {connection}")
+        if max_batch < 1:
+            raise SpinnmanInvalidParameterException(
+                "max_batch", max_batch, "Must be at least 1")
+        if queue_size < max_batch:
+            raise SpinnmanInvalidParameterException(
+                "queue_size", queue_size, "Must be at least max_batch")
+        self.daemon = True
+        self.__connection = connection
+        self.__timeout = timeout
+        self.__max_batch = max_batch
+        self.__queue_size = queue_size
+        self.__policy = policy
+        self.__done = False
+        self.__callbacks: List[Callable[[List[T]], None]] = []
+        self.__batches: Deque[List[T]] = deque()
+        self.__condition = Condition()
+        self.__queue_depth = 0
+        self.__max_queue_depth = 0
+        self.__n_received = 0
+        self.__n_dropped = 0
+        self.__n_invalid = 0
+        self.__worker = Thread(
+            target=self.__run_worker, daemon=True,
+            name=f"Batch callbacks for connection {connection}")
+
+    def __receive_batch(self, handler: Callable[[], T], batch: List[T]):
+        """
+        Receive the messages that are waiting, up to the batch size, one at
+        a time.
+
+        :param ~collections.abc.Callable handler:
+        :param list batch: Where to add the messages
+        """
+        if not self.__connection.is_ready_to_receive(timeout=self.__timeout):
+            return
+        while True:
+            try:
+                batch.append(handler())
+            except SpinnmanEOFException:
+                raise
+            except Exception:  # pylint: disable=broad-except
+                self.__invalid_message()
+            if (len(batch) >= self.__max_batch or
+                    not self.__connection.is_ready_to_receive()):
+                return
+
+    def __receive_datagrams(
+            self, connection: UDPConnection, reader: Callable[[bytes], T],
+            batch: List[T]):
+        """
+        Receive the datagrams that are waiting with one call, and read the
+        messages from them.
+
+        :param UDPConnection connection:
+        :param ~collections.abc.Callable reader:
+        :param list batch: Where to add the messages
+        """
+        try:
+            datagrams = connection.receive_many(self.__timeout)
+        except SpinnmanTimeoutException:
+            return
+        for data in datagrams:
+            try:
+                # The data is copied as the connection reuses its buffers
+                batch.append(reader(bytes(data)))
+            except Exception:  # pylint: disable=broad-except
+                self.__invalid_message()
+
+    def __invalid_message(self):
+        """
+        Note that a message could not be read.
+        """
+        self.__n_invalid += 1
+        logger.warning("problem when reading message", exc_info=True)
+
+    def __enqueue(self, batch: List[T]):
+        """
+        Queue a batch of messages for the worker, applying the policy if
+        there is not enough space.
+
+        :param list batch:
+        """
+        with self.__condition:
+            self.__n_received += len(batch)
+            if self.__policy == ListenerQueuePolicy.BLOCK:
+                while (self.__queue_depth + len(batch) > self.__queue_size
+                        and not self.__done):
+                    self.__condition.wait()
+            elif self.__policy == ListenerQueuePolicy.DROP_NEWEST:
+                space = self.__queue_size - self.__queue_depth
+                if len(batch) > space:
+                    self.__n_dropped += len(batch) - space
+                    batch = batch[:space]
+            if not batch:
+                return
+            self.__batches.append(batch)
+            self.__queue_depth += len(batch)
+            if self.__policy == ListenerQueuePolicy.DROP_OLDEST:
+                self.__drop_oldest()
+            self.__max_queue_depth = max(
+                self.__max_queue_depth, self.__queue_depth)
+            self.__condition.notify_all()
+
+    def __drop_oldest(self):
+        """
+        Drop the messages that have waited longest until the queue fits.
+        """
+        while self.__queue_depth > self.__queue_size:
+            excess = self.__queue_depth - self.__queue_size
+            oldest = self.__batches[0]
+            if len(oldest) <= excess:
+                self.__batches.popleft()
+                n_dropped = len(oldest)
+            else:
+                del oldest[:excess]
+                n_dropped = excess
+            self.__queue_depth -= n_dropped
+            self.__n_dropped += n_dropped
+
+    def __take_all(self) -> List[T]:
+        """
+        Wait for messages and take all of those that are queued.
+
+        :return: The messages, or an empty list if the listener is done
+        :rtype: list
+        """
+        with self.__condition:
+            while not self.__batches and not self.__done:
+                self.__condition.wait()
+            messages: List[T] = []
+            while self.__batches:
+                messages.extend(self.__batches.popleft())
+            self.__queue_depth = 0
+            self.__condition.notify_all()
+            return messages
+
+    def __run_worker(self) -> None:
+        """
+        Implements the thread that calls the callbacks.
+        """
+        while True:
+            messages = self.__take_all()
+            if not messages:
+                return
+            for callback in self.__callbacks:
+                try:
+                    callback(messages)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("problem in listener call")
+
+    def run(self) -> None:
+        """
+        Implements the listening thread.
+        """
+        self.__worker.start()
+        try:
+            connection = self.__connection
+            handler = connection.get_receive_method()
+            reader = connection.get_read_method()
+            while not self.__done:
+                batch: List[T] = []
+                try:
+                    if isinstance(connection, UDPConnection) and reader:
+                        self.__receive_datagrams(connection, reader, batch)
+                    else:
+                        self.__receive_batch(handler, batch)
+                except SpinnmanEOFException:
+                    self.__done = True
+                except Exception:  # pylint: disable=broad-except
+                    if not self.__done:
+                        logger.warning("problem when dispatching message",
+                                       exc_info=True)
+                # Anything received before an error is still passed on
+                for start in range(0, len(batch), self.__max_batch):
+                    self.__enqueue(batch[start:start + self.__max_batch])
+        finally:
+            # The worker hands on what is queued before it stops
+            with self.__condition:
+                self.__done = True
+                self.__condition.notify_all()
+            self.__worker.join()
+
+    def add_callback(self, callback: Callable[[List[T]], None]):
+        """
+        Add a callback to be called when messages are received.
+
+        :param ~collections.abc.Callable callback:
+            A callable which takes a single parameter, which is a list of
+            the messages received in the order they arrived; the result of
+            the callback will be ignored.
+        """
+        self.__callbacks.append(callback)
+
+    @property
+    def n_received(self) -> int:
+        """
+        The number of messages received, including those dropped.
+
+        :rtype: int
+        """
+        return self.__n_received
+
+    @property
+    def n_invalid(self) -> int:
+        """
+        The number of messages that could not be read, which are not
+        included in the messages received.
+
+        :rtype: int
+        """
+        return self.__n_invalid
+
+    @property
+    def n_dropped(self) -> int:
+        """
+        The number of messages dropped because the queue was full.
+
+        :rtype: int
+        """
+        return self.__n_dropped
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of messages waiting to be passed to the callbacks.
+
+        :rtype: int
+        """
+        return self.__queue_depth
+
+    @property
+    def max_queue_depth(self) -> int:
+        """
+        The largest number of messages that have waited at once.
+
+        :rtype: int
+        """
+        return self.__max_queue_depth
+
+    def close(self) -> None:
+        """
+        Closes the listener.
+
+        .. note::
+            This does not close the provider of the messages; this instead
+            marks the listener as closed.  The listener will not truly stop
+            until the get message call returns and the callbacks have been
+            given the messages already received.
+        """
+        with self.__condition:
+            self.__done = True
+            self.__condition.notify_all()
+        self.join()
@@ -31,6 +31,11 @@ class ConnectionListener(Thread, Generic[T]):
     """
     Thread that listens to a connection and calls callbacks with new
     messages when they arrive.
+
+    .. note::
+        Each message is passed to each callback separately, and the calls
+        may happen in any order; when messages arrive quickly, a
+        :py:class:`BatchConnectionListener` is more efficient.
     """
     __slots__ = (
         "__callback_pool",
@@ -0,0 +1,29 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from enum import Enum
+
+
+class ListenerQueuePolicy(Enum):
+    """
+    What a :py:class:`BatchConnectionListener` does with messages that
+    arrive when its queue is full.
+    """
+    #: Stop receiving until there is space; the operating system then
+    #: buffers (and eventually drops) messages that arrive
+    BLOCK = 0
+    #: Drop the messages that have just been received
+    DROP_NEWEST = 1
+    #: Drop the messages that have been waiting longest to be handled
+    DROP_OLDEST = 2
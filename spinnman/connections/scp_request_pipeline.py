@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import heapq
 import sys
 from threading import RLock
 import time
 from types import TracebackType
-from typing import Callable, Dict, Generic, List, Optional, TypeVar, cast
+from typing import (
+    Callable, Dict, Generic, List, Optional, Tuple, TypeVar, cast)
 from typing_extensions import TypeAlias
 from spinnman.messages.scp.enums import SCPResult
 from spinnman.exceptions import SpinnmanTimeoutException, SpinnmanIOException
@@ -24,6 +26,8 @@ from spinnman.constants import SCP_TIMEOUT, N_RETRIES
 from spinnman.connections.udp_packet_connections import SCAMPConnection
 from spinnman.messages.scp.abstract_messages import AbstractSCPRequest
 from spinnman.messages.scp.abstract_messages import AbstractSCPResponse
+from spinnman.connections.window_controllers import (
+    AbstractSCPWindowController, RTTEstimator)
 
 #: Type of responses.
 #: :meta private:
@@ -37,6 +41,9 @@ ECB: TypeAlias = Callable[
     [AbstractSCPRequest[R], Exception, TracebackType, SCAMPConnection], None]
 
 MAX_SEQUENCE = 65536
+#: Large enough for any SCP response: the padding, the SDP and SCP headers
+#: and up to 256 bytes of data
+_RECEIVE_BUFFER_SIZE = 300
 RETRY_CODES = frozenset([
     SCPResult.RC_TIMEOUT, SCPResult.RC_P2P_TIMEOUT, SCPResult.RC_LEN,
     SCPResult.RC_P2P_NOREPLY, SCPResult.RC_P2P_BUSY])
@@ -46,6 +53,25 @@ _next_sequence = 0
 _next_sequence_lock = RLock()
 
 
+def get_next_sequence_number() -> int:
+    """
+    Get the next number from the global sequence, applying appropriate
+    wrapping rules as the sequence numbers have a fixed number of bits.
+
+    The sequence is shared by everything that sends SCP requests, so that
+    requests from different senders on the same connection never collide.
+
+    :return: The next number in the sequence.
+    :rtype: int
+    """
+    # pylint: disable=global-statement
+    global _next_sequence
+    with _next_sequence_lock:
+        sequence = _next_sequence
+        _next_sequence = (sequence + 1) % MAX_SEQUENCE
+    return sequence
+
+
 class SCPRequestPipeLine(Generic[R]):
     """
     Allows a set of SCP requests to be grouped together in a communication
@@ -61,26 +87,36 @@ class SCPRequestPipeLine(Generic[R]):
     __slots__ = (
         "_callbacks",
         "_connection",
+        "_deadline",
+        "_deadlines",
         "_error_callbacks",
         "_in_progress",
         "_intermediate_channel_waits",
+        "_last_receive_time",
         "_n_channels",
+        "_n_duplicate_replies",
         "_n_resent",
         "_n_retries",
         "_n_retry_code_resent",
         "_n_timeouts",
         "_non_fail_retry_codes",
         "_packet_timeout",
+        "_receive_buffer",
         "_retry_reason",
         "_request_data",
         "_requests",
         "_retries",
-        "_send_time")
+        "_rtt",
+        "_send_time",
+        "_window_controller")
 
     def __init__(self, connection: SCAMPConnection, n_channels=1,
                  intermediate_channel_waits=0,
                  n_retries=N_RETRIES, packet_timeout=SCP_TIMEOUT,
-                 non_fail_retry_codes=None):
+                 non_fail_retry_codes=None,
+                 window_controller: Optional[
+                     AbstractSCPWindowController] = None,
+                 reuse_receive_buffer: bool = False):
         """
         :param SCAMPConnection connection:
             The connection over which the communication is to take place
@@ -96,8 +132,25 @@ class SCPRequestPipeLine(Generic[R]):
         :param non_fail_retry_codes: Codes that could retry but won't fail, or
             None if there are no such codes
         :type non_fail_retry_codes: set(SCPResult) or None
+        :param window_controller:
+            Decides the number of requests that can be outstanding, replacing
+            n_channels and intermediate_channel_waits.  Responses are then
+            waited for using a retransmit timeout measured from round trips,
+            and on a timeout only as many of the oldest requests are resent
+            as the window allows.  If `None`, the window is fixed and every
+            request whose own timeout has passed is resent.
+        :type window_controller: AbstractSCPWindowController or None
+        :param bool reuse_receive_buffer:
+            Whether to receive every response into the same buffer, so that
+            no memory is allocated per response.  The data of a response
+            is then only valid until the callback returns or sends another
+            request, so callbacks must copy anything they need to keep.
         """
         self._connection = connection
+        self._window_controller = window_controller
+        self._receive_buffer: Optional[bytearray] = None
+        if reuse_receive_buffer:
+            self._receive_buffer = bytearray(_RECEIVE_BUFFER_SIZE)
         self._n_channels = n_channels
         self._intermediate_channel_waits = intermediate_channel_waits
         self._n_retries = n_retries
@@ -125,14 +178,33 @@ class SCPRequestPipeLine(Generic[R]):
         # A dictionary of sequence number -> retry reason
         self._retry_reason: Dict[int, List[str]] = dict()
 
+        # A dictionary of sequence number -> time the packet was last sent
+        self._send_time: Dict[int, float] = dict()
+
+        # A dictionary of sequence number -> time after which the packet is
+        # resent, and a heap of (deadline, sequence number) to find the
+        # earliest; heap entries that no longer match are ignored
+        self._deadline: Dict[int, float] = dict()
+        self._deadlines: List[Tuple[float, int]] = list()
+
+        # The round trip times measured by this pipeline; kept separate from
+        # the connection's so that slow commands don't affect fast ones
+        self._rtt = RTTEstimator(packet_timeout)
+
         # The number of responses outstanding
         self._in_progress = 0
 
+        # The time of the last response; while responses keep arriving,
+        # SCAMP is assumed to still be working through the requests
+        self._last_receive_time = time.monotonic()
+
         # The number of timeouts that occurred
         self._n_timeouts = 0
 
         # The number of packets that have been resent
         self._n_resent = 0
+        # The number of responses to requests no longer outstanding
+        self._n_duplicate_replies = 0
         self._n_retry_code_resent = 0
         self._non_fail_retry_codes = non_fail_retry_codes
         if self._non_fail_retry_codes is None:
@@ -150,12 +222,7 @@ class SCPRequestPipeLine(Generic[R]):
         :return: The next number in the sequence.
         :rtype: int
         """
-        # pylint: disable=global-statement
-        global _next_sequence
-        with _next_sequence_lock:
-            sequence = _next_sequence
-            _next_sequence = (sequence + 1) % MAX_SEQUENCE
-        return sequence
+        return get_next_sequence_number()
 
     def send_request(
             self, request: AbstractSCPRequest[R], callback: Optional[CB],
@@ -183,10 +250,13 @@ class SCPRequestPipeLine(Generic[R]):
                 self._intermediate_channel_waits = self._n_channels - 8
 
         # If all the channels are used, start to receive packets
+        if self._window_controller is not None:
+            while self._in_progress >= self._window_controller.window:
+                self._do_retrieve(self._window_controller.window - 1)
         while (self._n_channels is not None and
+                self._window_controller is None and
                 self._in_progress >= self._n_channels):
-            self._do_retrieve(
-                self._intermediate_channel_waits, self._packet_timeout)
+            self._do_retrieve(self._intermediate_channel_waits)
 
         # Get the next sequence to be used
         sequence = self.__get_next_sequence_number()
@@ -205,6 +275,31 @@ class SCPRequestPipeLine(Generic[R]):
         # self._token_bucket.consume(284)
         self._connection.send(request_data)
         self._in_progress += 1
+        self.__sent(sequence)
+
+    def __sent(self, seq: int) -> None:
+        """
+        Record that a packet has just been sent and when it expires.
+        """
+        now = time.monotonic()
+        self._send_time[seq] = now
+        self.__set_deadline(seq, now + self._receive_timeout)
+
+    def __set_deadline(self, seq: int, deadline: float) -> None:
+        self._deadline[seq] = deadline
+        heapq.heappush(self._deadlines, (deadline, seq))
+
+    def __next_deadline(self) -> Optional[float]:
+        """
+        Get the earliest deadline of the outstanding packets, discarding
+        heap entries of packets that have been answered or resent.
+        """
+        while self._deadlines:
+            deadline, seq = self._deadlines[0]
+            if self._deadline.get(seq) == deadline:
+                return deadline
+            heapq.heappop(self._deadlines)
+        return None
 
     def finish(self) -> None:
         """
@@ -212,7 +307,84 @@ class SCPRequestPipeLine(Generic[R]):
         to ensure that all responses are received and handled.
         """
         while self._in_progress > 0:
-            self._do_retrieve(0, self._packet_timeout)
+            self._do_retrieve(0)
+
+    @property
+    def _receive_timeout(self) -> float:
+        """
+        The time to wait for a response before resending.
+        """
+        if self._window_controller is None:
+            return self._packet_timeout
+        return self._rtt.rto
+
+    def fileno(self) -> int:
+        """
+        Get the file descriptor of the connection of the pipeline, so that
+        several pipelines can be waited on at once.
+
+        :rtype: int
+        """
+        return self._connection.fileno()
+
+    @property
+    def is_full(self) -> bool:
+        """
+        Whether all the channels are in use, so that sending another request
+        would first have to wait for a response.
+
+        :rtype: bool
+        """
+        n_channels = self.n_channels
+        return n_channels is not None and self._in_progress >= n_channels
+
+    @property
+    def n_in_progress(self) -> int:
+        """
+        The number of requests that have been sent but not yet answered.
+
+        :rtype: int
+        """
+        return self._in_progress
+
+    def receive_response(self) -> None:
+        """
+        Wait for and handle at least one response, resending on timeouts.
+        """
+        if self._in_progress > 0:
+            self._do_retrieve(self._in_progress - 1)
+
+    def receive_ready_responses(self) -> None:
+        """
+        Handle all the responses that can be received without waiting.
+        """
+        while self._connection.is_ready_to_receive():
+            self._single_retrieve(self._packet_timeout)
+
+    def time_until_timeout(self, now: float) -> float:
+        """
+        Get the time until the first outstanding request would time out if
+        no response is received.  A request times out when it has been
+        outstanding for the timeout and no response of any kind has been
+        received for the timeout.
+
+        :param float now: The current :py:func:`time.monotonic` time
+        :rtype: float
+        """
+        quiet_until = self._last_receive_time + self._receive_timeout
+        deadline = self.__next_deadline()
+        if deadline is None:
+            return quiet_until - now
+        return max(deadline, quiet_until) - now
+
+    def check_for_timeout(self, now: float) -> None:
+        """
+        Resend the requests that have timed out, if any.
+
+        :param float now: The current :py:func:`time.monotonic` time
+        """
+        if self._in_progress > 0 and self.time_until_timeout(now) <= 0:
+            self._handle_receive_timeout()
 
     @property
     def n_timeouts(self) -> int:
@@ -230,8 +402,29 @@ class SCPRequestPipeLine(Generic[R]):
 
         :rtype: int
         """
+        if self._window_controller is not None:
+            return self._window_controller.window
         return self._n_channels
 
+    @property
+    def window_controller(self) -> Optional[AbstractSCPWindowController]:
+        """
+        The controller of the window, or `None` if the window is fixed.
+
+        :rtype: AbstractSCPWindowController or None
+        """
+        return self._window_controller
+
+    @property
+    def rtt(self) -> RTTEstimator:
+        """
+        The round trip times measured by this pipeline.  These are only
+        used for timeouts when there is a window controller.
+
+        :rtype: RTTEstimator
+        """
+        return self._rtt
+
     @property
     def n_resent(self) -> int:
         """
@@ -241,6 +434,17 @@ class SCPRequestPipeLine(Generic[R]):
         """
         return self._n_resent
 
+    @property
+    def n_duplicate_replies(self) -> int:
+        """
+        The number of responses received to requests that were no longer
+        outstanding; usually a second response to a request that was
+        resent when its first response was only late.
+
+        :rtype: int
+        """
+        return self._n_duplicate_replies
+
     @property
     def n_retry_code_resent(self) -> int:
         """
@@ -259,14 +463,27 @@ class SCPRequestPipeLine(Generic[R]):
         del self._callbacks[seq]
         del self._error_callbacks[seq]
         del self._retry_reason[seq]
+        del self._send_time[seq]
+        del self._deadline[seq]
 
     def _single_retrieve(self, timeout: float):
         # Receive the next response
-        result, seq, raw_data, offset = \
-            self._connection.receive_scp_response(timeout)
+        if self._receive_buffer is None:
+            result, seq, raw_data, offset = \
+                self._connection.receive_scp_response(timeout)
+        else:
+            result, seq, view, offset = \
+                self._connection.receive_scp_response_into(
+                    self._receive_buffer, timeout)
+            # Responses only unpack and slice their data, which a view of
+            # the buffer supports as well as bytes
+            raw_data = cast(bytes, view)
+        self._last_receive_time = time.monotonic()
 
         # Only process responses which have matching requests
-        if seq in self._requests:
+        if seq not in self._requests:
+            self._n_duplicate_replies += 1
+        else:
             self._in_progress -= 1
             request_sent = self._requests[seq]
 
@@ -286,6 +503,14 @@ class SCPRequestPipeLine(Generic[R]):
                         self._remove_record(seq)
                         return
 
+            # Measure the round trip if the packet was only sent once
+            if self._window_controller is not None:
+                rtt = None
+                if self._retries[seq] == self._n_retries:
+                    rtt = self._last_receive_time - self._send_time[seq]
+                    self._rtt.add_sample(rtt)
+                self._window_controller.on_response(rtt)
+
             # No retry is possible and not failed - try constructing the result
             try:
                 response = request_sent.get_scp_response()
@@ -302,12 +527,40 @@ class SCPRequestPipeLine(Generic[R]):
             # Remove the sequence from the outstanding responses
             self._remove_record(seq)
 
-    def _handle_receive_timeout(self) -> None:
+    def _handle_receive_timeout(self, until: Optional[float] = None) -> None:
+        """
+        Resend the packets that have expired.
+
+        :param until: The time up to which the connection has reported that
+            nothing was received, if later than now
+        :type until: float or None
+        """
+        # Only the packets whose deadline has passed are resent, oldest first
+        now = time.monotonic()
+        if until is not None and until > now:
+            now = until
+        expired = list()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, seq = heapq.heappop(self._deadlines)
+            if self._deadline.get(seq) == deadline:
+                expired.append(seq)
+        if not expired:
+            return
         self._n_timeouts += 1
 
-        # If there is a timeout, all packets remaining are resent
+        # With a window controller, only as many as fit in the (shrunken)
+        # window are resent; the rest wait for the next timeout
+        if self._window_controller is not None:
+            self._window_controller.on_timeout(self._send_time[expired[0]])
+            self._rtt.back_off()
+            window = self._window_controller.window
+            for seq in expired[window:]:
+                self.__set_deadline(seq, now + self._receive_timeout)
+            del expired[window:]
+
         to_remove = list()
-        for seq, request_sent in self._requests.items():
+        for seq in expired:
+            request_sent = self._requests[seq]
             self._in_progress -= 1
             try:
                 self._resend(seq, request_sent, "timeout")
@@ -344,9 +597,10 @@ class SCPRequestPipeLine(Generic[R]):
         self._requests[seq] = request_sent
         self._retry_reason[seq].append(reason)
         self._connection.send(self._request_data[seq])
+        self.__sent(seq)
         self._n_resent += 1
 
-    def _do_retrieve(self, n_packets: int, timeout: float):
+    def _do_retrieve(self, n_packets: int):
         """
         Receives responses until there are only n_packets responses left.
 
@@ -355,8 +609,21 @@ class SCPRequestPipeLine(Generic[R]):
         """
         # While there are still more packets in progress than some threshold
         while self._in_progress > n_packets:
-            try:
-                # Receive the next response
-                self._single_retrieve(timeout)
-            except SpinnmanTimeoutException:
-                self._handle_receive_timeout()
+            # Receive the next response, up to when the next packet expires
+            now = time.monotonic()
+            wait = self.time_until_timeout(now)
+            if wait <= 0:
+                # Responses may have arrived while the caller was busy;
+                # handle those before deciding that anything timed out
+                self.receive_ready_responses()
+                if self._in_progress <= n_packets:
+                    break
+                now = time.monotonic()
+                wait = self.time_until_timeout(now)
+            if wait > 0:
+                try:
+                    self._single_retrieve(wait)
+                    continue
+                except SpinnmanTimeoutException:
+                    pass
+            self._handle_receive_timeout(now + wait)
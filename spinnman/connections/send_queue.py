@@ -0,0 +1,169 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+import time
+from typing import Deque, Dict, Iterable, Iterator, Optional
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.connections.udp_packet_connections import UDPConnection
+from .token_bucket import TokenBucket
+
+
+class SendQueue(object):
+    """
+    A queue of prebuilt datagrams (e.g. the ``bytestring`` of EIEIO messages
+    or the result of ``get_scp_data``) to be sent down one or more
+    connections.  Each call to :py:meth:`flush` sends everything that has
+    been queued, passing as many datagrams as possible to each connection
+    at once, and optionally limiting the rate at which each connection
+    (and so each destination board) is sent to.  Usage::
+
+        >>> queue = SendQueue(rate=10000)
+        >>> queue.add_all(connection, datagrams)
+        >>> queue.flush()
+
+    Not thread safe.
+    """
+    __slots__ = (
+        "_burst", "_buckets", "_n_sent", "_pending", "_rate", "_send_time")
+
+    def __init__(self, rate: Optional[float] = None, burst: int = 32):
+        """
+        :param rate:
+            The maximum number of datagrams per second to send down each
+            connection, or `None` to send as fast as possible
+        :type rate: float or None
+        :param int burst:
+            The number of datagrams that can be sent down a connection at
+            once before the rate applies
+        """
+        if rate is not None and rate <= 0:
+            raise SpinnmanInvalidParameterException(
+                "rate", rate, "Must be positive")
+        if burst < 1:
+            raise SpinnmanInvalidParameterException(
+                "burst", burst, "Must be at least 1")
+        self._rate = rate
+        self._burst = burst
+        self._pending: Dict[UDPConnection, Deque[bytes]] = dict()
+        self._buckets: Dict[UDPConnection, TokenBucket] = dict()
+        self._n_sent = 0
+        self._send_time = 0.0
+
+    def add(self, connection: UDPConnection, data: bytes):
+        """
+        Queue a datagram to be sent down a connection.
+
+        :param UDPConnection connection: The connection to send with
+        :param bytes data: The datagram to send
+        """
+        self.__queue(connection).append(data)
+
+    def add_all(self, connection: UDPConnection, datagrams: Iterable[bytes]):
+        """
+        Queue several datagrams to be sent down a connection, in order.
+
+        :param UDPConnection connection: The connection to send with
+        :param iterable(bytes) datagrams: The datagrams to send
+        """
+        self.__queue(connection).extend(datagrams)
+
+    def __queue(self, connection: UDPConnection) -> Deque[bytes]:
+        if connection not in self._pending:
+            self._pending[connection] = deque()
+            if self._rate is not None:
+                self._buckets[connection] = TokenBucket(
+                    self._burst, self._rate)
+        return self._pending[connection]
+
+    @property
+    def n_pending(self) -> int:
+        """
+        The number of datagrams queued but not yet sent.
+
+        :rtype: int
+        """
+        return sum(len(pending) for pending in self._pending.values())
+
+    def flush(self):
+        """
+        Send all the queued datagrams, in the order that they were queued
+        for each connection, waiting as needed to keep within the rate.
+
+        :raise SpinnmanIOException: If there is an error sending
+        """
+        start = time.perf_counter()
+        try:
+            while self.__send_available():
+                pass
+        finally:
+            self._send_time += time.perf_counter() - start
+
+    def __send_available(self) -> bool:
+        """
+        Send what each connection is allowed to send now.
+
+        :return: Whether there is anything still to send
+        :rtype: bool
+        """
+        waiting = False
+        for connection, pending in self._pending.items():
+            if not pending:
+                continue
+            n_to_send = len(pending)
+            bucket = self._buckets.get(connection)
+            if bucket is not None:
+                n_to_send = min(n_to_send, int(bucket.tokens))
+                bucket.consume(n_to_send, block=False)
+            if n_to_send:
+                connection.send_many(self.__take(pending, n_to_send))
+            waiting = waiting or bool(pending)
+        if waiting:
+            # Wait for a connection to be able to send again
+            time.sleep(max(0.0, min(
+                (1.0 - bucket.tokens) / self._rate
+                for connection, bucket in self._buckets.items()
+                if self._pending[connection])))
+        return waiting
+
+    def __take(self, pending: Deque[bytes], n_to_send: int) -> Iterator[bytes]:
+        """
+        Produce datagrams to send, removing each from the queue only once
+        the next is asked for (or the last has been), so that a datagram
+        that fails to send stays queued.
+        """
+        for _ in range(n_to_send):
+            yield pending[0]
+            pending.popleft()
+            self._n_sent += 1
+
+    @property
+    def n_sent(self) -> int:
+        """
+        The number of datagrams sent.
+
+        :rtype: int
+        """
+        return self._n_sent
+
+    @property
+    def packets_per_second(self) -> float:
+        """
+        The rate achieved while sending, in datagrams per second.
+
+        :rtype: float
+        """
+        if not self._send_time:
+            return 0.0
+        return self._n_sent / self._send_time
@@ -71,9 +71,10 @@ class TokenBucket(object):
 
         :rtype: int
         """
+        now = time.time()
         if self._tokens < self._capacity:
-            now = time.time()
             delta = self._fill_rate * (now - self._timestamp)
             self._tokens = min(self._capacity, self._tokens + delta)
-            self._timestamp = now
+        # A full bucket does not fill while it waits to be used
+        self._timestamp = now
         return self._tokens
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import time
-from typing import Optional
+from typing import Iterable, Optional, Union
 
 from spinnman.messages.spinnaker_boot import SpinnakerBootMessage
 from spinnman.constants import UDP_BOOT_CONNECTION_DEFAULT_PORT
@@ -57,6 +57,28 @@ class BootConnection(UDPConnection):
         # Sleep between messages to avoid flooding the machine
         time.sleep(_ANTI_FLOOD_DELAY)
 
+    def send_boot_packets(
+            self, packets: Iterable[Union[bytes, memoryview]],
+            interval: float = _ANTI_FLOOD_DELAY):
+        """
+        Sends already encoded SpiNNaker boot messages using this connection,
+        one every `interval` seconds.  The time taken to send each packet
+        counts towards the interval, and there is no wait after the last.
+
+        :param packets: The encoded messages to send
+        :type packets: iterable(bytes or memoryview)
+        :param float interval: The time between the starts of the messages
+        :raise SpinnmanIOException:
+            If there is an error sending a message
+        """
+        next_send = time.monotonic()
+        for packet in packets:
+            delay = next_send - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self.send(packet)
+            next_send += interval
+
     def receive_boot_message(
             self, timeout: Optional[float] = None) -> SpinnakerBootMessage:
         """
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import struct
-from typing import Callable, Optional
+from typing import Callable, Iterable, List, Optional
 
 from spinn_utilities.overrides import overrides
 
@@ -56,6 +56,41 @@ class EIEIOConnection(UDPConnection, Listenable[AbstractEIEIOMessage]):
             If one of the fields of the EIEIO message is invalid.
         """
         data = self.receive(timeout)
+        return self.__read_eieio_message(data)
+
+    def receive_eieio_messages(
+            self, timeout: Optional[float] = None) -> List[
+                AbstractEIEIOMessage]:
+        """
+        Receives all the EIEIO messages waiting on this connection, waiting
+        for one if there are none, with a single call to
+        :py:meth:`receive_many`.
+
+        .. note::
+            The data of each message is a view of a buffer that is reused
+            once the connection's ring of buffers wraps around, so read
+            the messages before receiving many more.
+
+        :param int timeout:
+            The time in seconds to wait for the first message to arrive; if
+            not specified, will wait forever, or until the connection is
+            closed
+        :return: the EIEIO messages, in the order they arrived
+        :rtype: list(AbstractEIEIOMessage)
+        :raise SpinnmanIOException:
+            If there is an error receiving the messages.
+        :raise SpinnmanTimeoutException:
+            If there is a timeout before a message is received.
+        :raise SpinnmanInvalidPacketException:
+            If a received packet is not a valid EIEIO message.
+        :raise SpinnmanInvalidParameterException:
+            If one of the fields of an EIEIO message is invalid.
+        """
+        return [self.__read_eieio_message(data)
+                for data in self.receive_many(timeout)]
+
+    @staticmethod
+    def __read_eieio_message(data) -> AbstractEIEIOMessage:
         header = _ONE_SHORT.unpack_from(data)[0]
         if header & 0xC000 == 0x4000:
             return read_eieio_command_message(data, 0)
@@ -72,6 +107,20 @@ class EIEIOConnection(UDPConnection, Listenable[AbstractEIEIOMessage]):
         """
         self.send(eieio_message.bytestring)
 
+    def send_eieio_messages(
+            self, eieio_messages: Iterable[AbstractEIEIOMessage]):
+        """
+        Sends several EIEIO messages down this connection, one after another
+        and as fast as possible; use a
+        :py:class:`~spinnman.connections.SendQueue` to limit the rate.
+
+        :param iterable(AbstractEIEIOMessage) eieio_messages:
+            The EIEIO messages to be sent
+        :raise SpinnmanIOException:
+            If there is an error sending a message
+        """
+        self.send_many(message.bytestring for message in eieio_messages)
+
     def send_eieio_message_to(
             self, eieio_message: AbstractEIEIOMessage,
             ip_address: str, port: int):
@@ -88,6 +137,11 @@ class EIEIOConnection(UDPConnection, Listenable[AbstractEIEIOMessage]):
             [], AbstractEIEIOMessage]:
         return self.receive_eieio_message
 
+    @overrides(Listenable.get_read_method)
+    def get_read_method(self) -> Optional[  # type: ignore[override]
+            Callable[[bytes], AbstractEIEIOMessage]]:
+        return self.__read_eieio_message
+
     def __repr__(self) -> str:
         return _REPR_TEMPLATE.format(
             self.local_ip_address, self.local_port,
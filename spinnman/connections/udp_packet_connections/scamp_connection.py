@@ -13,13 +13,16 @@
 # limitations under the License.
 
 import struct
-from typing import Optional, Tuple
+from typing import Optional, Tuple, TYPE_CHECKING
 from spinn_utilities.overrides import overrides
 from spinnman.constants import SCP_SCAMP_PORT
 from spinnman.messages.scp.enums import SCPResult
 from spinnman.connections.abstract_classes import AbstractSCPConnection
 from spinnman.messages.scp.abstract_messages import AbstractSCPRequest
 from .sdp_connection import SDPConnection
+if TYPE_CHECKING:
+    from spinnman.connections.window_controllers import (
+        AbstractSCPWindowController)
 
 _TWO_SHORTS = struct.Struct("<2H")
 _TWO_SKIP = struct.Struct("<2x")
@@ -29,7 +32,7 @@ class SCAMPConnection(SDPConnection, AbstractSCPConnection):
     """
     A UDP connection to SCAMP on the board.
     """
-    __slots__ = ()
+    __slots__ = ("_window_controller", )
 
     def __init__(
             self, chip_x: int = 255, chip_y: int = 255,
@@ -57,6 +60,7 @@ class SCAMPConnection(SDPConnection, AbstractSCPConnection):
             remote_port = SCP_SCAMP_PORT
         super().__init__(
             chip_x, chip_y, local_host, local_port, remote_host, remote_port)
+        self._window_controller: Optional["AbstractSCPWindowController"] = None
 
     @property
     @overrides(AbstractSCPConnection.chip_x)
@@ -68,6 +72,21 @@ class SCAMPConnection(SDPConnection, AbstractSCPConnection):
     def chip_y(self) -> int:
         return self._chip_y
 
+    @property
+    def window_controller(self) -> Optional["AbstractSCPWindowController"]:
+        """
+        The controller of the SCP window on this connection, or `None` if
+        requests use a fixed window.
+
+        :rtype: AbstractSCPWindowController or None
+        """
+        return self._window_controller
+
+    @window_controller.setter
+    def window_controller(
+            self, controller: Optional["AbstractSCPWindowController"]):
+        self._window_controller = controller
+
     def update_chip_coordinates(self, x: int, y: int):
         """
         Sets the coordinates without checking they are valid.
@@ -102,6 +121,32 @@ class SCAMPConnection(SDPConnection, AbstractSCPConnection):
         result, sequence = _TWO_SHORTS.unpack_from(data, 10)
         return SCPResult(result), sequence, data, 2
 
+    def receive_scp_response_into(
+            self, buffer: bytearray, timeout: Optional[float] = 1.0) -> Tuple[
+                SCPResult, int, memoryview, int]:
+        """
+        Receive an SCP response into an existing buffer, so that no memory
+        is allocated for the data.  The data returned is a view of the
+        buffer, so is only valid until the buffer is next used.
+
+        :param bytearray buffer:
+            Where to receive the response; must be large enough for any
+            response
+        :param int timeout:
+            The time to wait for the message to arrive; if `None`, will wait
+            forever, or 0 to return immediately
+        :return: The SCP result, the sequence number, the data of the
+            response and the offset at which the data starts (i.e., where the
+            SDP header starts).
+        :rtype: tuple(SCPResult, int, memoryview, int)
+        :raise SpinnmanTimeoutException:
+            If a timeout occurs before any data is received
+        :raise SpinnmanIOException: If an error occurs receiving the data
+        """
+        n_bytes = self.receive_into(buffer, timeout)
+        result, sequence = _TWO_SHORTS.unpack_from(buffer, 10)
+        return SCPResult(result), sequence, memoryview(buffer)[:n_bytes], 2
+
     def receive_scp_response_with_address(
             self, timeout: float = 1.0) -> Tuple[
                 SCPResult, int, bytes, int, str, int]:
@@ -82,6 +82,10 @@ class SDPConnection(UDPConnection, Listenable[SDPMessage]):
             If one of the fields of the SDP message is invalid
         """
         data = self.receive(timeout)
+        return self.__read_sdp_message(data)
+
+    @staticmethod
+    def __read_sdp_message(data: bytes) -> SDPMessage:
         return SDPMessage.from_bytestring(data, 2)
 
     def send_sdp_message(self, sdp_message: SDPMessage):
@@ -107,6 +111,11 @@ class SDPConnection(UDPConnection, Listenable[SDPMessage]):
             self) -> Callable[[], SDPMessage]:
         return self.receive_sdp_message
 
+    @overrides(Listenable.get_read_method)
+    def get_read_method(  # type: ignore[override]
+            self) -> Optional[Callable[[bytes], SDPMessage]]:
+        return self.__read_sdp_message
+
     def __repr__(self) -> str:
         return (
             f"SDPConnection(chip_x={self._chip_x}, chip_y={self._chip_y}, "
@@ -16,7 +16,7 @@ import logging
 import socket
 import select
 from contextlib import suppress
-from typing import Callable, Optional, Tuple
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.overrides import overrides
 from spinn_utilities.ping import Ping
@@ -25,7 +25,8 @@ from spinnman.connections.abstract_classes import Connection
 from spinnman.utilities.socket_utils import (
     bind_socket, connect_socket, get_udp_socket, get_socket_address,
     resolve_host, set_receive_buffer_size, receive_message,
-    receive_message_and_address, send_message, send_message_to_address)
+    receive_message_and_address, receive_message_into, receive_messages_into,
+    send_message, send_messages, send_message_to_address)
 from spinnman.connections.abstract_classes import Listenable
 
 logger = FormatAdapter(logging.getLogger(__name__))
@@ -33,6 +34,8 @@ _RECEIVE_BUFFER_SIZE = 1048576
 _PING_COUNT = 5
 _REPR_TEMPLATE = "UDPConnection(local={}:{}, remote={}:{})"
 _MSG_MAX = 300
+#: The number of messages that fit in the ring used by receive_many
+_RING_SLOTS = 256
 
 
 class UDPConnection(Connection, Listenable[bytes]):
@@ -54,6 +57,8 @@ class UDPConnection(Connection, Listenable[bytes]):
         "_local_port",
         "_remote_ip_address",
         "_remote_port",
+        "_ring",
+        "_ring_next",
         "_socket")
 
     def __init__(
@@ -110,6 +115,10 @@ class UDPConnection(Connection, Listenable[bytes]):
         # Set a general timeout on the socket
         self._socket.settimeout(1.0)
 
+        # The buffers for receive_many, made when first needed
+        self._ring: List[memoryview] = []
+        self._ring_next = 0
+
     @property
     def __is_closed(self) -> bool:
         """
@@ -200,6 +209,60 @@ class UDPConnection(Connection, Listenable[bytes]):
             raise SpinnmanEOFException()
         return receive_message(self._socket, timeout, _MSG_MAX)
 
+    def receive_into(
+            self, buffer: bytearray, timeout: Optional[float] = None) -> int:
+        """
+        Receive data from the connection into an existing buffer, without
+        allocating a new byte-string.
+
+        :param buffer: Where to write the data; a message larger than this
+            is truncated
+        :type buffer: bytearray or memoryview
+        :param float timeout: The timeout in seconds, or `None` to wait forever
+        :return: The number of bytes received
+        :rtype: int
+        :raise SpinnmanTimeoutException:
+            If a timeout occurs before any data is received
+        :raise SpinnmanIOException: If an error occurs receiving the data
+        """
+        if self.__is_closed:
+            raise SpinnmanEOFException()
+        return receive_message_into(self._socket, timeout, buffer)
+
+    def receive_many(self, timeout: Optional[float] = None) -> List[
+            memoryview]:
+        """
+        Receive all the messages waiting on the connection, waiting for one
+        if there are none.  The messages are received into a ring of
+        buffers owned by the connection, so no new byte-strings are made.
+
+        .. note::
+            Each message is a view of a buffer in the ring, which is reused
+            once the ring wraps around; copy any message that is needed
+            for longer than it takes to receive another 255 messages.
+
+        :param float timeout:
+            The timeout in seconds to wait for the first message, or `None`
+            to wait forever
+        :return: The messages received, in the order they arrived
+        :rtype: list(memoryview)
+        :raise SpinnmanTimeoutException:
+            If a timeout occurs before any data is received
+        :raise SpinnmanIOException: If an error occurs receiving the data
+        """
+        if self.__is_closed:
+            raise SpinnmanEOFException()
+        if not self._ring:
+            ring = memoryview(bytearray(_RING_SLOTS * _MSG_MAX))
+            self._ring = [
+                ring[i:i + _MSG_MAX]
+                for i in range(0, _RING_SLOTS * _MSG_MAX, _MSG_MAX)]
+        start = self._ring_next
+        buffers = self._ring[start:] + self._ring[:start]
+        sizes = receive_messages_into(self._socket, timeout, buffers)
+        self._ring_next = (start + len(sizes)) % _RING_SLOTS
+        return [buffer[:size] for buffer, size in zip(buffers, sizes)]
+
     def receive_with_address(self, timeout: Optional[float] = None) -> Tuple[
             bytes, Tuple[str, int]]:
         """
@@ -218,12 +281,12 @@ class UDPConnection(Connection, Listenable[bytes]):
             raise SpinnmanEOFException()
         return receive_message_and_address(self._socket, timeout, _MSG_MAX)
 
-    def send(self, data: bytes):
+    def send(self, data: Union[bytes, bytearray, memoryview]):
         """
         Send data down this connection.
 
         :param data: The data to be sent
-        :type data: bytes or bytearray
+        :type data: bytes or bytearray or memoryview
         :raise SpinnmanIOException: If there is an error sending the data
         """
         if self.__is_closed:
@@ -236,6 +299,23 @@ class UDPConnection(Connection, Listenable[bytes]):
             if self.__is_closed:
                 raise SpinnmanEOFException()
 
+    def send_many(self, datagrams: Iterable[bytes]) -> int:
+        """
+        Send several messages down this connection, one after another.
+
+        :param iterable(bytes) datagrams: The messages to be sent
+        :return: The number of messages sent
+        :rtype: int
+        :raise SpinnmanIOException: If there is an error sending the data
+        """
+        if self.__is_closed:
+            raise SpinnmanEOFException()
+        if not self._can_send:
+            raise SpinnmanIOException(
+                "Remote host and/or port not set - data cannot be sent with"
+                " this connection")
+        return send_messages(self._socket, datagrams)
+
     def send_to(self, data: bytes, address: Tuple[str, int]):
         """
         Send data down this connection.
@@ -265,6 +345,19 @@ class UDPConnection(Connection, Listenable[bytes]):
             return True
         return len(select.select([self._socket], [], [], timeout)[0]) == 1
 
+    def fileno(self) -> int:
+        """
+        Get the file descriptor of the underlying socket, so that the
+        connection can be waited on with :py:mod:`selectors` or registered
+        with an :py:mod:`asyncio` event loop.
+
+        :rtype: int
+        :raise SpinnmanEOFException: If the connection is closed
+        """
+        if self.__is_closed:
+            raise SpinnmanEOFException()
+        return self._socket.fileno()
+
     def __repr__(self) -> str:
         return _REPR_TEMPLATE.format(
             self.local_ip_address, self.local_port,
@@ -273,3 +366,7 @@ class UDPConnection(Connection, Listenable[bytes]):
     @overrides(Listenable.get_receive_method)
     def get_receive_method(self) -> Callable[[], bytes]:
         return self.receive
+
+    @overrides(Listenable.get_read_method)
+    def get_read_method(self) -> Optional[Callable[[bytes], bytes]]:
+        return bytes
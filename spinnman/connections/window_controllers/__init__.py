@@ -0,0 +1,23 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from .abstract_scp_window_controller import AbstractSCPWindowController
+from .aimd_scp_window_controller import AIMDSCPWindowController
+from .delay_scp_window_controller import DelaySCPWindowController
+from .fixed_scp_window_controller import FixedSCPWindowController
+from .rtt_estimator import RTTEstimator
+
+__all__ = [
+    "AbstractSCPWindowController", "AIMDSCPWindowController",
+    "DelaySCPWindowController", "FixedSCPWindowController", "RTTEstimator"]
@@ -0,0 +1,120 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from spinnman.constants import SCP_TIMEOUT
+from .rtt_estimator import RTTEstimator
+
+
+class AbstractSCPWindowController(object, metaclass=AbstractBase):
+    """
+    Decides how many SCP requests may be outstanding on a connection at
+    once.  A controller is kept with each connection, so what it learns
+    about the connection lasts between processes.
+
+    Not thread safe.
+    """
+    __slots__ = ("_n_responses", "_n_timeouts", "_rtt")
+
+    def __init__(self) -> None:
+        self._rtt = RTTEstimator(SCP_TIMEOUT)
+        self._n_responses = 0
+        self._n_timeouts = 0
+
+    @property
+    @abstractmethod
+    def window(self) -> int:
+        """
+        The number of requests that may currently be outstanding.
+
+        :rtype: int
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _on_response(self, rtt: Optional[float]) -> None:
+        """
+        Adjust the window after a response has been received.
+
+        :param rtt: The measured round trip time, or `None` if the request
+            was resent and so could not be measured
+        :type rtt: float or None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _on_timeout(self, sent_at: float) -> None:
+        """
+        Adjust the window after a timeout.
+
+        :param float sent_at: When the oldest request that timed out was
+            sent, as a :py:func:`time.monotonic` time
+        """
+        raise NotImplementedError
+
+    def on_response(self, rtt: Optional[float]) -> None:
+        """
+        Indicate that a response has been received.
+
+        :param rtt: The measured round trip time, or `None` if the request
+            was resent and so could not be measured
+        :type rtt: float or None
+        """
+        self._n_responses += 1
+        if rtt is not None:
+            self._rtt.add_sample(rtt)
+        self._on_response(rtt)
+
+    def on_timeout(self, sent_at: float) -> None:
+        """
+        Indicate that no response was received in time.
+
+        :param float sent_at: When the oldest request that timed out was
+            sent, as a :py:func:`time.monotonic` time
+        """
+        self._n_timeouts += 1
+        self._on_timeout(sent_at)
+
+    @property
+    def rtt(self) -> RTTEstimator:
+        """
+        The round trip time measured on the connection.
+
+        :rtype: RTTEstimator
+        """
+        return self._rtt
+
+    @property
+    def n_responses(self) -> int:
+        """
+        The number of responses received.
+
+        :rtype: int
+        """
+        return self._n_responses
+
+    @property
+    def n_timeouts(self) -> int:
+        """
+        The number of timeouts that occurred.
+
+        :rtype: int
+        """
+        return self._n_timeouts
+
+    def __str__(self) -> str:
+        return (f"{type(self).__name__}(window={self.window}, {self._rtt}, "
+                f"responses={self._n_responses}, "
+                f"timeouts={self._n_timeouts})")
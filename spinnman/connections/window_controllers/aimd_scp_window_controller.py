@@ -0,0 +1,69 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import Optional
+from spinn_utilities.overrides import overrides
+from .abstract_scp_window_controller import AbstractSCPWindowController
+
+
+class AIMDSCPWindowController(AbstractSCPWindowController):
+    """
+    A window that grows additively while responses arrive and shrinks
+    multiplicatively on a timeout, as in TCP congestion avoidance.  Timeouts
+    of requests sent before the window last shrank are part of the same loss,
+    so do not shrink it again.
+    """
+    __slots__ = (
+        "_decrease", "_increase", "_last_decrease", "_max_window",
+        "_min_window", "_size")
+
+    def __init__(self, initial_window: int = 8, min_window: int = 1,
+                 max_window: int = 64, increase: float = 1.0,
+                 decrease: float = 0.5):
+        """
+        :param int initial_window: The window size to start with
+        :param int min_window: The smallest the window can become
+        :param int max_window: The largest the window can become
+        :param float increase:
+            How much the window grows for each window of responses
+        :param float decrease:
+            The factor by which the window is multiplied on a timeout
+        """
+        super().__init__()
+        self._size = float(initial_window)
+        self._min_window = min_window
+        self._max_window = max_window
+        self._increase = increase
+        self._decrease = decrease
+        self._last_decrease = float("-inf")
+
+    @property
+    @overrides(AbstractSCPWindowController.window)
+    def window(self) -> int:
+        return int(self._size)
+
+    @overrides(AbstractSCPWindowController._on_response)
+    def _on_response(self, rtt: Optional[float]) -> None:
+        self._size = min(
+            float(self._max_window),
+            self._size + self._increase / self._size)
+
+    @overrides(AbstractSCPWindowController._on_timeout)
+    def _on_timeout(self, sent_at: float) -> None:
+        if sent_at <= self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self._size = max(
+            float(self._min_window), self._size * self._decrease)
@@ -0,0 +1,75 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+from spinn_utilities.overrides import overrides
+from .aimd_scp_window_controller import AIMDSCPWindowController
+
+
+class DelaySCPWindowController(AIMDSCPWindowController):
+    """
+    A window sized from the measured round trip time, as in TCP Vegas.
+    The growth in the round trip time over the smallest seen estimates how
+    many requests are queued on the way; the window grows by one per
+    window of responses while this is below `alpha` and shrinks by one
+    while it is above `beta`.  Timeouts still halve the window.
+    """
+    __slots__ = ("_alpha", "_base_rtt", "_beta", "_since_adjust")
+
+    def __init__(self, initial_window: int = 8, min_window: int = 1,
+                 max_window: int = 64, alpha: float = 2.0,
+                 beta: float = 4.0):
+        """
+        :param int initial_window: The window size to start with
+        :param int min_window: The smallest the window can become
+        :param int max_window: The largest the window can become
+        :param float alpha:
+            The number of queued requests below which the window grows
+        :param float beta:
+            The number of queued requests above which the window shrinks
+        """
+        super().__init__(initial_window, min_window, max_window)
+        self._alpha = alpha
+        self._beta = beta
+        self._base_rtt: Optional[float] = None
+        self._since_adjust = 0
+
+    @property
+    def base_rtt(self) -> Optional[float]:
+        """
+        The smallest round trip time measured, or `None` if nothing has been
+        measured.
+
+        :rtype: float or None
+        """
+        return self._base_rtt
+
+    @overrides(AIMDSCPWindowController._on_response)
+    def _on_response(self, rtt: Optional[float]) -> None:
+        if rtt is None:
+            return
+        if self._base_rtt is None or rtt < self._base_rtt:
+            self._base_rtt = rtt
+        self._since_adjust += 1
+        if self._since_adjust < self.window:
+            return
+        self._since_adjust = 0
+        srtt = self._rtt.srtt
+        if not srtt:
+            return
+        queued = self._size * (1.0 - self._base_rtt / srtt)
+        if queued < self._alpha:
+            self._size = min(float(self._max_window), self._size + 1)
+        elif queued > self._beta:
+            self._size = max(float(self._min_window), self._size - 1)
@@ -0,0 +1,45 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+from spinn_utilities.overrides import overrides
+from .abstract_scp_window_controller import AbstractSCPWindowController
+
+
+class FixedSCPWindowController(AbstractSCPWindowController):
+    """
+    A window that never changes size.  Round trip times are still measured,
+    and only the oldest requests are resent on a timeout.
+    """
+    __slots__ = ("_window", )
+
+    def __init__(self, window: int = 8):
+        """
+        :param int window: The number of requests that may be outstanding
+        """
+        super().__init__()
+        self._window = window
+
+    @property
+    @overrides(AbstractSCPWindowController.window)
+    def window(self) -> int:
+        return self._window
+
+    @overrides(AbstractSCPWindowController._on_response)
+    def _on_response(self, rtt: Optional[float]) -> None:
+        pass
+
+    @overrides(AbstractSCPWindowController._on_timeout)
+    def _on_timeout(self, sent_at: float) -> None:
+        pass
@@ -0,0 +1,120 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+
+#: The smallest retransmit timeout that will be used, in seconds
+MIN_RTO = 0.1
+
+
+class RTTEstimator(object):
+    """
+    Estimates the round trip time of a connection and the retransmit timeout
+    to use, from measured round trips, using the algorithm of Jacobson and
+    Karels (as in RFC 6298).
+
+    Samples must only be taken from requests that were not resent, as
+    it is not possible to tell which send a response belongs to.
+
+    Not thread safe.
+    """
+    __slots__ = (
+        "_max_rto", "_min_rto", "_n_samples", "_rto", "_rttvar", "_srtt")
+
+    #: The gain applied to the smoothed round trip time
+    _ALPHA = 1 / 8
+    #: The gain applied to the round trip time variation
+    _BETA = 1 / 4
+
+    def __init__(self, initial_rto: float, min_rto: float = MIN_RTO,
+                 max_rto: Optional[float] = None):
+        """
+        :param float initial_rto:
+            The retransmit timeout to use before anything has been measured
+        :param float min_rto: The smallest retransmit timeout to use
+        :param max_rto:
+            The largest retransmit timeout to use, or `None` for the initial
+            retransmit timeout
+        :type max_rto: float or None
+        """
+        self._max_rto = initial_rto if max_rto is None else max_rto
+        self._min_rto = min(min_rto, self._max_rto)
+        self._rto = initial_rto
+        self._srtt: Optional[float] = None
+        self._rttvar = 0.0
+        self._n_samples = 0
+
+    def add_sample(self, rtt: float) -> None:
+        """
+        Update the estimates with a measured round trip time.
+
+        :param float rtt: The time between sending a request and receiving
+            its response, in seconds
+        """
+        if self._srtt is None:
+            self._srtt = rtt
+            self._rttvar = rtt / 2
+        else:
+            self._rttvar += self._BETA * (abs(self._srtt - rtt) - self._rttvar)
+            self._srtt += self._ALPHA * (rtt - self._srtt)
+        self._n_samples += 1
+        self._rto = min(self._max_rto, max(
+            self._min_rto, self._srtt + 4 * self._rttvar))
+
+    def back_off(self) -> None:
+        """
+        Double the retransmit timeout after a timeout, up to the maximum.
+        """
+        self._rto = min(self._max_rto, self._rto * 2)
+
+    @property
+    def srtt(self) -> Optional[float]:
+        """
+        The smoothed round trip time, or `None` if nothing has been measured.
+
+        :rtype: float or None
+        """
+        return self._srtt
+
+    @property
+    def rttvar(self) -> float:
+        """
+        The variation in the round trip time.
+
+        :rtype: float
+        """
+        return self._rttvar
+
+    @property
+    def rto(self) -> float:
+        """
+        The retransmit timeout to use, in seconds.
+
+        :rtype: float
+        """
+        return self._rto
+
+    @property
+    def n_samples(self) -> int:
+        """
+        The number of round trip times measured.
+
+        :rtype: int
+        """
+        return self._n_samples
+
+    def __str__(self) -> str:
+        srtt = "unknown" if self._srtt is None else f"{self._srtt:.6f}s"
+        return (f"srtt={srtt}, rttvar={self._rttvar:.6f}s, "
+                f"rto={self._rto:.6f}s, samples={self._n_samples}")
@@ -238,10 +238,8 @@ class ExtendedTransceiver(object, metaclass=AbstractBase):
             The binaries to be executed and the cores to execute them on
         :param int app_id: The app_id to give this application
         """
-        # Execute each of the binaries and get them in to a "wait" state
-        for binary in executable_targets.binaries:
-            core_subsets = executable_targets.get_cores_for_binary(binary)
-            self.execute_flood(core_subsets, binary, app_id, wait=True)
+        # Execute all the binaries and get them in to a "wait" state
+        self.execute_binaries(executable_targets, app_id, wait=True)
 
         # Sleep to allow cores to get going
         time.sleep(0.5)
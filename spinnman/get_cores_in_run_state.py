@@ -37,9 +37,10 @@ def get_cores_in_run_state(txrx, app_id, print_all_chips):
     :param int app_id:
     :param bool print_all_chips:
     """
-    count_finished = txrx.get_core_state_count(app_id, CPUState.FINISHED)
-    count_run = txrx.get_core_state_count(app_id, CPUState.RUNNING)
-    print(f'running: {count_run} finished: {count_finished}')
+    counts = txrx.get_core_state_counts(
+        app_id, (CPUState.RUNNING, CPUState.FINISHED))
+    print(f'running: {counts[CPUState.RUNNING]} '
+          f'finished: {counts[CPUState.FINISHED]}')
 
     machine = txrx.get_machine_details()
     print(f'machine width: {machine.width} height: {machine.height}')
@@ -60,14 +61,14 @@ def get_cores_in_run_state(txrx, app_id, print_all_chips):
     cores_running = cpu_infos.infos_for_state(CPUState.RUNNING)
     cores_watchdog = cpu_infos.infos_for_state(CPUState.WATCHDOG)
 
-    for (x, y, p), _ in cores_running:
+    for x, y, p in cores_running:
         if p not in IGNORED_IDS:
             print(f'run core: {x} {y} {p}')
 
-    for (x, y, p), _ in cores_finished:
+    for x, y, p in cores_finished:
         print(f'finished core: {x} {y} {p}')
 
-    for (x, y, p), _ in cores_watchdog:
+    for x, y, p in cores_watchdog:
         print(f'watchdog core: {x} {y} {p}')
 
 
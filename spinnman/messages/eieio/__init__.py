@@ -16,7 +16,9 @@ from .eieio_message import AbstractEIEIOMessage
 from .eieio_prefix import EIEIOPrefix
 from .eieio_type import EIEIOType
 from .create_eieio_command import read_eieio_command_message
-from .create_eieio_data import read_eieio_data_message
+from .create_eieio_data import (
+    read_eieio_data_arrays, read_eieio_data_message)
 
 __all__ = ["EIEIOPrefix", "EIEIOType", "read_eieio_command_message",
-           "read_eieio_data_message", "AbstractEIEIOMessage"]
+           "read_eieio_data_arrays", "read_eieio_data_message",
+           "AbstractEIEIOMessage"]
@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Iterable, Optional, Tuple
+import numpy
+from numpy import uint32
+from spinnman.exceptions import SpinnmanInvalidPacketException
 from spinnman.messages.eieio.data_messages import (
     EIEIODataMessage, EIEIODataHeader)
 
@@ -30,3 +34,40 @@ def read_eieio_data_message(data, offset):
     eieio_header = EIEIODataHeader.from_bytestring(data, offset)
     offset += eieio_header.size
     return EIEIODataMessage(eieio_header, data, offset)
+
+
+def read_eieio_data_arrays(datagrams: Iterable[bytes]) -> Tuple[
+        numpy.ndarray, Optional[numpy.ndarray]]:
+    """
+    Reads the elements of several EIEIO data messages, as arrays of the
+    keys and payloads of all of them in order.
+
+    :param iterable(bytes) datagrams:
+        data messages received from the network, each as a byte-string
+    :return: The keys, and the payloads or `None` if the elements do not
+        have payloads
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray or None)
+    :raise SpinnmanInvalidPacketException:
+        If a message is not valid, or if only some of the messages have
+        payloads
+    """
+    all_keys = list()
+    all_payloads = list()
+    n_without_payloads = 0
+    for data in datagrams:
+        keys, payloads = read_eieio_data_message(
+            data, 0).read_keys_and_payloads()
+        all_keys.append(keys)
+        if payloads is None:
+            n_without_payloads += len(keys)
+        else:
+            all_payloads.append(payloads)
+    if not all_keys:
+        return numpy.zeros(0, dtype=uint32), None
+    if not all_payloads:
+        return numpy.concatenate(all_keys), None
+    if n_without_payloads:
+        raise SpinnmanInvalidPacketException(
+            "EIEIODataMessage",
+            "only some of the messages have payloads")
+    return numpy.concatenate(all_keys), numpy.concatenate(all_payloads)
@@ -13,7 +13,9 @@
 # limitations under the License.
 
 import struct
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+import numpy
+from numpy import uint32
 from spinn_utilities.overrides import overrides
 from spinnman.exceptions import (
     SpinnmanInvalidPacketException, SpinnmanInvalidParameterException)
@@ -30,6 +32,14 @@ _TWO_SHORTS = struct.Struct("<HH")
 _ONE_WORD = struct.Struct("<I")
 _TWO_WORDS = struct.Struct("<II")
 
+#: The type of each field of the elements of each type of message
+_FIELD_DTYPES: Dict[EIEIOType, numpy.dtype] = {
+    EIEIOType.KEY_16_BIT: numpy.dtype("<u2"),
+    EIEIOType.KEY_32_BIT: numpy.dtype("<u4"),
+    EIEIOType.KEY_PAYLOAD_16_BIT: numpy.dtype("<u2"),
+    EIEIOType.KEY_PAYLOAD_32_BIT: numpy.dtype("<u4")}
+_HALF_WORD_MAX = 0xFFFF
+
 
 class EIEIODataMessage(AbstractEIEIOMessage):
     """
@@ -52,7 +62,7 @@ class EIEIODataMessage(AbstractEIEIOMessage):
         self._header = eieio_header
 
         # Elements to be written
-        self._elements = b""
+        self._elements = bytearray()
 
         # Keeping track of the reading of the data
         self._data = data
@@ -88,6 +98,139 @@ class EIEIODataMessage(AbstractEIEIOMessage):
                 is_time=timestamp is not None),
             data=data, offset=offset)
 
+    @staticmethod
+    def create_from_arrays(
+            keys, payloads=None, *, eieio_type=None, key_prefix=None,
+            payload_prefix=None, timestamp=None,
+            prefix_type=EIEIOPrefix.LOWER_HALF_WORD) -> List[
+                'EIEIODataMessage']:
+        """
+        Create as many data messages as are needed to send arrays of keys
+        and payloads.
+
+        If the type is not given, the smallest type that can hold the keys
+        and payloads is used; if the keys are too big for 16 bits but all
+        have the same upper half-word, and no key prefix is given, that
+        half-word is sent as the key prefix.
+
+        :param keys: The keys to send
+        :type keys: ~numpy.ndarray or list(int)
+        :param payloads: The payloads to send with the keys, if any
+        :type payloads: ~numpy.ndarray or list(int) or None
+        :param eieio_type: The type of the messages, or `None` to choose
+        :type eieio_type: EIEIOType or None
+        :param int key_prefix: The prefix of the keys
+        :param int payload_prefix: The prefix of the payload
+        :param int timestamp: The timestamp of the packets
+        :param EIEIOPrefix prefix_type:
+            The type of the key prefix if 16-bits
+        :return: The messages, each as full as it can be, or an empty list
+            if there are no keys
+        :rtype: list(EIEIODataMessage)
+        :raise SpinnmanInvalidParameterException:
+            If the keys or payloads are too big for the type, or if there
+            are payloads when the type does not have them or the other way
+            around
+        """
+        # pylint: disable=too-many-arguments
+        keys = numpy.asarray(keys, dtype=numpy.int64).ravel()
+        if payloads is not None:
+            payloads = numpy.asarray(payloads, dtype=numpy.int64).ravel()
+            if len(payloads) != len(keys):
+                raise SpinnmanInvalidParameterException(
+                    "payloads", str(len(payloads)),
+                    f"There must be one payload for each of {len(keys)} keys")
+        if not len(keys):
+            return []
+        payload_base = payload_prefix
+        if timestamp is not None:
+            payload_base = timestamp
+
+        if eieio_type is None:
+            # No type can send values that are too big for 32 bits
+            EIEIODataMessage.__check_range(
+                keys, payloads, EIEIOType.KEY_32_BIT.max_value)
+            eieio_type, chosen_prefix = EIEIODataMessage.__choose_type(
+                keys, payloads, key_prefix, payload_base)
+            if chosen_prefix is not None:
+                key_prefix = chosen_prefix
+                prefix_type = EIEIOPrefix.UPPER_HALF_WORD
+                keys = keys & _HALF_WORD_MAX
+
+        # Check the values
+        if (payloads is not None) != bool(eieio_type.payload_bytes):
+            raise SpinnmanInvalidParameterException(
+                "payloads", str(payloads is not None),
+                f"Payloads must be given exactly when {eieio_type} has them")
+        EIEIODataMessage.__check_range(keys, payloads, eieio_type.max_value)
+
+        # Pack all the elements into one buffer and cut it into messages
+        dtype = _FIELD_DTYPES[eieio_type]
+        fields = numpy.empty(
+            (len(keys), 1 if payloads is None else 2), dtype=dtype)
+        fields[:, 0] = keys
+        if payloads is not None:
+            fields[:, 1] = payloads
+        element_bytes = fields.dtype.itemsize * fields.shape[1]
+        header_size = EIEIODataHeader.get_header_size(
+            eieio_type, key_prefix is not None, payload_base is not None)
+        max_n_elements = (UDP_MESSAGE_MAX_SIZE - header_size) // element_bytes
+        packed = fields.tobytes()
+
+        messages = list()
+        for start in range(0, len(keys), max_n_elements):
+            count = min(len(keys) - start, max_n_elements)
+            message = EIEIODataMessage(EIEIODataHeader(
+                eieio_type, count=count, prefix=key_prefix,
+                payload_base=payload_base, prefix_type=prefix_type,
+                is_time=timestamp is not None))
+            message._elements = bytearray(packed[
+                start * element_bytes:(start + count) * element_bytes])
+            messages.append(message)
+        return messages
+
+    @staticmethod
+    def __check_range(keys, payloads, max_value):
+        """
+        Check that the keys and payloads are between 0 and a maximum value.
+
+        :raise SpinnmanInvalidParameterException: If any are not
+        """
+        for name, values in (("key", keys), ("payload", payloads)):
+            if values is not None and len(values) and (
+                    values.min() < 0 or values.max() > max_value):
+                raise SpinnmanInvalidParameterException(
+                    name, str(values.max() if values.min() >= 0
+                              else values.min()),
+                    f"Outside the allowed range of 0 to {max_value}")
+
+    @staticmethod
+    def __choose_type(keys, payloads, key_prefix, payload_base):
+        """
+        Choose the type to send the elements in as few bytes as possible,
+        and the upper half-word of the keys to send as a prefix if needed.
+
+        :rtype: tuple(EIEIOType, int or None)
+        """
+        fits_16 = (payload_base is None or payload_base <= _HALF_WORD_MAX) \
+            and (payloads is None or not len(payloads) or
+                 payloads.max() <= _HALF_WORD_MAX)
+        upper_prefix = None
+        if fits_16 and len(keys) and keys.max() > _HALF_WORD_MAX:
+            upper = keys >> 16
+            if key_prefix is None and (upper == upper[0]).all():
+                upper_prefix = int(upper[0])
+            else:
+                fits_16 = False
+        if payloads is None:
+            eieio_type = (
+                EIEIOType.KEY_16_BIT if fits_16 else EIEIOType.KEY_32_BIT)
+        else:
+            eieio_type = (
+                EIEIOType.KEY_PAYLOAD_16_BIT if fits_16
+                else EIEIOType.KEY_PAYLOAD_32_BIT)
+        return eieio_type, upper_prefix
+
     @property
     @overrides(AbstractEIEIOMessage.eieio_header)
     def eieio_header(self) -> EIEIODataHeader:
@@ -267,6 +410,53 @@ class EIEIODataMessage(AbstractEIEIOMessage):
             return KeyDataElement(key)
         return KeyPayloadDataElement(key, payload, self._header.is_time)
 
+    def read_keys_and_payloads(self) -> Tuple[
+            numpy.ndarray, Optional[numpy.ndarray]]:
+        """
+        Read all the elements not yet read, as arrays of keys and payloads,
+        with the prefix and payload base applied as by
+        :py:attr:`next_element`.
+
+        :return: The keys, and the payloads or `None` if the elements do not
+            have payloads
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray or None)
+        :raise SpinnmanInvalidPacketException:
+            If the message is too short for its count of elements
+        """
+        if self._data is None:
+            return numpy.zeros(0, dtype=uint32), None
+        eieio_type = self._header.eieio_type
+        n_elements = self._header.count - self._elements_read
+        n_fields = 2 if eieio_type.payload_bytes else 1
+        dtype = _FIELD_DTYPES[eieio_type]
+        try:
+            fields = numpy.frombuffer(
+                self._data, dtype=dtype, count=n_elements * n_fields,
+                offset=self._offset).reshape(n_elements, n_fields)
+        except ValueError as e:
+            raise SpinnmanInvalidPacketException(
+                "EIEIODataMessage",
+                f"too short for {n_elements} elements") from e
+        self._elements_read = self._header.count
+        self._offset += n_elements * n_fields * dtype.itemsize
+
+        keys = fields[:, 0].astype(uint32)
+        if self._header.prefix is not None:
+            if self._header.prefix_type == EIEIOPrefix.UPPER_HALF_WORD:
+                keys |= uint32(self._header.prefix << 16)
+            else:
+                keys |= uint32(self._header.prefix)
+
+        payloads: Optional[numpy.ndarray] = None
+        if n_fields == 2:
+            payloads = fields[:, 1].astype(uint32)
+            if self._header.payload_base is not None:
+                payloads |= uint32(self._header.payload_base)
+        elif self._header.payload_base is not None:
+            payloads = numpy.full(
+                n_elements, self._header.payload_base, dtype=uint32)
+        return keys, payloads
+
     @property
     @overrides(AbstractEIEIOMessage.bytestring)
     def bytestring(self) -> bytes:
@@ -23,11 +23,12 @@ class GetChipInfoResponse(AbstractSCPResponse):
     """
     An SCP response to a request for the version of software running.
     """
-    __slots__ = "_chip_info",
+    __slots__ = "_chip_info", "_data"
 
     def __init__(self) -> None:
         super().__init__()
         self._chip_info: Optional[ChipSummaryInfo] = None
+        self._data = b""
 
     @overrides(AbstractSCPResponse.read_data_bytestring)
     def read_data_bytestring(self, data: bytes, offset: int):
@@ -38,6 +39,7 @@ class GetChipInfoResponse(AbstractSCPResponse):
         self._chip_info = ChipSummaryInfo(
             data, offset, self.sdp_header.source_chip_x,
             self.sdp_header.source_chip_y,)
+        self._data = bytes(data[offset:])
 
     @property
     def chip_info(self) -> ChipSummaryInfo:
@@ -48,3 +50,13 @@ class GetChipInfoResponse(AbstractSCPResponse):
         """
         assert self._chip_info is not None
         return self._chip_info
+
+    @property
+    def data(self) -> bytes:
+        """
+        The chip information as received, from which it can be read again
+        with :py:class:`ChipSummaryInfo`.
+
+        :rtype: bytes
+        """
+        return self._data
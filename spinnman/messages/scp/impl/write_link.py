@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Union
 from spinn_utilities.overrides import overrides
 from spinn_utilities.typing.coords import XYP
 from spinnman.messages.scp import SCPRequestHeader
@@ -28,7 +29,8 @@ class WriteLink(AbstractSCPRequest[CheckOKResponse]):
     __slots__ = "_data_to_write",
 
     def __init__(
-            self, coordinates: XYP, link: int, base_address: int, data: bytes):
+            self, coordinates: XYP, link: int, base_address: int,
+            data: Union[bytes, bytearray, memoryview]):
         """
         :param tuple(int,int,int) coordinates:
             The coordinates of the core of the chip whose neighbour will be
@@ -37,7 +39,8 @@ class WriteLink(AbstractSCPRequest[CheckOKResponse]):
         :param int link: The link number to write to between 0 and 5
             (or if a BMP, the FPGA between 0 and 2)
         :param int base_address: The base_address to start writing to
-        :param bytes data: Up to 256 bytes of data to write
+        :param data: Up to 256 bytes of data to write
+        :type data: bytearray or bytes or memoryview
         """
         # pylint: disable=too-many-arguments
         x, y, cpu = coordinates
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Union
 from spinn_utilities.overrides import overrides
 from spinn_utilities.typing.coords import XYP
 from spinnman.constants import address_length_dtype
@@ -28,7 +29,8 @@ class WriteMemory(AbstractSCPRequest[CheckOKResponse]):
     """
     __slots__ = "_data_to_write",
 
-    def __init__(self, coordinates: XYP, base_address: int, data: bytes):
+    def __init__(self, coordinates: XYP, base_address: int,
+                 data: Union[bytes, bytearray, memoryview]):
         """
         :param tuple(int,int,int) coordinates:
             The coordinates of the chip, X and Y between 0 and 255, and P
@@ -39,7 +41,7 @@ class WriteMemory(AbstractSCPRequest[CheckOKResponse]):
             the base address is not checked to see if its not valid
         :param data: between 1 and 256 bytes of data to write;
             this is not checked due to speed restrictions
-        :type data: bytearray or bytes
+        :type data: bytearray or bytes or memoryview
         """
         size = len(data)
         x, y, cpu = coordinates
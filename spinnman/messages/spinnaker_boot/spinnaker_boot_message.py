@@ -13,11 +13,12 @@
 # limitations under the License.
 
 import struct
-from typing import Optional
+from typing import Optional, Union
 from spinnman.exceptions import SpinnmanInvalidParameterException
 from .spinnaker_boot_op_code import SpinnakerBootOpCode
 
-_PATTERN_HIIII = struct.Struct(">HIIII")
+#: The header of a boot message: the version, opcode and three operands
+BOOT_MESSAGE_HEADER = struct.Struct(">HIIII")
 _PATTERN_2xIIII = struct.Struct("2xIIII")
 BOOT_MESSAGE_VERSION = 1
 
@@ -36,14 +37,15 @@ class SpinnakerBootMessage(object):
 
     def __init__(self, opcode: SpinnakerBootOpCode,
                  operand_1: int, operand_2: int, operand_3: int,
-                 data: Optional[bytes] = None, offset: int = 0):
+                 data: Optional[Union[bytes, memoryview]] = None,
+                 offset: int = 0):
         """
         :param SpinnakerBootOpCode opcode: The operation of this packet
         :param int operand_1: The first operand
         :param int operand_2: The second operand
         :param int operand_3: The third operand
         :param data: The optional data, up to 256 words
-        :type data: bytes or bytearray
+        :type data: bytes or bytearray or memoryview
         :param int offset: The offset of the valid data
         :raise SpinnmanInvalidParameterException:
             If the opcode is not a valid value
@@ -98,11 +100,11 @@ class SpinnakerBootMessage(object):
         return self._operand_3
 
     @property
-    def data(self) -> Optional[bytes]:
+    def data(self) -> Optional[Union[bytes, memoryview]]:
         """
         The data, or `None` if no data.
 
-        :rtype: bytes or bytearray
+        :rtype: bytes or bytearray or memoryview
         """
         return self._data
 
@@ -113,10 +115,10 @@ class SpinnakerBootMessage(object):
 
         :rtype: bytes
         """
-        data = b""
+        data: Union[bytes, memoryview] = b""
         if self._data is not None:
             data = self._data[self._offset:]
-        return _PATTERN_HIIII.pack(
+        return BOOT_MESSAGE_HEADER.pack(
             BOOT_MESSAGE_VERSION, self._opcode.value,
             self._operand_1, self._operand_2, self._operand_3) + data
 
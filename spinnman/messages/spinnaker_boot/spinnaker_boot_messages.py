@@ -13,17 +13,19 @@
 # limitations under the License.
 
 import array
+from functools import lru_cache
 import math
 import os
 import time
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from spinnman.data import SpiNNManDataView
 from spinnman.exceptions import SpinnmanIOException
 
 from .system_variable_boot_values import (
     SystemVariableBootValues, SystemVariableDefinition)
-from .spinnaker_boot_message import SpinnakerBootMessage
+from .spinnaker_boot_message import (
+    BOOT_MESSAGE_HEADER, BOOT_MESSAGE_VERSION, SpinnakerBootMessage)
 from .spinnaker_boot_op_code import SpinnakerBootOpCode
 
 _BOOT_MESSAGE_DATA_WORDS = 256
@@ -38,11 +40,14 @@ _BOOT_DATA_OPERAND_1 = ((_BOOT_MESSAGE_DATA_BYTES // 4) - 1) << 8
 class SpinnakerBootMessages(object):
     """
     A set of boot messages to be sent to boot the board.
+
+    The boot image is read and assembled into packets only once per process;
+    each set of messages copies those packets and replaces just the system
+    variables in them.
     """
     __slots__ = (
-        "_boot_data",
-        "_n_bytes_to_read",
-        "_no_data_packets")
+        "_packet_bounds",
+        "_packets")
 
     def __init__(self, extra_boot_values: Optional[Dict[
             SystemVariableDefinition, Any]] = None):
@@ -79,31 +84,70 @@ class SpinnakerBootMessages(object):
             for variable, value in extra_boot_values.items():
                 spinnaker_boot_value.set_value(variable, value)
 
-        # Get the data as an array, to be used later
-        spinnaker_boot_data = array.array("I", spinnaker_boot_value.bytestring)
+        # Get the data as an array, byte swapped as for the rest of the image
+        spinnaker_boot_data = array.array(
+            "I", spinnaker_boot_value.bytestring)
+        spinnaker_boot_data.byteswap()
 
-        # Find the data file and size
-        boot_data_file, boot_data_size = self._get_boot_image_file()
+        # Copy the shared packets and replace the custom boot options
+        template, self._packet_bounds, replace_offset = \
+            self._get_packet_template()
+        self._packets = bytearray(template)
+        length = _BOOT_STRUCT_REPLACE_LENGTH * 4
+        self._packets[replace_offset:replace_offset + length] = \
+            spinnaker_boot_data.tobytes()[:length]
 
-        # Compute how many packets to send
-        n_words_to_read = boot_data_size // 4
-        self._no_data_packets = int(math.ceil(
-            float(boot_data_size) / _BOOT_MESSAGE_DATA_BYTES))
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_packet_template() -> Tuple[
+            bytes, Tuple[Tuple[int, int], ...], int]:
+        """
+        Read the boot image and assemble it into the boot packets, laid out
+        one after another.  This is only done once, as the image does not
+        change.
 
-        # Read the data
+        :return: The packets, the start and end of each packet within them,
+            and where the system variables are within them
+        :rtype: tuple(bytes, tuple(tuple(int,int), ...), int)
+        """
+        # Find the data file and size
+        boot_data_file, boot_data_size = \
+            SpinnakerBootMessages._get_boot_image_file()
+
+        # Read the data and byte swap it
         boot_data = array.array("I")
         with open(boot_data_file, "rb") as f:
-            boot_data.fromfile(f, n_words_to_read)
-
-        # Replace the appropriate part with the custom boot options
-        offset = _BOOT_STRUCT_REPLACE_OFFSET
-        length = _BOOT_STRUCT_REPLACE_LENGTH
-        boot_data[offset:offset + length] = spinnaker_boot_data[0:length]
-
-        # Byte swap and store the data for later use
+            boot_data.fromfile(f, boot_data_size // 4)
         boot_data.byteswap()
-        self._boot_data = boot_data.tobytes()
-        self._n_bytes_to_read = n_words_to_read * 4
+        image = boot_data.tobytes()
+        n_data_packets = int(math.ceil(
+            float(boot_data_size) / _BOOT_MESSAGE_DATA_BYTES))
+
+        packets = bytearray()
+        bounds: List[Tuple[int, int]] = list()
+
+        def add_packet(opcode, operand_1, operand_3, data=b""):
+            start = len(packets)
+            packets.extend(BOOT_MESSAGE_HEADER.pack(
+                BOOT_MESSAGE_VERSION, opcode.value, operand_1, 0, operand_3))
+            packets.extend(data)
+            bounds.append((start, len(packets)))
+
+        add_packet(SpinnakerBootOpCode.FLOOD_FILL_START, 0,
+                   n_data_packets - 1)
+        for block_id in range(n_data_packets):
+            offset = block_id * _BOOT_MESSAGE_DATA_BYTES
+            add_packet(
+                SpinnakerBootOpCode.FLOOD_FILL_BLOCK,
+                _BOOT_DATA_OPERAND_1 | (block_id & 0xFF), 0,
+                image[offset:offset + _BOOT_MESSAGE_DATA_BYTES])
+        add_packet(SpinnakerBootOpCode.FLOOD_FILL_CONTROL, 1, 0)
+
+        # The system variables are in the data of the first block
+        replace_offset = (
+            bounds[1][0] + BOOT_MESSAGE_HEADER.size +
+            _BOOT_STRUCT_REPLACE_OFFSET * 4)
+        return bytes(packets), tuple(bounds), replace_offset
 
     @staticmethod
     def _get_boot_image_file() -> Tuple[str, int]:
@@ -123,16 +167,17 @@ class SpinnakerBootMessages(object):
                 "must be divisible by 4")
         return file_name, file_size
 
-    def _get_packet_data(self, block_id: int) -> bytes:
+    @property
+    def packets(self) -> Iterable[memoryview]:
         """
-        Read a packet of data.
+        The encoded messages to be sent, as views of a single buffer that
+        should not be changed.
 
-        :param int block_id:
-        :rtype: bytes
+        :rtype: iterable(memoryview)
         """
-        offset = block_id * _BOOT_MESSAGE_DATA_BYTES
-        n_bytes = min(self._n_bytes_to_read - offset, _BOOT_MESSAGE_DATA_BYTES)
-        return self._boot_data[offset:offset + n_bytes]
+        view = memoryview(self._packets)
+        for start, end in self._packet_bounds:
+            yield view[start:end]
 
     @property
     def messages(self) -> Iterable[SpinnakerBootMessage]:
@@ -141,20 +186,10 @@ class SpinnakerBootMessages(object):
 
         :rtype: iterable(SpinnakerBootMessage)
         """
-        # Construct and yield the start packet
-        yield SpinnakerBootMessage(
-            opcode=SpinnakerBootOpCode.FLOOD_FILL_START,
-            operand_1=0, operand_2=0, operand_3=self._no_data_packets - 1)
-
-        # Construct and yield the data packets
-        for block_id in range(0, self._no_data_packets):
-            operand_1 = _BOOT_DATA_OPERAND_1 | (block_id & 0xFF)
+        for packet in self.packets:
+            _, opcode, operand_1, operand_2, operand_3 = \
+                BOOT_MESSAGE_HEADER.unpack_from(packet)
+            data = packet[BOOT_MESSAGE_HEADER.size:]
             yield SpinnakerBootMessage(
-                opcode=SpinnakerBootOpCode.FLOOD_FILL_BLOCK,
-                operand_1=operand_1, operand_2=0, operand_3=0,
-                data=self._get_packet_data(block_id))
-
-        # Construct and yield the end packet
-        yield SpinnakerBootMessage(
-            opcode=SpinnakerBootOpCode.FLOOD_FILL_CONTROL,
-            operand_1=1, operand_2=0, operand_3=0)
+                SpinnakerBootOpCode(opcode), operand_1, operand_2, operand_3,
+                data if len(data) else None)
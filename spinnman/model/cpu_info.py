@@ -53,6 +53,7 @@ class CPUInfo(object):
         "__application_mailbox_command",
         "__app_mailbox",
         "__application_name",
+        "__cpu_data",
         "__iobuf_address",
         "__link_register",
         "__monitor_mailbox_command",
@@ -80,6 +81,7 @@ class CPUInfo(object):
         """
         # pylint: disable=too-many-arguments
         self.__x, self.__y, self.__p = x, y, p
+        self.__cpu_data = cpu_data
 
         (registers,  # 32s 0
          self.__processor_state_register, self.__stack_pointer,
@@ -341,6 +343,15 @@ class CPUInfo(object):
         """
         return self.__software_version
 
+    @property
+    def vcpu_data(self) -> bytes:
+        """
+        The `vcpu_t` that this information was made from.
+
+        :rtype: bytes
+        """
+        return _VCPU_PATTERN.pack(*self.__cpu_data)
+
     def __str__(self) -> str:
         return (f"{self.x}:{self.y}:{self.p:02n} ({self.physical_cpu_id:02n}) "
                 f"{self.__state.name:18} {self.__application_name:16s} "
@@ -12,21 +12,49 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, Iterable, Iterator
+from array import array
+from typing import Dict, Iterable, Iterator, Optional, cast
+import numpy
+from numpy import uint8, uint32
 from spinn_utilities.typing.coords import XYP
 from spinnman.model.enums import CPUState
-from .cpu_info import CPUInfo
+from .cpu_info import CPUInfo, CPU_INFO_BYTES, _vcpu_t, _VCPU_PATTERN
+
+#: The shifts of the x and y coordinates in the key of a core
+_X_SHIFT = 16
+_Y_SHIFT = 8
+_COORD_MASK = 0xFF
+#: The offsets of fields in a `vcpu_t`
+_PHYSICAL_CPU_OFFSET = 45
+_STATE_OFFSET = 46
+_APP_ID_OFFSET = 47
 
 
 class CPUInfos(object):
     """
     A set of CPU information objects.
+
+    The `vcpu_t` of each core is kept as raw bytes in one array, so
+    filtering and counting are done on the whole array at once, and a
+    :py:class:`CPUInfo` is only made when one is asked for.
     """
     __slots__ = [
-        "_cpu_infos"]
+        "_data",
+        "_keys",
+        "_new_data",
+        "_new_keys",
+        "_sorter"]
 
     def __init__(self) -> None:
-        self._cpu_infos: Dict[XYP, CPUInfo] = dict()
+        # The key of each core, and its vcpu_t, in the order first added
+        self._keys: numpy.ndarray = numpy.zeros(0, dtype=uint32)
+        self._data: numpy.ndarray = numpy.zeros(
+            (0, CPU_INFO_BYTES), dtype=uint8)
+        # Cores added since the arrays were last made
+        self._new_keys = array("I")
+        self._new_data = bytearray()
+        # The order that sorts the keys, if worked out
+        self._sorter: Optional[numpy.ndarray] = None
 
     def add_info(self, cpu_info: CPUInfo):
         """
@@ -34,7 +62,80 @@ class CPUInfos(object):
 
         :param ~spinnman.model.CPUInfo cpu_info:
         """
-        self._cpu_infos[cpu_info.x, cpu_info.y, cpu_info.p] = cpu_info
+        self.add_vcpu_data(
+            cpu_info.x, cpu_info.y, cpu_info.p, cpu_info.vcpu_data)
+
+    def add_vcpu_data(self, x: int, y: int, p: int, vcpu_data: bytes):
+        """
+        Add the info of a core from the `vcpu_t` read from the machine.
+
+        :param int x: The x-coordinate of the chip
+        :param int y: The y-coordinate of the chip
+        :param int p: The ID of the core on the chip
+        :param bytes vcpu_data: The `vcpu_t` of the core
+        """
+        self._new_keys.append((x << _X_SHIFT) | (y << _Y_SHIFT) | p)
+        self._new_data += vcpu_data[:CPU_INFO_BYTES]
+
+    def __merge(self):
+        """
+        Add the cores added since the arrays were last made to the arrays.
+        """
+        if not self._new_keys:
+            return
+        keys = numpy.concatenate((
+            self._keys, numpy.frombuffer(self._new_keys, dtype=uint32)))
+        data = numpy.concatenate((
+            self._data, numpy.frombuffer(self._new_data, dtype=uint8).reshape(
+                -1, CPU_INFO_BYTES)))
+        self._new_keys = array("I")
+        self._new_data = bytearray()
+        self.__set(keys, data)
+
+    def __set(self, keys: numpy.ndarray, data: numpy.ndarray):
+        """
+        Set the arrays, keeping each core where it was first added but with
+        the info last added for it.
+        """
+        unique, first = numpy.unique(keys, return_index=True)
+        if len(unique) != len(keys):
+            _, last_reversed = numpy.unique(keys[::-1], return_index=True)
+            last = len(keys) - 1 - last_reversed
+            order = numpy.argsort(first)
+            keys = unique[order]
+            data = data[last[order]]
+        self._keys = keys
+        self._data = data
+        self._sorter = None
+
+    def __select(self, mask: numpy.ndarray) -> 'CPUInfos':
+        """
+        Make a new CPUInfos with the cores where the mask is True.
+        """
+        selected = CPUInfos()
+        selected._keys = self._keys[mask]
+        selected._data = self._data[mask]
+        return selected
+
+    def __index(self, x: int, y: int, p: int) -> Optional[int]:
+        """
+        Find where a core is in the arrays.
+        """
+        self.__merge()
+        if self._sorter is None:
+            self._sorter = numpy.argsort(self._keys)
+        key = (x << _X_SHIFT) | (y << _Y_SHIFT) | p
+        pos = int(numpy.searchsorted(self._keys, key, sorter=self._sorter))
+        if pos < len(self._keys) and self._keys[self._sorter[pos]] == key:
+            return int(self._sorter[pos])
+        return None
+
+    def __info(self, index: int) -> CPUInfo:
+        key = int(self._keys[index])
+        return CPUInfo(
+            key >> _X_SHIFT, (key >> _Y_SHIFT) & _COORD_MASK,
+            key & _COORD_MASK,
+            cast(_vcpu_t, _VCPU_PATTERN.unpack(self._data[index].tobytes())))
 
     def add_infos(self, other, states: Iterable[CPUState]):
         """
@@ -47,34 +148,62 @@ class CPUInfos(object):
         :param list(CPUState) states:
             Only add if the Info has this state
         """
-        # pylint: disable=protected-access
         assert isinstance(other, CPUInfos)
-        for info in other._cpu_infos.values():
-            if info.state in states:
-                self.add_info(info)
+        to_add = other.infos_in_states(states)
+        self.__merge()
+        self.__set(numpy.concatenate((self._keys, to_add._keys)),
+                   numpy.concatenate((self._data, to_add._data)))
 
     def __iter__(self) -> Iterator[XYP]:
-        return iter(self._cpu_infos)
+        self.__merge()
+        return zip((self._keys >> _X_SHIFT).tolist(),
+                   ((self._keys >> _Y_SHIFT) & _COORD_MASK).tolist(),
+                   (self._keys & _COORD_MASK).tolist())
 
     def __len__(self) -> int:
         """
         The total number of processors that are in these core subsets.
         """
-        return len(self._cpu_infos)
+        self.__merge()
+        return len(self._keys)
 
     def is_core(self, x: int, y: int, p: int) -> bool:
         """
         Determine if there is a CPU Info for x, y, p.
         """
-        return (x, y, p) in self._cpu_infos
+        return self.__index(x, y, p) is not None
 
     def get_cpu_info(self, x: int, y: int, p: int) -> CPUInfo:
         """
         Get the information for the given core on the given core
 
         :rtype: CpuInfo
+        :raises KeyError: If there is no information for the core
+        """
+        index = self.__index(x, y, p)
+        if index is None:
+            raise KeyError((x, y, p))
+        return self.__info(index)
+
+    @property
+    def states(self) -> numpy.ndarray:
+        """
+        The value of the state of each core, in the order of iteration.
+
+        :rtype: ~numpy.ndarray
+        """
+        self.__merge()
+        return self._data[:, _STATE_OFFSET]
+
+    @property
+    def app_ids(self) -> numpy.ndarray:
+        """
+        The application ID of each core, in the order of iteration.
+
+        :rtype: ~numpy.ndarray
         """
-        return self._cpu_infos[x, y, p]
+        self.__merge()
+        return self._data[:, _APP_ID_OFFSET]
 
     def infos_for_state(self, state: CPUState) -> 'CPUInfos':
         """
@@ -84,11 +213,19 @@ class CPUInfos(object):
         :return: New Infos object with the filtered infos if any
         :rtype: CPUInfos
         """
-        for_state = CPUInfos()
-        for info in self._cpu_infos.values():
-            if info.state == state:
-                for_state.add_info(info)
-        return for_state
+        return self.__select(self.states == state.value)
+
+    def infos_in_states(self, states: Iterable[CPUState]) -> 'CPUInfos':
+        """
+        Creates a new CpuInfos object with Just the Infos that have one of
+        the states.
+
+        :param iterable(~spinnman.model.enums.CPUState) states:
+        :return: New Infos object with the filtered infos if any
+        :rtype: CPUInfos
+        """
+        return self.__select(numpy.isin(
+            self.states, [state.value for state in states]))
 
     def infos_not_in_states(self, states: Iterable[CPUState]) -> 'CPUInfos':
         """
@@ -98,11 +235,41 @@ class CPUInfos(object):
         :return: New Infos object with the filtered infos if any
         :rtype: CPUInfos
         """
-        for_state = CPUInfos()
-        for info in self._cpu_infos.values():
-            if info.state not in states:
-                for_state.add_info(info)
-        return for_state
+        return self.__select(~numpy.isin(
+            self.states, [state.value for state in states]))
+
+    def infos_for_app_id(self, app_id: int) -> 'CPUInfos':
+        """
+        Creates a new CpuInfos object with Just the Infos of cores running
+        the application.
+
+        :param int app_id:
+        :return: New Infos object with the filtered infos if any
+        :rtype: CPUInfos
+        """
+        return self.__select(self.app_ids == app_id)
+
+    def count_states(self) -> Dict[CPUState, int]:
+        """
+        Count the cores in each state.
+
+        :return: The number of cores in each state that any core is in
+        :rtype: dict(~spinnman.model.enums.CPUState, int)
+        """
+        values, counts = numpy.unique(self.states, return_counts=True)
+        return {CPUState(int(value)): int(count)
+                for value, count in zip(values, counts)}
+
+    def group_by_state(self) -> Dict[CPUState, 'CPUInfos']:
+        """
+        Split the infos by the state of the cores.
+
+        :return: The infos of the cores in each state that any core is in
+        :rtype: dict(~spinnman.model.enums.CPUState, CPUInfos)
+        """
+        states = self.states
+        return {CPUState(int(value)): self.__select(states == value)
+                for value in numpy.unique(states)}
 
     def get_status_string(self) -> str:
         """
@@ -110,14 +277,15 @@ class CPUInfos(object):
 
         :rtype: str
         """
-        break_down = ""
-        for core_info in self._cpu_infos.values():
-            break_down += core_info.get_status_string()
-        return break_down
+        self.__merge()
+        return "".join(self.__info(index).get_status_string()
+                       for index in range(len(self._keys)))
 
     def __str__(self) -> str:
-        return str([f"{x}, {y}, {p} (ph: {info.physical_cpu_id})"
-                    for (x, y, p), info in self._cpu_infos.items()])
+        self.__merge()
+        physical = self._data[:, _PHYSICAL_CPU_OFFSET].tolist()
+        return str([f"{x}, {y}, {p} (ph: {phys})"
+                    for (x, y, p), phys in zip(self, physical)])
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -12,11 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import struct
-from typing import Dict, List, Tuple
+from typing import Iterator, List, Tuple
+import numpy
 from spinnman.model.enums import P2PTableRoute
 
-_ONE_WORD = struct.Struct("<I")
+#: The number of routes packed into each word of the table
+_ROUTES_PER_WORD = 8
+#: The shift of each route in a word
+_ROUTE_SHIFTS = numpy.arange(_ROUTES_PER_WORD, dtype=numpy.uint32) * 3
+_NONE = P2PTableRoute.NONE.value
+#: A word of the table with no routes
+_NONE_WORD = sum(_NONE << (3 * i) for i in range(_ROUTES_PER_WORD))
 
 
 class P2PTable(object):
@@ -25,6 +31,7 @@ class P2PTable(object):
     """
     __slots__ = [
         "_height",
+        "_n_routes",
         "_routes",
         "_width"]
 
@@ -35,20 +42,19 @@ class P2PTable(object):
         :param int height:
         :param list(tuple(bytes,int)) column_data:
         """
-        self._routes: Dict[Tuple[int, int], P2PTableRoute] = dict()
         self._width = width
         self._height = height
+        n_words = -(-height // _ROUTES_PER_WORD)
+        words = numpy.full((width, n_words), _NONE_WORD, dtype="<u4")
         for x, (data, offset) in enumerate(column_data):
-            y = 0
-            pos = 0
-            while y < height:
-                next_word, = _ONE_WORD.unpack_from(data, offset + (pos * 4))
-                pos += 1
-                for entry in range(min(8, height - y)):
-                    route = P2PTableRoute((next_word >> (3 * entry)) & 0b111)
-                    if route is not P2PTableRoute.NONE:
-                        self._routes[x, y] = route
-                    y += 1
+            words[x] = numpy.frombuffer(
+                data, dtype="<u4", count=n_words, offset=offset)
+
+        # The route to each chip, indexed by [x, y]
+        self._routes = (
+            (words[:, :, None] >> _ROUTE_SHIFTS) & 0b111).astype(
+                numpy.uint8).reshape(width, -1)[:, :height]
+        self._n_routes = int(numpy.count_nonzero(self._routes != _NONE))
 
     @staticmethod
     def get_n_column_bytes(height: int) -> int:
@@ -87,15 +93,26 @@ class P2PTable(object):
         """
         return self._height
 
-    def iterchips(self):
+    @property
+    def routes(self) -> numpy.ndarray:
+        """
+        The value of the route to each chip, indexed by ``[x, y]``; chips
+        without a route have the value of :py:attr:`P2PTableRoute.NONE`.
+
+        :rtype: ~numpy.ndarray
+        """
+        return self._routes
+
+    def iterchips(self) -> Iterator[Tuple[int, int]]:
         """
         Get an iterator of tuples of (x, y) coordinates in the table.
 
         :rtype: iterable(tuple(int,int))
         """
-        return iter(self._routes.keys())
+        xs, ys = numpy.nonzero(self._routes != _NONE)
+        return zip(xs.tolist(), ys.tolist())
 
-    def is_route(self, x, y):
+    def is_route(self, x: int, y: int) -> bool:
         """
         Determines if there is a route in the P2P table to the given chip.
 
@@ -103,9 +120,8 @@ class P2PTable(object):
         :param int y: The y-coordinate of the chip to look up
         :rtype: bool
         """
-        return (
-            (x, y) in self._routes and
-            self._routes[(x, y)] != P2PTableRoute.NONE)
+        return (0 <= x < self._width and 0 <= y < self._height and
+                int(self._routes[x, y]) != _NONE)
 
     def get_route(self, x: int, y: int) -> P2PTableRoute:
         """
@@ -115,12 +131,14 @@ class P2PTable(object):
         :param int y: The y-coordinate of the chip to find the route to
         :rtype: P2PTableRoute
         """
-        return self._routes.get((x, y), P2PTableRoute.NONE)
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return P2PTableRoute.NONE
+        return P2PTableRoute(int(self._routes[x, y]))
 
     @property
-    def n_routes(self):
+    def n_routes(self) -> int:
         """ The number of routes in the table
 
         :rtype: int
         """
-        return len(self._routes)
+        return self._n_routes
@@ -17,9 +17,12 @@ from .abstract_multi_connection_process_connection_selector import (
     ConnectionSelector)
 from .application_copy_run_process import ApplicationCopyRunProcess
 from .application_run_process import ApplicationRunProcess
+from .check_connections_process import CheckConnectionsProcess
 
 from .fixed_connection_selector import FixedConnectionSelector
+from .follow_iobuf_process import FollowIOBufProcess
 from .get_heap_process import GetHeapProcess
+from .get_ip_addresses_process import GetIPAddressesProcess
 from .get_cpu_info_process import GetCPUInfoProcess
 from .get_exclude_cpu_info_process import GetExcludeCPUInfoProcess
 from .get_include_cpu_info_process import GetIncludeCPUInfoProcess
@@ -51,9 +54,10 @@ __all__ = ["AbstractMultiConnectionProcessConnectionSelector",
            "RoundRobinConnectionSelector",
            "AbstractMultiConnectionProcess",
            "ApplicationRunProcess", "ApplicationCopyRunProcess",
+           "CheckConnectionsProcess", "FollowIOBufProcess",
            "GetCPUInfoProcess",
            "GetExcludeCPUInfoProcess", "GetIncludeCPUInfoProcess",
-           "GetHeapProcess",
+           "GetHeapProcess", "GetIPAddressesProcess",
            "GetMachineProcess", "GetMultiCastRoutesProcess",
            "GetNCoresInStateProcess", "GetTagsProcess",
            "GetVersionProcess", "LoadFixedRouteRoutingEntryProcess",
@@ -13,21 +13,29 @@
 # limitations under the License.
 
 import contextlib
+import io
 import logging
+import selectors
 import sys
+import time
 from types import TracebackType
 from typing import (
     Callable, Dict, Generator, Generic, List, Optional, TypeVar, cast, Set)
 
 from typing_extensions import Self, TypeAlias
 
+from spinn_utilities.config_holder import get_config_str_or_none
 from spinn_utilities.log import FormatAdapter
 
 from spinnman.connections import SCPRequestPipeLine
+from spinnman.connections.window_controllers import (
+    AbstractSCPWindowController, AIMDSCPWindowController,
+    DelaySCPWindowController, FixedSCPWindowController)
 from spinnman.connections.udp_packet_connections import SCAMPConnection
 from spinnman.constants import SCP_TIMEOUT, N_RETRIES
 from spinnman.exceptions import (
-    SpinnmanGenericProcessException, SpinnmanGroupedProcessException)
+    SpinnmanGenericProcessException, SpinnmanGroupedProcessException,
+    SpinnmanInvalidParameterException)
 from spinnman.messages.scp.abstract_messages import (
     AbstractSCPRequest, AbstractSCPResponse)
 from spinnman.messages.scp.enums.scp_result import SCPResult
@@ -45,6 +53,31 @@ ECB: TypeAlias = Callable[
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
+#: The default number of channels used by processes
+DEFAULT_N_CHANNELS = 8
+
+
+def _create_window_controller(
+        n_channels: int) -> Optional[AbstractSCPWindowController]:
+    """
+    Create the window controller configured for SCP connections.
+
+    :param int n_channels: The window size to start with
+    :rtype: AbstractSCPWindowController or None
+    """
+    name = get_config_str_or_none("Machine", "scp_window_controller")
+    if name is None:
+        return None
+    if name == "fixed":
+        return FixedSCPWindowController(n_channels)
+    if name == "aimd":
+        return AIMDSCPWindowController(n_channels)
+    if name == "delay":
+        return DelaySCPWindowController(n_channels)
+    raise SpinnmanInvalidParameterException(
+        "[Machine]scp_window_controller", name,
+        "Must be None, fixed, aimd or delay")
+
 
 class AbstractMultiConnectionProcess(Generic[R]):
     """
@@ -57,17 +90,22 @@ class AbstractMultiConnectionProcess(Generic[R]):
         "_tracebacks",
         "_connections",
         "_intermediate_channel_waits",
+        "_multiplex",
         "_n_channels",
         "_n_retries",
         "_non_fail_retry_codes",
         "_conn_selector",
+        "_reuse_receive_buffers",
         "_scp_request_pipelines",
+        "_selector",
         "_timeout")
 
     def __init__(self, next_connection_selector: ConnectionSelector,
                  n_retries: int = N_RETRIES, timeout: float = SCP_TIMEOUT,
-                 n_channels: int = 8, intermediate_channel_waits: int = 7,
-                 non_fail_retry_codes: Optional[Set[SCPResult]] = None):
+                 n_channels: int = DEFAULT_N_CHANNELS,
+                 intermediate_channel_waits: int = DEFAULT_N_CHANNELS - 1,
+                 non_fail_retry_codes: Optional[Set[SCPResult]] = None,
+                 reuse_receive_buffers: bool = False):
         """
         :param ConnectionSelector next_connection_selector:
             How to choose the connection.
@@ -78,13 +116,21 @@ class AbstractMultiConnectionProcess(Generic[R]):
             The timeout, in seconds. Passed to :py:class:`SCPRequestPipeLine`
         :param int n_channels:
             The maximum number of channels to use when talking to a particular
-            SCAMP instance. Passed to :py:class:`SCPRequestPipeLine`
+            SCAMP instance. Passed to :py:class:`SCPRequestPipeLine`.
+            If the ``[Machine]scp_window_controller`` option is set, the
+            window of each connection is instead adapted by its controller,
+            unless this is less than the default.
         :param int intermediate_channel_waits:
             The maximum number of outstanding message/reply pairs to have on a
             particular connection. Passed to :py:class:`SCPRequestPipeLine`
         :param Optional[Set[SCPResult]] non_fail_retry_codes:
             Optional set of responses that result in retry but after retrying
             don't then result in failure even if returned on the last call.
+        :param bool reuse_receive_buffers:
+            Whether each connection receives every response into the same
+            buffer. Only for processes whose callbacks copy what they need
+            from a response before returning or sending another request.
+            Passed to :py:class:`SCPRequestPipeLine`
         """
         self._exceptions: List[Exception] = []
         self._tracebacks: List[TracebackType] = []
@@ -98,6 +144,10 @@ class AbstractMultiConnectionProcess(Generic[R]):
         self._intermediate_channel_waits = intermediate_channel_waits
         self._conn_selector = next_connection_selector
         self._non_fail_retry_codes = non_fail_retry_codes
+        self._reuse_receive_buffers = reuse_receive_buffers
+        self._selector: Optional[selectors.BaseSelector] = None
+        # Whether all connections can be waited on together
+        self._multiplex = True
 
     def _send_request(self, request: AbstractSCPRequest[R],
                       callback: Optional[Callable[[R], None]] = None,
@@ -111,9 +161,77 @@ class AbstractMultiConnectionProcess(Generic[R]):
                 packet_timeout=self._timeout,
                 n_channels=self._n_channels,
                 intermediate_channel_waits=self._intermediate_channel_waits,
-                non_fail_retry_codes=self._non_fail_retry_codes)
-        self._scp_request_pipelines[connection].send_request(
-            request, callback, error_callback)
+                non_fail_retry_codes=self._non_fail_retry_codes,
+                window_controller=self.__get_window_controller(connection),
+                reuse_receive_buffer=(
+                    self._reuse_receive_buffers and
+                    isinstance(connection, SCAMPConnection)))
+            try:
+                connection.fileno()
+            except io.UnsupportedOperation:
+                self._multiplex = False
+        pipeline = self._scp_request_pipelines[connection]
+
+        # With several connections, wait for a free channel on this one while
+        # also handling the responses arriving on all the others
+        if self.__is_multiplexed():
+            while pipeline.is_full:
+                self._process_responses()
+        pipeline.send_request(request, callback, error_callback)
+
+    def __get_window_controller(
+            self, connection: SCAMPConnection) -> Optional[
+                AbstractSCPWindowController]:
+        # Processes that need a smaller window than usual keep it fixed, as
+        # do connections to BMPs
+        if (self._n_channels < DEFAULT_N_CHANNELS or
+                not isinstance(connection, SCAMPConnection)):
+            return None
+        if connection.window_controller is None:
+            connection.window_controller = _create_window_controller(
+                self._n_channels)
+        return connection.window_controller
+
+    def _process_responses(self) -> bool:
+        """
+        Wait for responses on all connections with outstanding requests at
+        once, handling whatever arrives and any timeouts that occur.
+        If any connection cannot be waited on in this way (such as a proxied
+        connection), waits on one connection at a time instead.
+
+        :return: Whether there were any outstanding requests to wait for
+        :rtype: bool
+        """
+        active = [
+            pipeline for pipeline in self._scp_request_pipelines.values()
+            if pipeline.n_in_progress]
+        if not active:
+            return False
+        if not self._multiplex:
+            active[0].receive_response()
+            return True
+        selector = self.__get_selector()
+        now = time.monotonic()
+        wait = min(pipeline.time_until_timeout(now) for pipeline in active)
+        for key, _ in selector.select(max(wait, 0.0)):
+            key.data.receive_ready_responses()
+        now = time.monotonic()
+        for pipeline in active:
+            pipeline.check_for_timeout(now)
+        return True
+
+    def __is_multiplexed(self) -> bool:
+        return self._multiplex and len(self._scp_request_pipelines) > 1
+
+    def __get_selector(self) -> selectors.BaseSelector:
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+        registered = self._selector.get_map()
+        for pipeline in self._scp_request_pipelines.values():
+            if pipeline.fileno() not in registered:
+                self._selector.register(
+                    pipeline.fileno(), selectors.EVENT_READ, pipeline)
+        return self._selector
 
     def _receive_error(
             self, request: AbstractSCPRequest[R], exception: Exception,
@@ -132,8 +250,17 @@ class AbstractMultiConnectionProcess(Generic[R]):
         return bool(self._exceptions)
 
     def _finish(self) -> None:
-        for request_pipeline in self._scp_request_pipelines.values():
-            request_pipeline.finish()
+        if self.__is_multiplexed():
+            try:
+                while self._process_responses():
+                    pass
+            finally:
+                if self._selector is not None:
+                    self._selector.close()
+                    self._selector = None
+        else:
+            for request_pipeline in self._scp_request_pipelines.values():
+                request_pipeline.finish()
 
     @contextlib.contextmanager
     def _collect_responses(
@@ -157,8 +284,7 @@ class AbstractMultiConnectionProcess(Generic[R]):
             Whether to check for errors; if not, caller must handle
         """
         yield self
-        for request_pipeline in self._scp_request_pipelines.values():
-            request_pipeline.finish()
+        self._finish()
         if check_error and self._exceptions:
             self.check_for_error(print_exception=print_exception)
 
@@ -12,12 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import defaultdict
-from typing import cast, Iterable, List, Mapping, Tuple
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Callable, cast, Deque, Dict, List, Mapping, Optional, Sequence, Set,
+    Tuple)
+from spinn_utilities.typing.coords import XY
 from spinn_machine import Chip, CoreSubsets, Link, Machine
+from spinnman.constants import UDP_MESSAGE_MAX_SIZE
 from spinnman.data import SpiNNManDataView
-from spinnman.messages.scp.impl import AppCopyRun
+from spinnman.messages.scp.impl import AppCopyRun, ApplicationRun, WriteMemory
 from spinnman.processes import ConnectionSelector
+from spinnman.utilities.word_checksum import WordChecksum
 from .abstract_multi_connection_process import AbstractMultiConnectionProcess
 
 APP_COPY_RUN_TIMEOUT = 6.0
@@ -28,43 +35,6 @@ def _on_same_board(chip_1: Chip, chip_2: Chip):
             chip_1.nearest_ethernet_y == chip_2.nearest_ethernet_y)
 
 
-def _get_next_chips(
-        chips_done: Mapping[Tuple[int, int], List[Tuple[int, int]]],
-        parent_chips: Mapping[Tuple[int, int], List[Chip]],
-        machine: Machine) -> Iterable[Chip]:
-    """
-    Get the chips that are adjacent to the last set of chips, which
-    haven't yet been loaded.  Also returned are the links for each chip,
-    which gives the link which should be read from to get the data.
-
-    :param dict((int,int),list(int,int)) chips_done:
-        The coordinates of chips that have already been done by Ethernet
-    :param dict((int, int),~spinn_machine.Chip) parent_chips:
-        A dictionary of chip coordinates to chips that use that chip as a
-        parent
-    :return: A list of next chips to use
-    :rtype: list(chip)
-    """
-    next_chips: List[Chip] = list()
-    for eth_chip in chips_done:
-        off_board_copy_done = False
-        for c_x, c_y in chips_done[eth_chip]:
-            chip_xy = machine[c_x, c_y]
-            for chip in parent_chips[c_x, c_y]:
-                on_same_board = _on_same_board(chip, chip_xy)
-                eth = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
-                if (eth not in chips_done or
-                        chip not in chips_done[eth]):
-                    if on_same_board or not off_board_copy_done:
-                        next_chips.append(chip)
-                        if not on_same_board:
-                            off_board_copy_done = True
-                        # Only do one copy from each chip at a time
-                        break
-
-    return next_chips
-
-
 def _compute_parent_chips(
         machine: Machine) -> Mapping[Tuple[int, int], List[Chip]]:
     """
@@ -82,6 +52,20 @@ def _compute_parent_chips(
     return chip_links
 
 
+@dataclass
+class _Binary(object):
+    """
+    A binary being loaded, and the chips that it must be copied to.
+    """
+    #: The data to write to the boot chip, or None if it is already there
+    data: Optional[bytes]
+    size: int
+    checksum: int
+    core_subsets: CoreSubsets
+    #: The number of writes to the boot chip still to be acknowledged
+    n_writes: int = 0
+
+
 class ApplicationCopyRunProcess(AbstractMultiConnectionProcess):
     """
     Process to start a binary on a subset of cores on a subset of chips
@@ -92,16 +76,63 @@ class ApplicationCopyRunProcess(AbstractMultiConnectionProcess):
     ensures that if all commands are successful, the full binary has been
     copied and started.
 
+    The copies follow the tree of parent links from the boot chip, and
+    each chip starts copying to its children as soon as it has the binary.
+    Each chip only serves one copy at a time, and each board only one copy
+    to another board.  Only chips with a core to run the binary on, or
+    with such a chip below them in the tree, are copied to.
+
+    Several binaries can be loaded one after another; each chip takes the
+    next binary from its parent once all of its own children have the
+    current one, so the binaries follow each other down the tree.
+
     .. note::
-        The binary must have been loaded to the boot chip before this is
-        called!
+        The binary given to :py:meth:`run` must have been loaded to the boot
+        chip before this is called!
     """
-    __slots__ = ()
+    __slots__ = (
+        "_address",
+        "_app_id",
+        "_binaries",
+        "_boot_xy",
+        "_children",
+        "_held",
+        "_in_flight",
+        "_n_waiting",
+        "_needed",
+        "_next_root_binary",
+        "_off_board_busy",
+        "_off_board_blocked",
+        "_parents",
+        "_serving",
+        "_to_send",
+        "_wait")
 
     def __init__(self, next_connection_selector: ConnectionSelector,
                  timeout: float = APP_COPY_RUN_TIMEOUT):
         AbstractMultiConnectionProcess.__init__(
             self, next_connection_selector, timeout=timeout)
+        self._address = 0
+        self._app_id = 0
+        self._wait = False
+        self._binaries: List[_Binary] = list()
+        self._boot_xy: XY = (0, 0)
+        self._children: Mapping[XY, List[Chip]] = dict()
+        self._parents: Dict[XY, Chip] = dict()
+        # The binaries each chip still needs, in order
+        self._needed: Dict[XY, Deque[int]] = dict()
+        # The binary each chip has, if any
+        self._held: Dict[XY, int] = dict()
+        # The number of children of each chip still to copy what it has
+        self._n_waiting: Dict[XY, int] = defaultdict(int)
+        # The chips being copied to, and the chips being copied from
+        self._in_flight: Set[XY] = set()
+        self._serving: Set[XY] = set()
+        # The boards copying to another board, and the chips waiting on them
+        self._off_board_busy: Set[XY] = set()
+        self._off_board_blocked: Dict[XY, Set[XY]] = defaultdict(set)
+        self._next_root_binary = 0
+        self._to_send: Deque[Callable[[], None]] = deque()
 
     def run(self, size: int, app_id: int, core_subsets: CoreSubsets,
             checksum: int, wait: bool):
@@ -115,23 +146,226 @@ class ApplicationCopyRunProcess(AbstractMultiConnectionProcess):
         :param bool wait:
             Whether to put the binary in "wait" mode or run it straight away
         """
+        self.__load(
+            [_Binary(None, size, checksum, core_subsets)], 0, app_id, wait)
+
+    def load_and_run(
+            self, binaries: Sequence[Tuple[bytes, CoreSubsets]],
+            address: int, app_id: int, wait: bool):
+        """
+        Load several binaries one after another, writing each to the boot
+        chip and copying it on from there.  A binary is written to the boot
+        chip as soon as the chips next to it have copied the one before, so
+        the copies of all the binaries overlap.
+
+        :param list(tuple(bytes,CoreSubsets)) binaries:
+            The data of each binary, and the cores to run it on
+        :param int address:
+            Where on the boot chip the binaries are written; this must be
+            where the copy command copies from
+        :param int app_id: The application id to assign to the binaries
+        :param bool wait:
+            Whether to put the binaries in "wait" mode or run them straight
+            away
+        """
+        loads = list()
+        for data, core_subsets in binaries:
+            checksum = WordChecksum()
+            checksum.update(data)
+            loads.append(_Binary(
+                data, len(data), checksum.value, core_subsets))
+        self.__load(loads, address, app_id, wait)
+
+    def __load(self, binaries: List[_Binary], address: int, app_id: int,
+               wait: bool):
         machine = SpiNNManDataView.get_machine()
         boot_chip = machine.boot_chip
-        chips_done: Mapping[Tuple[int, int], List[Tuple[int, int]]] = \
-            defaultdict(list)
-        chips_done[boot_chip].append((boot_chip))
-        parent_chips = _compute_parent_chips(machine)
-        next_chips = _get_next_chips(chips_done, parent_chips, machine)
-
-        while next_chips:
-            # Do all the chips at the current level
-            for chip in next_chips:
-                subset = core_subsets.get_core_subset_for_chip(chip.x, chip.y)
-                self._send_request(AppCopyRun(
-                    chip.x, chip.y, cast(int, chip.parent_link), size, app_id,
-                    subset.processor_ids, checksum, wait))
-                eth = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
-                chips_done[eth].append(chip)
-            self._finish()
-            self.check_for_error()
-            next_chips = _get_next_chips(chips_done, parent_chips, machine)
+        self._address = address
+        self._app_id = app_id
+        self._wait = wait
+        self._binaries = binaries
+        self._boot_xy = (boot_chip.x, boot_chip.y)
+        self._children = _compute_parent_chips(machine)
+        self._parents = {
+            (child.x, child.y): machine[parent_xy]
+            for parent_xy, children in self._children.items()
+            for child in children}
+        self.__compute_needed()
+
+        if binaries[0].data is None:
+            # The first binary is already on the boot chip
+            self._next_root_binary = 1
+            self.__root_has(0)
+        else:
+            self._next_root_binary = 0
+            self.__write_next_to_root()
+
+        with self._collect_responses():
+            while True:
+                while self._to_send:
+                    self._to_send.popleft()()
+                if not self._process_responses():
+                    break
+
+    def __compute_needed(self) -> None:
+        """
+        Work out which binaries each chip needs, which is those that run on
+        the chip or on any chip below it in the tree.
+        """
+        # Order the chips so that each comes after its parent
+        order = [self._boot_xy]
+        for xy in order:
+            order.extend(
+                (child.x, child.y) for child in self._children.get(xy, ()))
+        self._needed = {xy: deque() for xy in order}
+        for index, binary in enumerate(self._binaries):
+            needs: Set[XY] = set()
+            for xy in reversed(order):
+                if (xy in needs or
+                        binary.core_subsets.is_chip(xy[0], xy[1])):
+                    needs.add(xy)
+                    if xy != self._boot_xy:
+                        parent = self._parents[xy]
+                        needs.add((parent.x, parent.y))
+            for xy in order:
+                if xy in needs and xy != self._boot_xy:
+                    self._needed[xy].append(index)
+
+    def __n_children_needing(self, xy: XY, index: int) -> int:
+        return sum(
+            1 for child in self._children.get(xy, ())
+            if self._needed[child.x, child.y] and
+            self._needed[child.x, child.y][0] == index)
+
+    def __write_next_to_root(self) -> None:
+        """
+        Write the next binary to the boot chip, if there is one.
+        """
+        index = self._next_root_binary
+        if index >= len(self._binaries):
+            return
+        self._next_root_binary += 1
+        binary = self._binaries[index]
+        data = cast(bytes, binary.data)
+        x, y = self._boot_xy
+        binary.n_writes = 0
+        for offset in range(0, len(data), UDP_MESSAGE_MAX_SIZE):
+            binary.n_writes += 1
+            self._to_send.append(partial(
+                self._send_request,
+                WriteMemory((x, y, 0), self._address + offset,
+                            data[offset:offset + UDP_MESSAGE_MAX_SIZE]),
+                partial(self.__root_written, index)))
+
+    def __root_written(self, index: int, _response) -> None:
+        binary = self._binaries[index]
+        binary.n_writes -= 1
+        if binary.n_writes:
+            return
+        x, y = self._boot_xy
+        if binary.core_subsets.is_chip(x, y):
+            processors = binary.core_subsets.get_core_subset_for_chip(
+                x, y).processor_ids
+            self._to_send.append(partial(
+                self._send_request,
+                ApplicationRun(self._app_id, x, y, processors, self._wait),
+                partial(self.__root_ran, index)))
+        else:
+            self.__root_has(index)
+
+    def __root_ran(self, index: int, _response) -> None:
+        self.__root_has(index)
+
+    def __root_has(self, index: int) -> None:
+        self.__now_has(self._boot_xy, index)
+        if not self._n_waiting[self._boot_xy]:
+            self.__write_next_to_root()
+
+    def __now_has(self, xy: XY, index: int) -> None:
+        """
+        Note that a chip has a binary, and start copying it on.
+        """
+        self._held[xy] = index
+        self._n_waiting[xy] = self.__n_children_needing(xy, index)
+        self.__serve(xy)
+
+    def __serve(self, xy: XY) -> None:
+        """
+        Start a copy from a chip to the first child that can take one.
+        """
+        if xy in self._serving or xy not in self._held:
+            return
+        index = self._held[xy]
+        chip = SpiNNManDataView.get_machine()[xy]
+        eth = (chip.nearest_ethernet_x, chip.nearest_ethernet_y)
+        for child in self._children.get(xy, ()):
+            child_xy = (child.x, child.y)
+            needed = self._needed[child_xy]
+            if (not needed or needed[0] != index or
+                    child_xy in self._in_flight or
+                    self._n_waiting[child_xy]):
+                continue
+            off_board = not _on_same_board(chip, child)
+            if off_board and eth in self._off_board_busy:
+                self._off_board_blocked[eth].add(xy)
+                continue
+            self.__copy(xy, child, index, eth if off_board else None)
+            return
+
+    def __copy(self, xy: XY, child: Chip, index: int,
+               off_board: Optional[XY]) -> None:
+        """
+        Copy a binary from a chip to one of its children.
+
+        :param tuple(int,int) xy: The chip to copy from
+        :param ~spinn_machine.Chip child: The chip to copy to
+        :param int index: Which binary to copy
+        :param off_board:
+            The board being copied from if the child is on another board
+        :type off_board: tuple(int,int) or None
+        """
+        binary = self._binaries[index]
+        child_xy = (child.x, child.y)
+        self._serving.add(xy)
+        self._in_flight.add(child_xy)
+        if off_board is not None:
+            self._off_board_busy.add(off_board)
+        processors = binary.core_subsets.get_core_subset_for_chip(
+            child.x, child.y).processor_ids
+        self._to_send.append(partial(
+            self._send_request,
+            AppCopyRun(child.x, child.y, cast(int, child.parent_link),
+                       binary.size, self._app_id, processors,
+                       binary.checksum, self._wait),
+            partial(self.__copied, xy, child_xy, index, off_board)))
+
+    def __copied(self, xy: XY, child_xy: XY, index: int,
+                 off_board: Optional[XY], _response) -> None:
+        self._serving.discard(xy)
+        self._in_flight.discard(child_xy)
+        self._needed[child_xy].popleft()
+        if off_board is not None:
+            self._off_board_busy.discard(off_board)
+            for blocked in self._off_board_blocked.pop(off_board, ()):
+                self.__serve(blocked)
+
+        # The child can now copy on what it has
+        self.__now_has(child_xy, index)
+        if not self._n_waiting[child_xy]:
+            self.__serve_next(child_xy)
+
+        # The parent can copy to another child, or take its next binary
+        self._n_waiting[xy] -= 1
+        self.__serve(xy)
+        if not self._n_waiting[xy]:
+            self.__serve_next(xy)
+
+    def __serve_next(self, xy: XY) -> None:
+        """
+        Let a chip whose children all have its binary take the next one.
+        """
+        if xy == self._boot_xy:
+            self.__write_next_to_root()
+        else:
+            parent = self._parents[xy]
+            self.__serve((parent.x, parent.y))
@@ -0,0 +1,89 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import Dict, List, Set
+from spinn_utilities.typing.coords import XY
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.exceptions import SpinnmanEOFException, SpinnmanIOException
+from spinnman.messages.scp.impl import GetChipInfo
+from spinnman.messages.scp.impl.get_chip_info_response import (
+    GetChipInfoResponse)
+from spinnman.model import ChipSummaryInfo
+from .abstract_multi_connection_process import AbstractMultiConnectionProcess
+from .most_direct_connection_selector import MostDirectConnectionSelector
+
+#: The time to wait before asking again if a chip's Ethernet is not up
+_ETHERNET_WAIT = 0.1
+
+
+class CheckConnectionsProcess(
+        AbstractMultiConnectionProcess[GetChipInfoResponse]):
+    """
+    A process for checking that connections to Ethernet chips work, by
+    asking every chip for its information through its own connection,
+    all at once.
+    """
+    __slots__ = (
+        "_chip_info",
+        "_failed",
+        "_xys")
+
+    def __init__(self, connections: List[SCAMPConnection]):
+        """
+        :param list(SCAMPConnection) connections:
+            The connections to check
+        """
+        super().__init__(MostDirectConnectionSelector(connections))
+        self._xys = [(conn.chip_x, conn.chip_y) for conn in connections]
+        self._chip_info: Dict[XY, ChipSummaryInfo] = dict()
+        # The chips whose connections cannot be used at all
+        self._failed: Set[XY] = set()
+
+    def __chip_info_response(self, response: GetChipInfoResponse):
+        chip_info = response.chip_info
+        if chip_info.is_ethernet_available:
+            self._chip_info[chip_info.x, chip_info.y] = chip_info
+
+    def __chip_info_error(self, request, exception, tb, connection):
+        # pylint: disable=unused-argument
+        # The chip is asked again in the next round, if there is one; only
+        # a connection that has been closed is given up on straight away
+        if isinstance(exception, SpinnmanEOFException):
+            self._failed.add((connection.chip_x, connection.chip_y))
+
+    def check_connections(self, n_tries: int) -> Dict[XY, ChipSummaryInfo]:
+        """
+        :param int n_tries:
+            The number of times to ask each chip before giving up
+        :return: The information of each chip that responded with its
+            Ethernet available, by the coordinates of its connection
+        :rtype: dict(tuple(int,int),ChipSummaryInfo)
+        """
+        for n_try in range(n_tries):
+            xys = [xy for xy in self._xys
+                   if xy not in self._chip_info and xy not in self._failed]
+            if not xys:
+                break
+            if n_try:
+                time.sleep(_ETHERNET_WAIT)
+            with self._collect_responses(check_error=False):
+                for x, y in xys:
+                    try:
+                        self._send_request(
+                            GetChipInfo(x, y), self.__chip_info_response,
+                            self.__chip_info_error)
+                    except SpinnmanIOException:
+                        self._failed.add((x, y))
+        return self._chip_info
@@ -0,0 +1,225 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass, field
+import functools
+import time
+from typing import Dict, Iterator, List, Tuple
+from spinn_utilities.typing.coords import XYP
+from spinn_machine import CoreSubsets
+from spinnman.model import IOBuffer
+from spinnman.utilities.utility_functions import get_vcpu_address
+from spinnman.messages.scp.impl.read_memory import ReadMemory, Response
+from spinnman.constants import UDP_MESSAGE_MAX_SIZE, CPU_IOBUF_ADDRESS_OFFSET
+from .abstract_multi_connection_process import AbstractMultiConnectionProcess
+from .abstract_multi_connection_process_connection_selector import (
+    ConnectionSelector)
+from .read_iobuf_process import _ENCODING, _FIRST_IOBUF, _ONE_WORD
+
+#: The offset of the chunk that marks where a core's IOBUF was reset
+_RESET = -1
+
+
+@dataclass
+class _CoreState:
+    #: The address of the buffer being followed, or 0 if not yet known
+    address: int = 0
+    #: The number of bytes of the buffer that have been read
+    n_read: int = 0
+    #: The end of the text read, that is not yet a whole line
+    partial: str = ""
+    #: The (buffer number, offset) -> data read in this poll; an offset of
+    #: _RESET marks where the IOBUF was reset
+    chunks: Dict[Tuple[int, int], bytes] = field(default_factory=dict)
+    #: The number of buffers moved through in this poll
+    n_buffers: int = 0
+
+
+class FollowIOBufProcess(AbstractMultiConnectionProcess[Response]):
+    """
+    A process for following the IOBUF of SpiNNaker cores while they run.
+    Each core's position in its chain of buffers is remembered, so each
+    poll reads only the header of the buffer being followed and any new
+    text.  If the buffer being followed gets shorter, such as when the core
+    is loaded again, the core's buffers are followed again from the first.
+    """
+    __slots__ = (
+        "_address_reads",
+        "_cores",
+        "_data_reads",
+        "_header_reads")
+
+    def __init__(self, connection_selector: ConnectionSelector,
+                 core_subsets: CoreSubsets) -> None:
+        """
+        :param ConnectionSelector connection_selector:
+        :param ~spinn_machine.CoreSubsets core_subsets:
+            The cores to follow the IOBUF of
+        """
+        super().__init__(connection_selector)
+
+        # A dictionary of (x, y, p) -> where that core has been read to
+        self._cores: Dict[XYP, _CoreState] = {
+            (core_subset.x, core_subset.y, p): _CoreState()
+            for core_subset in core_subsets
+            for p in core_subset.processor_ids}
+
+        # A list of (x, y, p) whose IOBUF address needs to be read again
+        self._address_reads: List[XYP] = list()
+
+        # A list of (x, y, p) whose buffer header needs to be read
+        self._header_reads: List[XYP] = list()
+
+        # A list of ((x, y, p), buffer number, offset, address, size) of
+        # the new data that needs to be read
+        self._data_reads: List[Tuple[XYP, int, int, int, int]] = list()
+
+    def _request_iobuf_address(self, xyp: XYP):
+        x, y, p = xyp
+        base_address = get_vcpu_address(p) + CPU_IOBUF_ADDRESS_OFFSET
+        self._send_request(
+            ReadMemory((x, y, 0), base_address, _ONE_WORD.size),
+            functools.partial(self.__handle_iobuf_address_response, xyp))
+
+    def __handle_iobuf_address_response(self, xyp: XYP, response: Response):
+        iobuf_address, = _ONE_WORD.unpack_from(response.data, response.offset)
+        if iobuf_address != 0:
+            self._cores[xyp].address = iobuf_address
+            self._header_reads.append(xyp)
+
+    def _request_iobuf_header(self, xyp: XYP):
+        x, y, _ = xyp
+        self._send_request(
+            ReadMemory((x, y, 0), self._cores[xyp].address, _FIRST_IOBUF.size),
+            functools.partial(self.__handle_iobuf_header_response, xyp))
+
+    def __handle_iobuf_header_response(self, xyp: XYP, response: Response):
+        next_address, n_bytes = _FIRST_IOBUF.unpack_from(
+            response.data, response.offset)
+        state = self._cores[xyp]
+
+        # A buffer that has got shorter has been reset, so start again from
+        # the first buffer; text already read ends before the reset
+        if n_bytes < state.n_read:
+            state.n_buffers += 1
+            state.chunks[state.n_buffers, _RESET] = b""
+            state.address = 0
+            state.n_read = 0
+            self._address_reads.append(xyp)
+            return
+
+        # Read whatever has been added since the last poll
+        address = state.address + _FIRST_IOBUF.size + state.n_read
+        offset = state.n_read
+        while offset < n_bytes:
+            size = min(n_bytes - offset, UDP_MESSAGE_MAX_SIZE)
+            self._data_reads.append(
+                (xyp, state.n_buffers, offset, address, size))
+            address += size
+            offset += size
+        state.n_read = n_bytes
+
+        # A full buffer is never added to again, so move on to the next
+        if next_address != 0:
+            state.address = next_address
+            state.n_read = 0
+            state.n_buffers += 1
+            self._header_reads.append(xyp)
+
+    def _request_iobuf_data(
+            self, xyp: XYP, n: int, offset: int, address: int, size: int):
+        x, y, _ = xyp
+        self._send_request(
+            ReadMemory((x, y, 0), address, size),
+            functools.partial(
+                self.__handle_iobuf_data_response, xyp, n, offset))
+
+    def __handle_iobuf_data_response(
+            self, xyp: XYP, n: int, offset: int, response: Response):
+        self._cores[xyp].chunks[n, offset] = bytes(response.data[
+            response.offset:response.offset + response.length])
+
+    def poll(self) -> List[IOBuffer]:
+        """
+        Read the text added to the IOBUF of each core since the last poll.
+
+        :return: An IOBuffer for each new complete line, without its newline
+        :rtype: list(IOBuffer)
+        """
+        with self._collect_responses():
+            for xyp, state in self._cores.items():
+                if state.address == 0:
+                    self._request_iobuf_address(xyp)
+                else:
+                    self._header_reads.append(xyp)
+
+            # Do the reads that the responses ask for until there are none
+            # left
+            while True:
+                while (self._data_reads or self._header_reads or
+                        self._address_reads):
+                    if self._data_reads:
+                        self._request_iobuf_data(*self._data_reads.pop())
+                    elif self._header_reads:
+                        self._request_iobuf_header(self._header_reads.pop())
+                    else:
+                        self._request_iobuf_address(self._address_reads.pop())
+                if not self._process_responses():
+                    break
+
+        lines: List[IOBuffer] = list()
+        for (x, y, p), state in self._cores.items():
+            state.n_buffers = 0
+            if not state.chunks:
+                continue
+            text = state.partial
+            for key in sorted(state.chunks):
+                if key[1] != _RESET:
+                    text += state.chunks[key].decode(_ENCODING)
+                elif text and not text.endswith("\n"):
+                    text += "\n"
+            state.chunks.clear()
+            *complete, state.partial = text.split("\n")
+            lines.extend(IOBuffer(x, y, p, line) for line in complete)
+        return lines
+
+    def flush(self) -> List[IOBuffer]:
+        """
+        Get the text at the end of the IOBUF of each core that is not yet
+        a complete line, such as when the cores have stopped, and forget it.
+
+        :return: An IOBuffer for each core with such text
+        :rtype: list(IOBuffer)
+        """
+        lines: List[IOBuffer] = list()
+        for (x, y, p), state in self._cores.items():
+            if state.partial:
+                lines.append(IOBuffer(x, y, p, state.partial))
+                state.partial = ""
+        return lines
+
+    def follow(self, interval: float) -> Iterator[IOBuffer]:
+        """
+        Poll the IOBUF of the cores for ever, producing each line as it is
+        read.  Stop by closing the iterator; any text after the last
+        complete line can then be got with :py:meth:`flush`.
+
+        :param float interval: The time between the starts of polls, in
+            seconds
+        :rtype: iterable(IOBuffer)
+        """
+        while True:
+            start = time.monotonic()
+            yield from self.poll()
+            time.sleep(max(0.0, start + interval - time.monotonic()))
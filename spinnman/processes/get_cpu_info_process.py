@@ -13,10 +13,8 @@
 # limitations under the License.
 
 import functools
-from typing import cast
 from spinn_machine import CoreSubsets
 from spinnman.model import CPUInfos
-from spinnman.model.cpu_info import CPUInfo, _vcpu_t, _VCPU_PATTERN
 from spinnman.constants import CPU_INFO_BYTES
 from spinnman.utilities.utility_functions import get_vcpu_address
 from spinnman.messages.scp.impl.read_memory import ReadMemory, Response
@@ -40,16 +38,18 @@ class GetCPUInfoProcess(AbstractMultiConnectionProcess[Response]):
         super().__init__(connection_selector)
         self.__cpu_infos = CPUInfos()
 
-    def _is_desired(self, cpu_info: CPUInfo) -> bool:
-        # pylint: disable=unused-argument
-        return True
+    def _filter(self, cpu_infos: CPUInfos) -> CPUInfos:
+        """
+        Select the infos to return from those read.
+
+        :param CPUInfos cpu_infos: The infos of all the cores read
+        :rtype: CPUInfos
+        """
+        return cpu_infos
 
     def __handle_response(self, x: int, y: int, p: int, response: Response):
-        cpu_data = cast(_vcpu_t, _VCPU_PATTERN.unpack_from(
-            response.data, response.offset))
-        cpu_info = CPUInfo(x, y, p, cpu_data)
-        if self._is_desired(cpu_info):
-            self.__cpu_infos.add_info(cpu_info)
+        self.__cpu_infos.add_vcpu_data(x, y, p, response.data[
+            response.offset:response.offset + CPU_INFO_BYTES])
 
     def get_cpu_info(self, core_subsets: CoreSubsets) -> CPUInfos:
         """
@@ -65,4 +65,4 @@ class GetCPUInfoProcess(AbstractMultiConnectionProcess[Response]):
                                    CPU_INFO_BYTES),
                         functools.partial(self.__handle_response, x, y, p))
 
-        return self.__cpu_infos
+        return self._filter(self.__cpu_infos)
@@ -12,9 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Container
+from typing import Iterable
 from spinn_utilities.overrides import overrides
-from spinnman.model import CPUInfo
+from spinnman.model import CPUInfos
 from spinnman.model.enums import CPUState
 from .abstract_multi_connection_process_connection_selector import (
     ConnectionSelector)
@@ -30,7 +30,7 @@ class GetIncludeCPUInfoProcess(GetCPUInfoProcess):
     __slots__ = ("__states", )
 
     def __init__(self, connection_selector: ConnectionSelector,
-                 states: Container[CPUState]):
+                 states: Iterable[CPUState]):
         """
         :param connection_selector:
         :type connection_selector:
@@ -41,6 +41,6 @@ class GetIncludeCPUInfoProcess(GetCPUInfoProcess):
         super().__init__(connection_selector)
         self.__states = states
 
-    @overrides(GetCPUInfoProcess._is_desired)
-    def _is_desired(self, cpu_info: CPUInfo) -> bool:
-        return cpu_info.state in self.__states
+    @overrides(GetCPUInfoProcess._filter)
+    def _filter(self, cpu_infos: CPUInfos) -> CPUInfos:
+        return cpu_infos.infos_in_states(self.__states)
@@ -0,0 +1,67 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import struct
+from typing import Dict, Iterable
+from spinn_utilities.typing.coords import XY
+from spinnman.constants import SYSTEM_VARIABLE_BASE_ADDRESS
+from spinnman.messages.scp.impl.read_memory import ReadMemory, Response
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
+from .abstract_multi_connection_process import AbstractMultiConnectionProcess
+from .abstract_multi_connection_process_connection_selector import (
+    ConnectionSelector)
+
+_FOUR_BYTES = struct.Struct("<BBBB")
+_IP_ADDRESS = SystemVariableDefinition.ethernet_ip_address
+
+
+class GetIPAddressesProcess(AbstractMultiConnectionProcess[Response]):
+    """
+    A process for getting the Ethernet IP addresses that many chips have,
+    all at once.  Chips that cannot be read are left out, as happens when
+    a chip that might have an Ethernet connection does not exist.
+    """
+    __slots__ = "_ip_addresses",
+
+    def __init__(self, connection_selector: ConnectionSelector):
+        """
+        :param ConnectionSelector connection_selector:
+        """
+        super().__init__(connection_selector)
+        self._ip_addresses: Dict[XY, str] = dict()
+
+    def __ip_address_response(self, xy: XY, response: Response):
+        ip = _FOUR_BYTES.unpack_from(response.data, response.offset)
+        self._ip_addresses[xy] = f"{ip[0]}.{ip[1]}.{ip[2]}.{ip[3]}"
+
+    def __ignore_error(self, *_args):
+        pass
+
+    def get_ip_addresses(self, xys: Iterable[XY]) -> Dict[XY, str]:
+        """
+        :param iterable(tuple(int,int)) xys: The chips to read from
+        :return: The IP address of each chip that could be read
+        :rtype: dict(tuple(int,int),str)
+        """
+        with self._collect_responses(check_error=False):
+            for x, y in xys:
+                self._send_request(
+                    ReadMemory(
+                        (x, y, 0),
+                        SYSTEM_VARIABLE_BASE_ADDRESS + _IP_ADDRESS.offset,
+                        _FOUR_BYTES.size),
+                    functools.partial(self.__ip_address_response, (x, y)),
+                    self.__ignore_error)
+        return self._ip_addresses
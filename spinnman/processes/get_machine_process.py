@@ -16,7 +16,10 @@ from collections import defaultdict
 from contextlib import suppress
 import logging
 import functools
+import json
+import os
 from os.path import join
+import struct
 from typing import Dict, List, Optional, Set, Tuple, cast
 
 from spinn_utilities.config_holder import (
@@ -58,6 +61,14 @@ P_TO_V_ADDR = SYSTEM_VARIABLE_BASE_ADDRESS + P_TO_V.offset
 _P_TO_V_SIZE = cast(int, P_TO_V.array_size)
 P_MAPS_SIZE = _P_TO_V_SIZE + cast(int, V_TO_P.array_size)
 
+_ONE_WORD = struct.Struct("<I")
+#: The version of the layout of the machine cache file
+_CACHE_VERSION = 1
+#: The system variables that change each time the machine is booted
+_BOOT_KEY_VARIABLES = (
+    SystemVariableDefinition.unix_timestamp,
+    SystemVariableDefinition.boot_signature)
+
 
 class GetMachineProcess(AbstractMultiConnectionProcess):
     """
@@ -65,6 +76,8 @@ class GetMachineProcess(AbstractMultiConnectionProcess):
     """
     __slots__ = (
         "_chip_info",
+        # The chip information as received, so that it can be cached
+        "_chip_info_data",
         # Used if there are any ignores with IP addresses
         # Holds a mapping from IP to board root (x,y)
         "_ethernets",
@@ -76,7 +89,9 @@ class GetMachineProcess(AbstractMultiConnectionProcess):
         # Holds a mapping from (x,y) to a mapping of virtual to physical core
         "_physical_to_virtual_map",
         # Progress bar to fill in as details are received
-        "_progress")
+        "_progress",
+        # The values of the boot key system variables, by offset
+        "_boot_key")
 
     def __init__(self, connection_selector: ConnectionSelector):
         """
@@ -90,6 +105,7 @@ class GetMachineProcess(AbstractMultiConnectionProcess):
 
         # A dictionary of (x, y) -> ChipInfo
         self._chip_info: Dict[XY, ChipSummaryInfo] = dict()
+        self._chip_info_data: Dict[XY, bytes] = dict()
 
         # Set to None meaning not computed yet
         self._ethernets: Optional[Dict[str, XY]] = None
@@ -98,6 +114,7 @@ class GetMachineProcess(AbstractMultiConnectionProcess):
         self._virtual_to_physical_map: Dict[XY, bytes] = dict()
         self._physical_to_virtual_map: Dict[XY, bytes] = dict()
         self._progress: Optional[ProgressBar] = None
+        self._boot_key: Dict[int, int] = dict()
 
     def _make_chip(self, chip_info: ChipSummaryInfo, machine: Machine) -> Chip:
         """
@@ -187,6 +204,8 @@ class GetMachineProcess(AbstractMultiConnectionProcess):
         """
         chip_info = scp_read_chip_info_response.chip_info
         self._chip_info[chip_info.x, chip_info.y] = chip_info
+        self._chip_info_data[chip_info.x, chip_info.y] = \
+            scp_read_chip_info_response.data
         if self._progress is not None:
             self._progress.update()
 
@@ -203,6 +222,120 @@ class GetMachineProcess(AbstractMultiConnectionProcess):
         off += _P_TO_V_SIZE
         self._virtual_to_physical_map[x, y] = data[off:]
 
+    def __receive_boot_key(self, offset: int, scp_read_response: Response):
+        """
+        :param int offset: The offset of the system variable
+        :param Response scp_read_response:
+        """
+        self._boot_key[offset], = _ONE_WORD.unpack_from(
+            scp_read_response.data, scp_read_response.offset)
+
+    def _read_boot_key(self, boot_x: int, boot_y: int) -> Tuple[int, ...]:
+        """
+        Read the system variables of the boot chip that are set each time
+        the machine is booted, so a machine that has not been booted again
+        can be recognised.
+
+        :param int boot_x:
+        :param int boot_y:
+        :rtype: tuple(int, ...)
+        """
+        with self._collect_responses():
+            for variable in _BOOT_KEY_VARIABLES:
+                self._send_request(
+                    ReadMemory(
+                        (boot_x, boot_y, 0),
+                        SYSTEM_VARIABLE_BASE_ADDRESS + variable.offset,
+                        _ONE_WORD.size),
+                    functools.partial(
+                        self.__receive_boot_key, variable.offset))
+        return tuple(
+            self._boot_key[variable.offset]
+            for variable in _BOOT_KEY_VARIABLES)
+
+    def _load_cache(
+            self, cache_file: str, key: Tuple[int, ...],
+            width: int, height: int) -> bool:
+        """
+        Load the details of the chips from a cache, if the cache was made
+        with the same key and has the details of every chip in its P2P
+        table.
+
+        :param str cache_file: The file the cache is kept in
+        :param tuple(int, ...) key: What identifies the machine and boot
+        :param int width: The width of the machine
+        :param int height: The height of the machine
+        :return: Whether the details were loaded
+        :rtype: bool
+        """
+        if not os.path.exists(cache_file):
+            return False
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if (cache["version"] != _CACHE_VERSION or
+                    tuple(cache["key"]) != key):
+                return False
+            p2p_column_data = [
+                (bytes.fromhex(column), 0) for column in cache["p2p"]]
+            chip_info_data: Dict[XY, bytes] = dict()
+            chip_info: Dict[XY, ChipSummaryInfo] = dict()
+            p_to_v: Dict[XY, bytes] = dict()
+            v_to_p: Dict[XY, bytes] = dict()
+            for chip in cache["chips"]:
+                xy = (int(chip["x"]), int(chip["y"]))
+                chip_info_data[xy] = bytes.fromhex(chip["info"])
+                chip_info[xy] = ChipSummaryInfo(chip_info_data[xy], 0, *xy)
+                p_to_v[xy] = bytes.fromhex(chip["p_to_v"])
+                v_to_p[xy] = bytes.fromhex(chip["v_to_p"])
+            p2p_table = P2PTable(width, height, p2p_column_data)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Ignoring unreadable machine cache {}", cache_file)
+            return False
+        if (len(p2p_column_data) != width or
+                any(xy not in chip_info for xy in p2p_table.iterchips())):
+            logger.warning("Ignoring incomplete machine cache {}", cache_file)
+            return False
+        self._p2p_column_data = p2p_column_data
+        self._chip_info_data = chip_info_data
+        self._chip_info = chip_info
+        self._physical_to_virtual_map = p_to_v
+        self._virtual_to_physical_map = v_to_p
+        return True
+
+    def _save_cache(
+            self, cache_file: str, key: Tuple[int, ...], p2p_table: P2PTable):
+        """
+        Save the details of the chips to a cache, replacing any cache made
+        with a different key.  Nothing is saved unless every chip in the P2P
+        table replied, so that the details of missing chips are read again.
+
+        :param str cache_file: The file the cache is kept in
+        :param tuple(int, ...) key: What identifies the machine and boot
+        :param P2PTable p2p_table: The table of chips that should be saved
+        """
+        if any(xy not in self._chip_info_data or
+               xy not in self._physical_to_virtual_map
+               for xy in p2p_table.iterchips()):
+            return
+        cache = {
+            "version": _CACHE_VERSION,
+            "key": list(key),
+            "p2p": [bytes(data[offset:]).hex()
+                    for data, offset in self._p2p_column_data],
+            "chips": [
+                {"x": x, "y": y, "info": data.hex(),
+                 "p_to_v": bytes(self._physical_to_virtual_map[x, y]).hex(),
+                 "v_to_p": bytes(self._virtual_to_physical_map[x, y]).hex()}
+                for (x, y), data in self._chip_info_data.items()]}
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(temp_file, cache_file)
+        except OSError:
+            logger.warning("Unable to write machine cache {}", cache_file)
+
     def _receive_error(
             self, request: AbstractSCPRequest, exception, tb, connection):
         """
@@ -227,6 +360,49 @@ class GetMachineProcess(AbstractMultiConnectionProcess):
         :param int height:
         :rtype: ~spinn_machine.Machine
         """
+        # If the machine has not been booted again since its details were
+        # cached, they can be used instead of asking every chip again
+        cache_file = get_config_str_or_none("Machine", "machine_cache_file")
+        if cache_file is not None:
+            key = (boot_x, boot_y, width, height) + self._read_boot_key(
+                boot_x, boot_y)
+            if self._load_cache(cache_file, key, width, height):
+                logger.info("Using the machine details cached in {}",
+                            cache_file)
+                p2p_table = P2PTable(width, height, self._p2p_column_data)
+            else:
+                p2p_table = self._read_chip_details(boot_x, boot_y, width,
+                                                    height)
+                self._save_cache(cache_file, key, p2p_table)
+        else:
+            p2p_table = self._read_chip_details(boot_x, boot_y, width, height)
+
+        # Warn about unexpected missing chips
+        for (x, y) in p2p_table.iterchips():
+            if (x, y) not in self._chip_info:
+                logger.warning(
+                    "Chip {}, {} was expected but didn't reply", x, y)
+
+        version = SpiNNManDataView.get_machine_version()
+        machine = version.create_machine(width, height)
+        self._preprocess_ignore_chips(machine)
+        self._process_ignore_links(machine)
+        self._preprocess_ignore_cores(machine)
+
+        return self._fill_machine(machine)
+
+    def _read_chip_details(
+            self, boot_x: int, boot_y: int,
+            width: int, height: int) -> P2PTable:
+        """
+        Read the P2P table, and then the details of every chip in it.
+
+        :param int boot_x:
+        :param int boot_y:
+        :param int width:
+        :param int height:
+        :rtype: P2PTable
+        """
         # Get the P2P table - 8 entries are packed into each 32-bit word
         p2p_column_bytes = P2PTable.get_n_column_bytes(height)
         blank = (b'', 0)
@@ -255,20 +431,7 @@ class GetMachineProcess(AbstractMultiConnectionProcess):
                     ReadMemory((x, y, 0), P_TO_V_ADDR, P_MAPS_SIZE),
                     functools.partial(self._receive_p_maps, x, y))
         self._progress.end()
-
-        # Warn about unexpected missing chips
-        for (x, y) in p2p_table.iterchips():
-            if (x, y) not in self._chip_info:
-                logger.warning(
-                    "Chip {}, {} was expected but didn't reply", x, y)
-
-        version = SpiNNManDataView.get_machine_version()
-        machine = version.create_machine(width, height)
-        self._preprocess_ignore_chips(machine)
-        self._process_ignore_links(machine)
-        self._preprocess_ignore_cores(machine)
-
-        return self._fill_machine(machine)
+        return p2p_table
 
     def _fill_machine(self, machine: Machine) -> Machine:
         """
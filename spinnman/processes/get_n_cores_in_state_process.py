@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import partial
 from spinnman.messages.scp.impl import CountState
 from spinnman.messages.scp.enums.scp_result import SCPResult
 from .abstract_multi_connection_process import AbstractMultiConnectionProcess
@@ -25,7 +26,8 @@ class GetNCoresInStateProcess(AbstractMultiConnectionProcess):
     Gets the state of a core over the provided connection.
     """
     __slots__ = [
-        "_n_cores"]
+        "_n_cores",
+        "_n_cores_by_state"]
 
     def __init__(self, connection_selector):
         """
@@ -36,10 +38,14 @@ class GetNCoresInStateProcess(AbstractMultiConnectionProcess):
         super().__init__(connection_selector, timeout=GET_CORE_COUNT_TIMEOUT,
                          non_fail_retry_codes={SCPResult.RC_P2P_NOREPLY})
         self._n_cores = 0
+        self._n_cores_by_state = dict()
 
     def __handle_response(self, response):
         self._n_cores += response.count
 
+    def __handle_state_response(self, app_id, state, response):
+        self._n_cores_by_state[app_id][state] += response.count
+
     def get_n_cores_in_state(self, xys, app_id, state):
         """
         :param list(int,int) xys:
@@ -54,3 +60,45 @@ class GetNCoresInStateProcess(AbstractMultiConnectionProcess):
         self.check_for_error()
 
         return self._n_cores
+
+    def get_n_cores_in_states(self, xys, app_id, states):
+        """
+        Count the cores of an application in each of several states.  The
+        requests for all the states and chips are sent together, so this
+        takes a single round trip however many states are counted.
+
+        :param list(int,int) xys:
+        :param int app_id:
+        :param iterable(CPUState) states:
+        :return: The number of cores in each state
+        :rtype: dict(CPUState, int)
+        """
+        return self.get_state_histogram(xys, (app_id, ), states)[app_id]
+
+    def get_state_histogram(self, xys, app_ids, states):
+        """
+        Count the cores of several applications in each of several states.
+        The requests for every application, state and chip are sent
+        together, so this takes a single round trip.
+
+        :param list(int,int) xys:
+        :param iterable(int) app_ids:
+        :param iterable(CPUState) states:
+        :return: The number of cores in each state for each application ID
+        :rtype: dict(int, dict(CPUState, int))
+        """
+        xys = list(xys)
+        states = list(states)
+        for app_id in app_ids:
+            counts = self._n_cores_by_state.setdefault(app_id, dict())
+            for state in states:
+                counts[state] = 0
+                handler = partial(self.__handle_state_response, app_id, state)
+                for c_x, c_y in xys:
+                    self._send_request(
+                        CountState(c_x, c_y, app_id, state), handler)
+        self._finish()
+        self.check_for_error()
+
+        return {app_id: dict(counts)
+                for app_id, counts in self._n_cores_by_state.items()}
@@ -15,7 +15,7 @@
 from typing import Optional
 
 from spinnman.messages.scp.impl import GetVersion
-from spinnman.constants import N_RETRIES
+from spinnman.constants import N_RETRIES, SCP_TIMEOUT
 from spinnman.model import VersionInfo
 from spinnman.messages.scp.impl.get_version_response import GetVersionResponse
 
@@ -31,11 +31,13 @@ class GetVersionProcess(AbstractMultiConnectionProcess[GetVersionResponse]):
     __slots__ = "_version_info",
 
     def __init__(self, connection_selector: ConnectionSelector,
-                 n_retries: int = N_RETRIES):
+                 n_retries: int = N_RETRIES, timeout: float = SCP_TIMEOUT):
         """
         :param ConnectionSelector connection_selector:
+        :param int n_retries: The number of times to resend the request
+        :param float timeout: The time to wait for each response
         """
-        super().__init__(connection_selector, n_retries)
+        super().__init__(connection_selector, n_retries, timeout)
         self._version_info: Optional[VersionInfo] = None
 
     def _get_response(self, version_response: GetVersionResponse):
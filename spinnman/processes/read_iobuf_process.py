@@ -16,7 +16,7 @@ from dataclasses import dataclass
 import functools
 import struct
 from collections import defaultdict
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, Iterator, List
 from spinn_utilities.typing.coords import XYP
 from spinn_machine import CoreSubsets
 from spinnman.model import IOBuffer
@@ -80,9 +80,11 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
     """
     __slots__ = (
         "_extra_reads",
+        "_finished",
         "_iobuf",
         "_iobuf_address",
         "_iobuf_view",
+        "_n_reads",
         "_next_reads")
 
     def __init__(self, connection_selector: ConnectionSelector) -> None:
@@ -108,9 +110,22 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
         # read = list of (x, y, p, n, next_address, first_read_size)
         self._next_reads: List[_NextRegion] = list()
 
+        # A dictionary of (x, y, p) -> number of reads not yet done
+        self._n_reads: Dict[XYP, int] = defaultdict(int)
+
+        # A list of (x, y, p) whose buffers have all been read
+        self._finished: List[XYP] = list()
+
+    def __read_done(self, xyp: XYP):
+        self._n_reads[xyp] -= 1
+        if not self._n_reads[xyp]:
+            del self._n_reads[xyp]
+            self._finished.append(xyp)
+
     def _request_iobuf_address(self, iobuf_size: int, x: int, y: int, p: int):
         scamp_coords = (x, y, 0)
         base_address = get_vcpu_address(p) + CPU_IOBUF_ADDRESS_OFFSET
+        self._n_reads[x, y, p] += 1
         self._send_request(
             ReadMemory(scamp_coords, base_address, 4),
             functools.partial(self.__handle_iobuf_address_response,
@@ -124,6 +139,8 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
             first_read_size = min((iobuf_size + 16, UDP_MESSAGE_MAX_SIZE))
             self._next_reads.append(_NextRegion(
                 scamp_coords, xyp, 0, iobuf_address, first_read_size))
+            self._n_reads[xyp] += 1
+        self.__read_done(xyp)
 
     def _request_iobuf_region_tail(self, tail: _RegionTail):
         self._send_request(
@@ -137,6 +154,7 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
         base = tail.offset
         view[base:base + response.length] = response.data[
             response.offset:response.offset + response.length]
+        self.__read_done(tail.core_coords)
 
     def _request_iobuf_region(self, region: _NextRegion):
         self._send_request(
@@ -176,6 +194,7 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
             next_bytes_to_read = min((bytes_to_read, UDP_MESSAGE_MAX_SIZE))
             self._extra_reads.append(region.tail(
                 base_address, next_bytes_to_read, read_offset))
+            self._n_reads[region.core_coords] += 1
             base_address += next_bytes_to_read
             read_offset += next_bytes_to_read
             bytes_to_read -= next_bytes_to_read
@@ -183,37 +202,63 @@ class ReadIOBufProcess(AbstractMultiConnectionProcess[Response]):
         # If there is another IOBuf buffer, read this next
         if next_address != 0:
             self._next_reads.append(region.next_at(next_address))
+            self._n_reads[region.core_coords] += 1
+        self.__read_done(region.core_coords)
+
+    def __finished_iobufs(self) -> Iterator[IOBuffer]:
+        """
+        Get the buffers of the cores that have been completely read, and
+        forget them.
+        """
+        while self._finished:
+            x, y, p = xyp = self._finished.pop()
+            self._iobuf_view.pop(xyp, None)
+            buffers = self._iobuf.pop(xyp, {})
+            yield IOBuffer(x, y, p, "".join(
+                buffers[n].decode(_ENCODING) for n in sorted(buffers)))
 
     def read_iobuf(
             self, iobuf_size: int,
             core_subsets: CoreSubsets) -> Iterable[IOBuffer]:
         """
+        Read the IOBUF of cores.  The reads of each core's buffers are sent
+        as soon as the reads that they depend on are done, and each core's
+        buffer is produced as soon as it has been read, so the buffers are
+        not produced in the order of the cores.
+
+        .. note::
+            Reads are still in progress while each buffer is handled, so the
+            caller must not block between buffers; the time taken counts
+            towards the timeout of the reads.  If the caller stops early,
+            the reads in progress are still finished, but any errors are
+            not reported.
+
         :param int iobuf_size:
         :param ~spinn_machine.CoreSubsets core_subsets:
         :rtype: iterable(IOBuffer)
         """
-        # Get the iobuf address for each core
-        with self._collect_responses():
+        try:
+            # Get the iobuf address for each core
             for core_subset in core_subsets:
                 x, y = core_subset.x, core_subset.y
                 for p in core_subset.processor_ids:
                     self._request_iobuf_address(iobuf_size, x, y, p)
 
-        # Run rounds of the process until reading is complete
-        while self._extra_reads or self._next_reads:
-            with self._collect_responses():
-                # Process the extra iobuf reads needed
-                while self._extra_reads:
-                    self._request_iobuf_region_tail(self._extra_reads.pop())
-
-                # Process the next iobuf reads needed
-                while self._next_reads:
-                    self._request_iobuf_region(self._next_reads.pop())
-
-        for core_subset in core_subsets:
-            x, y = core_subset.x, core_subset.y
-            for p in core_subset.processor_ids:
-                iobuf = ""
-                for item in self._iobuf[x, y, p].values():
-                    iobuf += item.decode(_ENCODING)
-                yield IOBuffer(x, y, p, iobuf)
+            # Do the reads that the responses ask for until there are none
+            # left; the tails are read first as they finish buffers
+            while True:
+                while self._extra_reads or self._next_reads:
+                    if self._extra_reads:
+                        self._request_iobuf_region_tail(
+                            self._extra_reads.pop())
+                    else:
+                        self._request_iobuf_region(self._next_reads.pop())
+                    yield from self.__finished_iobufs()
+                yield from self.__finished_iobufs()
+                if not self._process_responses():
+                    break
+        finally:
+            # Also done if the caller stops early, so that no replies are
+            # left to arrive
+            self._finish()
+        self.check_for_error()
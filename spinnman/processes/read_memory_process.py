@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import defaultdict
 import functools
-from typing import Callable
+from typing import (
+    Callable, Dict, Iterable, List, Optional, Sequence, Tuple)
 
-from spinn_utilities.typing.coords import XYP
+from spinn_utilities.typing.coords import XY, XYP
 
+from spinnman.exceptions import SpinnmanInvalidParameterException
 from spinnman.messages.scp.impl import ReadLink, ReadMemory
 from spinnman.messages.scp.impl.read_memory import Response
 from spinnman.constants import UDP_MESSAGE_MAX_SIZE
@@ -27,9 +30,46 @@ from .abstract_multi_connection_process_connection_selector import (
     ConnectionSelector)
 
 
+def _byte_view(buffer, offset: int, length: Optional[int]) -> memoryview:
+    """
+    Get a writable view of the bytes of part of a buffer.
+
+    :param buffer: Any writable C-contiguous buffer
+    :param int offset: Where the part starts, in bytes
+    :param length: The length of the part, or `None` for the rest
+    :type length: int or None
+    :rtype: memoryview
+    """
+    view = memoryview(buffer)
+    if view.readonly:
+        raise SpinnmanInvalidParameterException(
+            "buffer", str(type(buffer)), "Must be writable")
+    if not view.c_contiguous:
+        raise SpinnmanInvalidParameterException(
+            "buffer", str(type(buffer)), "Must be contiguous")
+    view = view.cast("B")
+    if length is None:
+        length = len(view) - offset
+    if offset < 0 or length < 0 or offset + length > len(view):
+        raise SpinnmanInvalidParameterException(
+            "offset and length", f"{offset} and {length}",
+            f"Must fit in the buffer of {len(view)} bytes")
+    return view[offset:offset + length]
+
+
+#: A part of the data of a packet to be copied to somewhere: the view of
+#: where it goes, the offset in the view, the offset in the packet data and
+#: the number of bytes
+_Piece = Tuple[memoryview, int, int, int]
+
+
 class ReadMemoryProcess(AbstractMultiConnectionProcess[Response]):
     """
     A process for reading memory on a SpiNNaker chip.
+
+    Responses are received into a buffer kept by each connection and copied
+    straight to where they are wanted, so no memory is allocated for each
+    packet.
     """
     __slots__ = ("_view", )
 
@@ -37,13 +77,95 @@ class ReadMemoryProcess(AbstractMultiConnectionProcess[Response]):
         """
         :param ConnectionSelector connection_selector:
         """
-        super().__init__(connection_selector)
+        super().__init__(connection_selector, reuse_receive_buffers=True)
         self._view = memoryview(b'')
 
     def __handle_response(self, offset: int, response: Response):
         self._view[offset:offset + response.length] = response.data[
             response.offset:response.offset + response.length]
 
+    @staticmethod
+    def __handle_batch_response(
+            pieces: Sequence[_Piece], response: Response):
+        data = response.data
+        start = response.offset
+        for view, view_offset, data_offset, n_bytes in pieces:
+            view[view_offset:view_offset + n_bytes] = data[
+                start + data_offset:start + data_offset + n_bytes]
+
+    def read_memory_batch(
+            self, regions: Iterable[Tuple[int, int, int, int]],
+            cpu: int = 0) -> List[bytearray]:
+        """
+        Read many regions of memory at once, with the reads to every chip
+        sharing the same pipelines.  Regions on the same chip that overlap or
+        are next to each other are read with the same packets.
+
+        :param regions: The regions to read as (x, y, address, length)
+        :type regions: iterable(tuple(int,int,int,int))
+        :param int cpu: The core to read via
+        :return: The data of each region, in the order of the regions
+        :rtype: list(bytearray)
+        """
+        results: List[bytearray] = list()
+        by_chip: Dict[XY, List[Tuple[int, int, memoryview]]] = \
+            defaultdict(list)
+        for x, y, address, length in regions:
+            data = bytearray(length)
+            results.append(data)
+            if length > 0:
+                by_chip[x, y].append((address, address + length,
+                                      memoryview(data)))
+
+        with self._collect_responses():
+            for (x, y), chip_regions in by_chip.items():
+                chip_regions.sort(key=lambda region: region[0])
+                span: List[Tuple[int, int, memoryview]] = list()
+                span_end = 0
+                for region in chip_regions:
+                    if span and region[0] > span_end:
+                        self.__read_span((x, y, cpu), span, span_end)
+                        span = list()
+                    span.append(region)
+                    span_end = max(span_end, region[1]) if len(span) > 1 \
+                        else region[1]
+                self.__read_span((x, y, cpu), span, span_end)
+        return results
+
+    def __read_span(
+            self, coordinates: XYP,
+            regions: List[Tuple[int, int, memoryview]], end: int):
+        """
+        Read a contiguous span of memory, copying each packet to all the
+        regions that it overlaps.
+
+        :param regions: The (start, end, view) of the regions in the span,
+            sorted by start
+        :param int end: The end of the span
+        """
+        address = regions[0][0]
+        next_region = 0
+        active: List[Tuple[int, int, memoryview]] = list()
+        while address < end:
+            n_bytes = min(end - address, UDP_MESSAGE_MAX_SIZE)
+            chunk_end = address + n_bytes
+            while (next_region < len(regions) and
+                    regions[next_region][0] < chunk_end):
+                active.append(regions[next_region])
+                next_region += 1
+            pieces: List[_Piece] = list()
+            for start, stop, view in active:
+                first = max(start, address)
+                last = min(stop, chunk_end)
+                if first < last:
+                    pieces.append(
+                        (view, first - start, first - address, last - first))
+            self._send_request(
+                ReadMemory(coordinates, address, n_bytes),
+                functools.partial(self.__handle_batch_response, pieces))
+            active = [region for region in active if region[1] > chunk_end]
+            address = chunk_end
+
     def read_memory(self, coordinates: XYP, base_address: int,
                     length: int) -> bytearray:
         """
@@ -54,9 +176,37 @@ class ReadMemoryProcess(AbstractMultiConnectionProcess[Response]):
         :param int length:
         :rtype: bytearray
         """
-        return self._read_memory(
-            base_address, length,
+        data = bytearray(length)
+        self._read_memory_into(
+            base_address, memoryview(data),
             functools.partial(ReadMemory, coordinates))
+        return data
+
+    def read_memory_into(
+            self, coordinates: XYP, base_address: int, buffer,
+            offset: int = 0, length: Optional[int] = None) -> int:
+        """
+        Read some memory from a core into an existing buffer, such as a
+        :py:class:`bytearray`, :py:class:`memoryview`, :py:class:`mmap.mmap`
+        or numpy array.
+
+        :param tuple(int,int,int) coordinates:
+        :param int base_address:
+        :param buffer: Where to put the data; must be writable and contiguous
+        :param int offset: Where in the buffer to put the data, in bytes
+        :param length:
+            The number of bytes to read, or `None` to fill the rest of the
+            buffer
+        :type length: int or None
+        :return: The number of bytes read
+        :rtype: int
+        :raise SpinnmanInvalidParameterException:
+            If the buffer is not writable or too small
+        """
+        view = _byte_view(buffer, offset, length)
+        self._read_memory_into(
+            base_address, view, functools.partial(ReadMemory, coordinates))
+        return len(view)
 
     def read_link_memory(self, coordinates: XYP, link: int,
                          base_address: int, length: int) -> bytearray:
@@ -69,26 +219,30 @@ class ReadMemoryProcess(AbstractMultiConnectionProcess[Response]):
         :param int length:
         :rtype: bytearray
         """
-        return self._read_memory(
-            base_address, length,
+        data = bytearray(length)
+        self._read_memory_into(
+            base_address, memoryview(data),
             functools.partial(ReadLink, coordinates, link))
+        return data
 
-    def _read_memory(
-            self, base_address: int, length: int,
+    def _read_memory_into(
+            self, base_address: int, view: memoryview,
             packet_class: Callable[
-                [int, int], AbstractSCPRequest[Response]]) -> bytearray:
-        data = bytearray(length)
-        self._view = memoryview(data)
-        n_bytes = length
+                [int, int], AbstractSCPRequest[Response]]) -> None:
+        self._view = view
+        n_bytes = len(view)
         offset = 0
 
-        with self._collect_responses():
-            while n_bytes > 0:
-                bytes_to_get = min((n_bytes, UDP_MESSAGE_MAX_SIZE))
-                self._send_request(
-                    packet_class(base_address + offset, bytes_to_get),
-                    functools.partial(self.__handle_response, offset))
-                n_bytes -= bytes_to_get
-                offset += bytes_to_get
-
-        return data
+        try:
+            with self._collect_responses():
+                while n_bytes > 0:
+                    bytes_to_get = min((n_bytes, UDP_MESSAGE_MAX_SIZE))
+                    self._send_request(
+                        packet_class(base_address + offset, bytes_to_get),
+                        functools.partial(self.__handle_response, offset))
+                    n_bytes -= bytes_to_get
+                    offset += bytes_to_get
+        finally:
+            # Don't keep the caller's buffer exported (e.g. an mmap that
+            # they will want to close)
+            self._view = memoryview(b'')
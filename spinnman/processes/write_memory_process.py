@@ -12,18 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import defaultdict
 import functools
-from typing import BinaryIO, Callable
-import numpy
-from numpy import uint8, uint32
-from spinn_utilities.typing.coords import XYP
+from typing import BinaryIO, Callable, Dict, Iterable, List, Tuple, Union
+from spinn_utilities.typing.coords import XY, XYP
+from spinnman.exceptions import (
+    SpinnmanInvalidParameterException, SpinnmanIOException)
 from spinnman.messages.scp.abstract_messages import AbstractSCPRequest
 from spinnman.messages.scp.impl import WriteLink, WriteMemory
 from spinnman.messages.scp.impl import CheckOKResponse
 from spinnman.constants import UDP_MESSAGE_MAX_SIZE
+from spinnman.utilities.word_checksum import WordChecksum
 from .abstract_multi_connection_process import AbstractMultiConnectionProcess
 
-_UNSIGNED_WORD = 0xFFFFFFFF
+#: The number of bytes to checksum at once; big enough to make summing
+#: efficient, and small enough that sending is not held up by the summing
+_BLOCK_SIZE = 64 * 1024
+
+
+def _checksum(data: memoryview) -> int:
+    checksum = WordChecksum()
+    checksum.update(data)
+    return checksum.value
 
 
 class WriteMemoryProcess(AbstractMultiConnectionProcess[CheckOKResponse]):
@@ -34,8 +44,9 @@ class WriteMemoryProcess(AbstractMultiConnectionProcess[CheckOKResponse]):
     # pylint: disable=too-many-arguments
 
     def write_memory_from_bytearray(
-            self, coordinates: XYP, base_address: int, data: bytes,
-            offset: int, n_bytes: int, get_sum: bool = False) -> int:
+            self, coordinates: XYP, base_address: int,
+            data: Union[bytes, bytearray], offset: int, n_bytes: int,
+            get_sum: bool = False) -> int:
         """
         Writes memory onto a SpiNNaker chip from a bytearray.
 
@@ -55,8 +66,9 @@ class WriteMemoryProcess(AbstractMultiConnectionProcess[CheckOKResponse]):
             functools.partial(WriteMemory, coordinates), get_sum)
 
     def write_link_memory_from_bytearray(
-            self, coordinates: XYP, link: int, base_address: int, data: bytes,
-            offset: int, n_bytes: int, get_sum: bool = False) -> int:
+            self, coordinates: XYP, link: int, base_address: int,
+            data: Union[bytes, bytearray], offset: int, n_bytes: int,
+            get_sum: bool = False) -> int:
         """
         Writes memory onto a neighbour of a SpiNNaker chip from a bytearray.
 
@@ -93,6 +105,8 @@ class WriteMemoryProcess(AbstractMultiConnectionProcess[CheckOKResponse]):
         :param bool get_sum: whether to return a checksum or 0
         :return: the data checksum or 0 if get_sum is False
         :rtype: int
+        :raise SpinnmanIOException:
+            If the reader ends before n_bytes have been read
         """
         return self._write_memory_from_reader(
             base_address, reader, n_bytes,
@@ -117,57 +131,148 @@ class WriteMemoryProcess(AbstractMultiConnectionProcess[CheckOKResponse]):
         :param bool get_sum: whether to return a checksum or 0
         :return: the data checksum or 0 if get_sum is False
         :rtype: int
+        :raise SpinnmanIOException:
+            If the reader ends before n_bytes have been read
         """
         return self._write_memory_from_reader(
             base_address, reader, n_bytes,
             functools.partial(WriteLink, coordinates, link), get_sum)
 
-    def _write_memory_from_bytearray(
-            self, base_address: int, data: bytes, data_offset: int,
-            n_bytes: int, packet_class: Callable[
-                [int, bytes], AbstractSCPRequest[CheckOKResponse]],
-            get_sum: bool) -> int:
-        offset = 0
-        n_bytes_to_write = int(n_bytes)
+    def write_memory_batch(
+            self, items: Iterable[Tuple[int, int, int, bytes]],
+            cpu: int = 0, get_sum: bool = False) -> List[int]:
+        """
+        Writes many pieces of data onto SpiNNaker chips at once, with the
+        writes to every chip sharing the same pipelines.  Pieces on the same
+        chip that are next to each other are merged so that every packet is
+        as full as possible.
+
+        :param items: The pieces to write as (x, y, address, data)
+        :type items: iterable(tuple(int,int,int,bytes))
+        :param int cpu: The core to write via
+        :param bool get_sum: whether to return checksums or 0s
+        :return: the checksum of each piece, or 0 if get_sum is False
+        :rtype: list(int)
+        :raise SpinnmanInvalidParameterException:
+            If pieces to be written on the same chip overlap
+        """
+        checksums: List[int] = list()
+        by_chip: Dict[XY, List[Tuple[int, memoryview]]] = defaultdict(list)
+        for x, y, address, data in items:
+            view = memoryview(data).cast("B")
+            checksums.append(_checksum(view) if get_sum else 0)
+            if len(view):
+                by_chip[x, y].append((address, view))
+
+        # Check everything before anything is sent, so that a bad batch
+        # does not leave a partial write behind
+        for (x, y), chip_items in by_chip.items():
+            chip_items.sort(key=lambda item: item[0])
+            self.__check_no_overlap(x, y, chip_items)
+
         with self._collect_responses():
-            while n_bytes_to_write > 0:
-                bytes_to_send = min(n_bytes_to_write, UDP_MESSAGE_MAX_SIZE)
-                data_array = data[data_offset:data_offset + bytes_to_send]
+            for (x, y), chip_items in by_chip.items():
+                self.__write_chip_items((x, y, cpu), chip_items)
+        return checksums
 
-                self._send_request(
-                    packet_class(base_address + offset, data_array))
+    @staticmethod
+    def __check_no_overlap(
+            x: int, y: int, items: List[Tuple[int, memoryview]]):
+        """
+        :param items: The (address, data) of the pieces, sorted by address
+        :raise SpinnmanInvalidParameterException: If any pieces overlap
+        """
+        end = items[0][0]
+        for address, view in items:
+            if address < end:
+                raise SpinnmanInvalidParameterException(
+                    "items", f"{(x, y)}:{address:#x}",
+                    "Items to write to the same chip must not overlap")
+            end = address + len(view)
+
+    def __write_chip_items(
+            self, coordinates: XYP, items: List[Tuple[int, memoryview]]):
+        """
+        Write pieces of data to a chip, filling each packet with as much of
+        the pieces as are next to each other.
 
-                n_bytes_to_write -= bytes_to_send
-                offset += bytes_to_send
-                data_offset += bytes_to_send
-        if not get_sum:
-            return 0
-        np_data = numpy.array(data, dtype=uint8)
-        np_sum = int(numpy.sum(np_data.view(uint32), dtype=uint32))
-        return np_sum & _UNSIGNED_WORD
+        :param items: The (address, data) of the pieces, sorted by address,
+            which do not overlap
+        """
+        packet = bytearray()
+        packet_address = items[0][0]
+        for address, view in items:
+            if address > packet_address + len(packet):
+                if packet:
+                    self._send_request(
+                        WriteMemory(coordinates, packet_address, packet))
+                packet = bytearray()
+                packet_address = address
+            offset = 0
+            while offset < len(view):
+                n_bytes = min(
+                    len(view) - offset, UDP_MESSAGE_MAX_SIZE - len(packet))
+                packet += view[offset:offset + n_bytes]
+                offset += n_bytes
+                if len(packet) == UDP_MESSAGE_MAX_SIZE:
+                    self._send_request(
+                        WriteMemory(coordinates, packet_address, packet))
+                    packet_address += len(packet)
+                    packet = bytearray()
+        if packet:
+            self._send_request(
+                WriteMemory(coordinates, packet_address, packet))
+
+    def _write_memory_from_bytearray(
+            self, base_address: int, data: Union[bytes, bytearray],
+            data_offset: int, n_bytes: int, packet_class: Callable[
+                [int, memoryview], AbstractSCPRequest[CheckOKResponse]],
+            get_sum: bool) -> int:
+        view = memoryview(data).cast("B")[
+            data_offset:data_offset + int(n_bytes)]
+        checksum = WordChecksum()
+        with self._collect_responses():
+            for offset in range(0, len(view), _BLOCK_SIZE):
+                block = view[offset:offset + _BLOCK_SIZE]
+                if get_sum:
+                    checksum.update(block)
+                self.__send_block(
+                    base_address + offset, block, packet_class)
+        return checksum.value
 
     def _write_memory_from_reader(
             self, base_address: int, reader: BinaryIO, n_bytes: int,
             packet_class: Callable[
-                [int, bytes], AbstractSCPRequest[CheckOKResponse]],
+                [int, memoryview], AbstractSCPRequest[CheckOKResponse]],
             with_sum: bool) -> int:
         offset = 0
         n_bytes_to_write = int(n_bytes)
-        chksum = 0
+        checksum = WordChecksum()
         with self._collect_responses():
             while n_bytes_to_write > 0:
-                data_array = reader.read(
-                    min(n_bytes_to_write, UDP_MESSAGE_MAX_SIZE))
-                bytes_to_send = len(data_array)
-                self._send_request(packet_class(
-                    base_address + offset, data_array))
-
-                n_bytes_to_write -= bytes_to_send
-                offset += bytes_to_send
-
+                block = reader.read(min(n_bytes_to_write, _BLOCK_SIZE))
+                if not block:
+                    # What has been sent is still waited for
+                    break
                 if with_sum:
-                    np_data = numpy.frombuffer(data_array, dtype=uint8)
-                    np_sum = int(numpy.sum(np_data.view(uint32)))
-                    chksum = (chksum + np_sum) & _UNSIGNED_WORD
+                    checksum.update(block)
+                self.__send_block(
+                    base_address + offset, memoryview(block), packet_class)
+                n_bytes_to_write -= len(block)
+                offset += len(block)
+        if n_bytes_to_write > 0:
+            raise SpinnmanIOException(
+                f"Reader ended after {offset} of {int(n_bytes)} bytes")
+        return checksum.value
 
-        return chksum
+    def __send_block(
+            self, base_address: int, block: memoryview,
+            packet_class: Callable[
+                [int, memoryview], AbstractSCPRequest[CheckOKResponse]]):
+        """
+        Send a block of data as packets that are as full as possible.
+        """
+        for offset in range(0, len(block), UDP_MESSAGE_MAX_SIZE):
+            self._send_request(packet_class(
+                base_address + offset,
+                block[offset:offset + UDP_MESSAGE_MAX_SIZE]))
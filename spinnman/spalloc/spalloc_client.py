@@ -23,7 +23,7 @@ import struct
 import threading
 from time import sleep
 from typing import (Any, ContextManager, Callable, Dict, FrozenSet, Iterable,
-                    Iterator, List, Mapping, Optional, Tuple, cast)
+                    Iterator, List, Mapping, Optional, Tuple, Union, cast)
 from urllib.parse import urlparse, urlunparse, ParseResult
 
 from packaging.version import Version
@@ -818,7 +818,7 @@ class _ProxiedConnection(metaclass=AbstractBase):
         self.__ws = None
         self.__receiver = None
 
-    def _send(self, message: bytes):
+    def _send(self, message: Union[bytes, bytearray]):
         self._throw_if_closed()
         # Put the header on the front and send it
         if not self.__ws:
@@ -911,7 +911,7 @@ class _ProxiedBidirectionalConnection(
         self._close()
 
     @overrides(SpallocProxiedConnection.send)
-    def send(self, data: bytes):
+    def send(self, data: Union[bytes, bytearray, memoryview]):
         if not isinstance(data, (bytes, bytearray)):
             data = bytes(data)
         self._send(data)
@@ -975,7 +975,7 @@ class _ProxiedUnboundConnection(
         self._close()
 
     @overrides(SpallocProxiedConnection.send)
-    def send(self, data: bytes):
+    def send(self, data: Union[bytes, bytearray, memoryview]):
         self._throw_if_closed()
         raise IOError("socket is not open for sending")
 
@@ -16,7 +16,7 @@ API of the client for the Spalloc web service.
 """
 
 import struct
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 from spinn_utilities.overrides import overrides
 from spinn_utilities.typing.coords import XY
@@ -57,7 +57,7 @@ class SpallocEIEIOListener(
         return read_eieio_data_message(data, 0)
 
     @overrides(SpallocProxiedConnection.send)
-    def send(self, data: bytes):
+    def send(self, data: Union[bytes, bytearray, memoryview]):
         """
         .. note::
             This class does not allow sending.
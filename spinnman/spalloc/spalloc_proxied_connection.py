@@ -14,7 +14,7 @@
 """
 API of the client for the Spalloc web service.
 """
-from typing import Optional
+from typing import Optional, Union
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 from spinnman.connections.abstract_classes import Listenable
 
@@ -26,7 +26,7 @@ class SpallocProxiedConnection(Listenable, metaclass=AbstractBase):
     __slots__ = ()
 
     @abstractmethod
-    def send(self, data: bytes):
+    def send(self, data: Union[bytes, bytearray, memoryview]):
         """
         Send a message on an open socket.
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import struct
 from typing import Optional, Tuple
 from spinn_utilities.abstract_base import AbstractBase
@@ -39,6 +40,21 @@ class SpallocSCPConnection(
     def __init__(self, x, y):
         super(SpallocSCPConnection, self).__init__(x, y)
 
+    @overrides(SCAMPConnection.fileno)
+    def fileno(self) -> int:
+        # Messages arrive through the proxy, never on the local socket
+        raise io.UnsupportedOperation(
+            "proxied connections cannot be waited on with selectors")
+
+    @overrides(SCAMPConnection.receive_into)
+    def receive_into(
+            self, buffer: bytearray, timeout: Optional[float] = None) -> int:
+        # Messages arrive through the proxy, never on the local socket
+        data = self.receive(timeout)
+        n_bytes = min(len(data), len(buffer))
+        buffer[:n_bytes] = data[:n_bytes]
+        return n_bytes
+
     @overrides(SCAMPConnection.receive_sdp_message)
     def receive_sdp_message(
             self, timeout: Optional[float] = None) -> SDPMessage:
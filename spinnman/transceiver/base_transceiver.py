@@ -19,6 +19,7 @@ import os
 import random
 import struct
 from contextlib import contextmanager, suppress
+import hashlib
 import logging
 import socket
 from threading import Condition
@@ -45,7 +46,7 @@ from spinnman.constants import (
     UDP_BOOT_CONNECTION_DEFAULT_PORT, NO_ROUTER_DIAGNOSTIC_FILTERS,
     ROUTER_REGISTER_BASE_ADDRESS, ROUTER_DEFAULT_FILTERS_MAX_POSITION,
     ROUTER_FILTER_CONTROLS_OFFSET, ROUTER_DIAGNOSTIC_FILTER_SIZE, N_RETRIES,
-    BOOT_RETRIES, POWER_CYCLE_WAIT_TIME_IN_SECONDS)
+    BOOT_RETRIES, POWER_CYCLE_WAIT_TIME_IN_SECONDS, SCP_TIMEOUT)
 from spinnman.data import SpiNNManDataView
 from spinnman.exceptions import (
     SpinnmanInvalidParameterException, SpinnmanException, SpinnmanIOException,
@@ -53,7 +54,7 @@ from spinnman.exceptions import (
     SpinnmanUnexpectedResponseCodeException,
     SpiNNManCoresNotInStateException)
 from spinnman.model import (
-    CPUInfo, CPUInfos, DiagnosticFilter, ChipSummaryInfo,
+    CPUInfo, CPUInfos, DiagnosticFilter, ChipSummaryInfo, ExecutableTargets,
     IOBuffer, MachineDimensions, RouterDiagnostics, VersionInfo)
 from spinnman.model.enums import (
     CPUState, SDP_PORTS, SDP_RUNNING_MESSAGE_CODES, UserRegister)
@@ -79,7 +80,8 @@ from spinnman.processes import (
     GetMachineProcess, GetVersionProcess,
     MallocSDRAMProcess, WriteMemoryProcess, ReadMemoryProcess,
     GetCPUInfoProcess, GetExcludeCPUInfoProcess, GetIncludeCPUInfoProcess,
-    ReadIOBufProcess, ApplicationRunProcess,
+    ReadIOBufProcess, FollowIOBufProcess, ApplicationRunProcess,
+    CheckConnectionsProcess, GetIPAddressesProcess,
     LoadFixedRouteRoutingEntryProcess, FixedConnectionSelector,
     ReadFixedRouteRoutingEntryProcess,
     LoadMultiCastRoutesProcess, GetTagsProcess, GetMultiCastRoutesProcess,
@@ -107,10 +109,16 @@ _CONNECTION_CHECK_RETRIES = 3
 INITIAL_FIND_SCAMP_RETRIES_COUNT = 3
 
 _TWO_BYTES = struct.Struct("<BB")
-_FOUR_BYTES = struct.Struct("<BBBB")
 _ONE_WORD = struct.Struct("<I")
 _ONE_LONG = struct.Struct("<Q")
 _EXECUTABLE_ADDRESS = 0x67800000
+# How often to ask whether SCAMP is running after a boot, and for how long
+_BOOT_POLL_INTERVAL = 0.1
+_BOOT_READY_TIMEOUT = 5.0
+# How much longer to wait between state polls each time nothing changes,
+# up to a maximum multiple of the requested time between polls
+_POLL_BACK_OFF = 1.5
+_MAX_POLL_BACK_OFF = 10
 
 _POWER_CYCLE_WARNING = (
     "When power-cycling a board, it is recommended that you wait for 30 "
@@ -376,18 +384,39 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         :raise SpinnmanUnexpectedResponseCodeException:
             If a response indicates an error during the exchange
         """
-        conn = SCAMPConnection(remote_host=ip_address, chip_x=x, chip_y=y)
-
-        # check if it works
-        chip_info = self._check_connection(conn)
-        if chip_info is not None and chip_info.ethernet_ip_address is not None:
-            self._all_connections.add(conn)
-            self._udp_scamp_connections[chip_info.ethernet_ip_address] = conn
-            self._scamp_connections.append(conn)
-        else:
-            logger.warning(
-                "Additional Ethernet connection on {} at chip {}, {} "
-                "cannot be contacted", ip_address, x, y)
+        self.__check_and_add_scamp_connections({(x, y): ip_address})
+
+    def __check_and_add_scamp_connections(self, ip_addresses: Dict[XY, str]):
+        """
+        Open connections to many Ethernet chips, and add those that work.
+        The connections are all checked at once.
+
+        :param dict(tuple(int,int),str) ip_addresses:
+            The IP address of each chip to connect to
+        """
+        if not ip_addresses:
+            return
+        connections = [
+            SCAMPConnection(remote_host=ip_address, chip_x=x, chip_y=y)
+            for (x, y), ip_address in ip_addresses.items()]
+
+        # check which work
+        chip_infos = CheckConnectionsProcess(connections).check_connections(
+            _CONNECTION_CHECK_RETRIES)
+        for conn in connections:
+            x, y = conn.chip_x, conn.chip_y
+            chip_info = chip_infos.get((x, y))
+            if (chip_info is not None and
+                    chip_info.ethernet_ip_address is not None):
+                self._all_connections.add(conn)
+                self._udp_scamp_connections[
+                    chip_info.ethernet_ip_address] = conn
+                self._scamp_connections.append(conn)
+            else:
+                conn.close()
+                logger.warning(
+                    "Additional Ethernet connection on {} at chip {}, {} "
+                    "cannot be contacted", ip_addresses[x, y], x, y)
 
     @overrides(Transceiver.discover_scamp_connections)
     def discover_scamp_connections(self) -> None:
@@ -396,27 +425,18 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
 
         # Find all the new connections via the machine Ethernet-connected chips
         version = SpiNNManDataView.get_machine_version()
-        for x, y in version.get_potential_ethernet_chips(
-                dims.width, dims.height):
-            ip_addr_item = SystemVariableDefinition.ethernet_ip_address
-            try:
-                # TODO avoid here_is_x,y if read_memory fails
-                data = self.read_memory(
-                    x, y,
-                    SYSTEM_VARIABLE_BASE_ADDRESS + ip_addr_item.offset, 4)
-            except SpinnmanGenericProcessException:
-                continue
-            ip = _FOUR_BYTES.unpack_from(data)
-            ip_address = f"{ip[0]}.{ip[1]}.{ip[2]}.{ip[3]}"
+        process = GetIPAddressesProcess(self._scamp_connection_selector)
+        ip_addresses = process.get_ip_addresses(
+            version.get_potential_ethernet_chips(dims.width, dims.height))
+        for ip_address in ip_addresses.values():
             logger.info(ip_address)
-            self._check_and_add_scamp_connections(x, y, ip_address)
+        self.__check_and_add_scamp_connections(ip_addresses)
         self._scamp_connection_selector = MostDirectConnectionSelector(
             self._scamp_connections)
 
     @overrides(Transceiver.add_scamp_connections)
     def add_scamp_connections(self, connections: Dict[XY, str]):
-        for ((x, y), ip_address) in connections.items():
-            self._check_and_add_scamp_connections(x, y, ip_address)
+        self.__check_and_add_scamp_connections(connections)
         self._scamp_connection_selector = MostDirectConnectionSelector(
             self._scamp_connections)
 
@@ -477,7 +497,8 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             self, chip_x: int = AbstractSCPRequest.DEFAULT_DEST_X_COORD,
             chip_y: int = AbstractSCPRequest.DEFAULT_DEST_Y_COORD,
             connection_selector: Optional[ConnectionSelector] = None,
-            n_retries: int = N_RETRIES) -> VersionInfo:
+            n_retries: int = N_RETRIES,
+            timeout: float = SCP_TIMEOUT) -> VersionInfo:
         """
         Get the version of SCAMP which is running on the board.
 
@@ -487,6 +508,7 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             the connection to send the SCAMP version
             or `None` (if `None` then a random SCAMP connection is used).
         :param int n_retries:
+        :param float timeout: The time to wait for each response
         :return: The version identifier
         :rtype: VersionInfo
         :raise SpinnmanIOException:
@@ -499,7 +521,7 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         """
         if connection_selector is None:
             connection_selector = self._scamp_connection_selector
-        process = GetVersionProcess(connection_selector, n_retries)
+        process = GetVersionProcess(connection_selector, n_retries, timeout)
         return process.get_version(x=chip_x, y=chip_y, p=0)
 
     @property
@@ -538,9 +560,21 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
                 self.boot_led_0_value
         boot_messages = SpinnakerBootMessages(
             extra_boot_values=extra_boot_values)
-        for boot_message in boot_messages.messages:
-            self._boot_send_connection.send_boot_message(boot_message)
-        time.sleep(2.0)
+        self._boot_send_connection.send_boot_packets(boot_messages.packets)
+        self.__wait_for_scamp()
+
+    def __wait_for_scamp(self):
+        """
+        Wait until SCAMP answers after a boot, asking for its version
+        every :py:const:`_BOOT_POLL_INTERVAL` seconds, up to
+        :py:const:`_BOOT_READY_TIMEOUT` seconds.  Whether it answered is
+        left for the caller to find out.
+        """
+        n_polls = int(_BOOT_READY_TIMEOUT / _BOOT_POLL_INTERVAL)
+        with suppress(SpinnmanGenericProcessException,
+                      SpinnmanTimeoutException):
+            self._get_scamp_version(
+                n_retries=n_polls, timeout=_BOOT_POLL_INTERVAL)
 
     def _call(self, req: AbstractSCPRequest[_AbstractSCPResponse],
               **kwargs) -> _AbstractSCPResponse:
@@ -811,6 +845,13 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
         process = ReadIOBufProcess(self._scamp_connection_selector)
         return process.read_iobuf(self._iobuf_size, core_subsets)
 
+    @overrides(Transceiver.follow_iobuf)
+    def follow_iobuf(self, core_subsets: CoreSubsets,
+                     interval: float = 1.0) -> Iterator[IOBuffer]:
+        process = FollowIOBufProcess(
+            self._scamp_connection_selector, core_subsets)
+        return process.follow(interval)
+
     @overrides(Transceiver.get_core_state_count)
     def get_core_state_count(
             self, app_id: int, state: CPUState,
@@ -824,6 +865,20 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             chip_xys = xys
         return process.get_n_cores_in_state(chip_xys, app_id, state)
 
+    @overrides(Transceiver.get_core_state_counts)
+    def get_core_state_counts(
+            self, app_id: int, states: Iterable[CPUState],
+            xys: Optional[Iterable[Tuple[int, int]]] = None
+            ) -> Dict[CPUState, int]:
+        process = GetNCoresInStateProcess(self._scamp_connection_selector)
+        chip_xys: Iterable[Tuple[int, int]]
+        if xys is None:
+            machine = SpiNNManDataView.get_machine()
+            chip_xys = machine.ethernet_connected_chips
+        else:
+            chip_xys = xys
+        return process.get_n_cores_in_states(chip_xys, app_id, states)
+
     @contextmanager
     def __flood_execute_lock(self) -> Iterator[Condition]:
         """
@@ -864,6 +919,46 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
                 self._scamp_connection_selector)
             copy_run.run(n_bytes, app_id, core_subsets, chksum, wait)
 
+    @overrides(Transceiver.execute_binaries)
+    def execute_binaries(
+            self, executable_targets: ExecutableTargets, app_id: int, *,
+            wait: bool = False):
+        binaries = self.__plan_binaries(executable_targets)
+        if not binaries:
+            return
+        # Lock against other executables
+        with self.__flood_execute_lock():
+            copy_run = ApplicationCopyRunProcess(
+                self._scamp_connection_selector)
+            copy_run.load_and_run(binaries, _EXECUTABLE_ADDRESS, app_id, wait)
+
+    @staticmethod
+    def __plan_binaries(executable_targets: ExecutableTargets) -> List[
+            Tuple[bytes, CoreSubsets]]:
+        """
+        Read the binaries of some executable targets, merging the cores of
+        binary files that have the same contents so that each is loaded
+        only once.
+
+        :param ExecutableTargets executable_targets:
+        :return: The contents of each distinct binary, and its cores
+        :rtype: list(tuple(bytes, ~spinn_machine.CoreSubsets))
+        """
+        binaries: Dict[bytes, Tuple[bytes, CoreSubsets]] = dict()
+        for binary in executable_targets.binaries:
+            try:
+                with open(binary, "rb") as f:
+                    data = f.read()
+            except OSError as e:
+                raise SpinnmanIOException(
+                    f"Could not read binary {binary}") from e
+            digest = hashlib.sha256(data).digest()
+            if digest not in binaries:
+                binaries[digest] = (data, CoreSubsets())
+            binaries[digest][1].add_core_subsets(
+                executable_targets.get_cores_for_binary(binary))
+        return list(binaries.values())
+
     def _power_on_machine(self) -> None:
         """
         Power on the whole machine.
@@ -966,6 +1061,13 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
                 (x, y, cpu), base_address, data, offset, n_bytes, get_sum)
         return n_bytes, chksum
 
+    @overrides(Transceiver.write_memory_batch)
+    def write_memory_batch(
+            self, items: Iterable[Tuple[int, int, int, bytes]], *,
+            cpu: int = 0, get_sum: bool = False) -> List[int]:
+        process = WriteMemoryProcess(self._scamp_connection_selector)
+        return process.write_memory_batch(items, cpu, get_sum)
+
     @overrides(Transceiver.write_user)
     def write_user(
             self, x: int, y: int, p: int, user: UserRegister, value: int):
@@ -983,6 +1085,26 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
             logger.info(self._where_is_xy(x, y))
             raise
 
+    @overrides(Transceiver.read_memory_into)
+    def read_memory_into(
+            self, x: int, y: int, base_address: int, buffer,
+            offset: int = 0, length: Optional[int] = None,
+            cpu: int = 0) -> int:
+        try:
+            process = ReadMemoryProcess(self._scamp_connection_selector)
+            return process.read_memory_into(
+                (x, y, cpu), base_address, buffer, offset, length)
+        except Exception:
+            logger.info(self._where_is_xy(x, y))
+            raise
+
+    @overrides(Transceiver.read_memory_batch)
+    def read_memory_batch(
+            self, regions: Iterable[Tuple[int, int, int, int]],
+            cpu: int = 0) -> List[bytearray]:
+        process = ReadMemoryProcess(self._scamp_connection_selector)
+        return process.read_memory_batch(regions, cpu)
+
     @overrides(Transceiver.read_word)
     def read_word(
             self, x: int, y: int, base_address: int, cpu: int = 0) -> int:
@@ -1040,76 +1162,122 @@ class BaseTransceiver(ExtendableTransceiver, metaclass=AbstractBase):
                 CPUState.RUN_TIME_EXCEPTION, CPUState.WATCHDOG)),
             counts_between_full_check: int = 100,
             progress_bar: Optional[ProgressBar] = None):
+        n_cores = len(all_core_subsets)
+        target_states = self.__state_set(cpu_states)
+        count_states = target_states | error_states
+        timeout_time = None if timeout is None else time.time() + timeout
+        # Cores seen in a target state by a full check are not counted again
+        # by the next full check; errors are still looked for on every core,
+        # as a core can fail after it has reached a target state
+        waiting_cores = all_core_subsets
+        n_known_ready = 0
         processors_ready = 0
         max_processors_ready = 0
-        timeout_time = None if timeout is None else time.time() + timeout
+        poll_delay = time_between_polls
         tries = 0
-        target_states = self.__state_set(cpu_states)
-        while (processors_ready < len(all_core_subsets) and
-               (timeout_time is None or time.time() < timeout_time)):
-
-            # Get the number of processors in the ready states
-            processors_ready = 0
-            for cpu_state in target_states:
-                processors_ready += self.get_core_state_count(
-                    app_id, cpu_state)
-            if progress_bar:
-                if processors_ready > max_processors_ready:
-                    progress_bar.update(
-                        processors_ready - max_processors_ready)
-                    max_processors_ready = processors_ready
-            # If the count is too small, check for error states
-            if processors_ready < len(all_core_subsets):
-                is_error = False
-                for cpu_state in error_states:
-                    error_cores = self.get_core_state_count(app_id, cpu_state)
-                    if error_cores > 0:
-                        is_error = True
-                if is_error:
+        phase_times: Dict[str, float] = defaultdict(float)
+        try:
+            while (processors_ready < n_cores and
+                   (timeout_time is None or time.time() < timeout_time)):
+
+                # Count the target and error states in one round
+                start = time.perf_counter()
+                counts = self.get_core_state_counts(app_id, count_states)
+                phase_times["counting"] += time.perf_counter() - start
+                processors_ready = sum(
+                    counts[cpu_state] for cpu_state in target_states)
+                if progress_bar:
+                    if processors_ready > max_processors_ready:
+                        progress_bar.update(
+                            processors_ready - max_processors_ready)
+                if processors_ready >= n_cores:
+                    break
+
+                # If any core is in an error state, find it and stop
+                if any(counts[cpu_state] for cpu_state in error_states):
+                    start = time.perf_counter()
                     error_core_states = self.get_cpu_infos(
                         all_core_subsets, error_states, True)
+                    phase_times["error check"] += time.perf_counter() - start
                     if len(error_core_states) > 0:
                         self.__log_where_is_info(error_core_states)
                         raise SpiNNManCoresNotInStateException(
                             timeout, target_states, error_core_states)
 
-                # If we haven't seen an error, increase the tries, and
-                # do a full check if required
+                # Poll less often while nothing changes
+                if processors_ready > max_processors_ready:
+                    max_processors_ready = processors_ready
+                    poll_delay = time_between_polls
+                else:
+                    poll_delay = min(
+                        poll_delay * _POLL_BACK_OFF,
+                        time_between_polls * _MAX_POLL_BACK_OFF)
+
+                # Every so often, check the cores that are still waiting
                 tries += 1
                 if tries >= counts_between_full_check:
-                    cores_in_state = self.get_cpu_infos(
-                        all_core_subsets, target_states, include=True)
-                    # convert to a list of xyp values
-                    cores_in_state_xyps = list(cores_in_state)
-                    processors_ready = len(cores_in_state_xyps)
                     tries = 0
-
-                    # iterate over the cores waiting to finish and see
-                    # which ones we're missing
+                    start = time.perf_counter()
+                    cores_in_state = self.get_cpu_infos(
+                        waiting_cores, target_states, include=True)
+                    phase_times["full check"] += time.perf_counter() - start
+                    n_known_ready += len(cores_in_state)
+                    waiting_cores = self.__cores_not_in(
+                        waiting_cores, cores_in_state)
+                    processors_ready = n_known_ready
                     if get_config_bool("Machine", "report_waiting_logs"):
-                        for core_subset in all_core_subsets.core_subsets:
+                        for core_subset in waiting_cores.core_subsets:
                             for p in core_subset.processor_ids:
-                                if ((core_subset.x, core_subset.y, p) not in
-                                        cores_in_state_xyps):
-                                    logger.warning(
-                                        "waiting on {}:{}:{}",
-                                        core_subset.x, core_subset.y, p)
+                                logger.warning(
+                                    "waiting on {}:{}:{}",
+                                    core_subset.x, core_subset.y, p)
 
                 # If we're still not in the correct state, wait a bit
-                if processors_ready < len(all_core_subsets):
-                    time.sleep(time_between_polls)
-
-        # If we haven't reached the final state, do a final full check
-        if processors_ready < len(all_core_subsets):
-            cores_not_in_state = self.get_cpu_infos(
-                all_core_subsets, cpu_states, include=False)
-
-            # If we are sure we haven't reached the final state,
-            # report a timeout error
-            if len(cores_not_in_state) != 0:
-                self.__log_where_is_info(cores_not_in_state)
-                raise SpiNNManCoresNotInStateException(
-                    timeout, target_states, cores_not_in_state)
+                if processors_ready < n_cores:
+                    if timeout_time is not None:
+                        poll_delay = max(0.0, min(
+                            poll_delay, timeout_time - time.time()))
+                    start = time.perf_counter()
+                    time.sleep(poll_delay)
+                    phase_times["sleeping"] += time.perf_counter() - start
+
+            # If we haven't reached the final state, do a final full check
+            if processors_ready < n_cores:
+                start = time.perf_counter()
+                cores_not_in_state = self.get_cpu_infos(
+                    all_core_subsets, cpu_states, include=False)
+                phase_times["full check"] += time.perf_counter() - start
+
+                # If we are sure we haven't reached the final state,
+                # report a timeout error
+                if len(cores_not_in_state) != 0:
+                    self.__log_where_is_info(cores_not_in_state)
+                    raise SpiNNManCoresNotInStateException(
+                        timeout, target_states, cores_not_in_state)
+        finally:
+            logger.debug(
+                "Waiting for {} cores to be in {} took {}", n_cores,
+                sorted(state.name for state in target_states),
+                ", ".join(f"{phase} {seconds:.3f}s"
+                          for phase, seconds in phase_times.items()))
+
+    @staticmethod
+    def __cores_not_in(
+            core_subsets: CoreSubsets, cpu_infos: CPUInfos) -> CoreSubsets:
+        """
+        Get the cores of the subsets that do not have an entry in the infos.
+
+        :param ~spinn_machine.CoreSubsets core_subsets:
+        :param CPUInfos cpu_infos:
+        :rtype: ~spinn_machine.CoreSubsets
+        """
+        remaining = CoreSubsets()
+        for core_subset in core_subsets.core_subsets:
+            x, y = core_subset.x, core_subset.y
+            for p in core_subset.processor_ids:
+                if not cpu_infos.is_core(x, y, p):
+                    remaining.add_processor(x, y, p)
+        return remaining
 
     @overrides(Transceiver.send_signal)
     def send_signal(self, app_id: int, signal: Signal):
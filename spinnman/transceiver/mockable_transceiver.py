@@ -15,7 +15,7 @@
 # pylint: disable=too-many-arguments
 
 from typing import (
-    BinaryIO, Collection, Dict, FrozenSet, Iterable,
+    BinaryIO, Collection, Dict, FrozenSet, Iterable, Iterator,
     List, Optional, Set, Tuple, Union)
 from spinn_utilities.overrides import overrides
 from spinn_utilities.progress_bar import ProgressBar
@@ -32,8 +32,8 @@ from spinnman.processes import ConnectionSelector, FixedConnectionSelector
 from spinnman.messages.scp.enums import Signal
 from spinnman.messages.sdp import SDPMessage
 from spinnman.model import (
-    CPUInfos, DiagnosticFilter, IOBuffer, RouterDiagnostics,
-    VersionInfo)
+    CPUInfos, DiagnosticFilter, ExecutableTargets, IOBuffer,
+    RouterDiagnostics, VersionInfo)
 from spinnman.model.enums import CPUState, UserRegister
 from spinnman.transceiver.transceiver import Transceiver
 from spinnman.transceiver.extendable_transceiver import ExtendableTransceiver
@@ -103,12 +103,24 @@ class MockableTransceiver(ExtendableTransceiver):
                   ) -> Iterable[IOBuffer]:
         raise NotImplementedError("Needs to be mocked")
 
+    @overrides(Transceiver.follow_iobuf)
+    def follow_iobuf(self, core_subsets: CoreSubsets,
+                     interval: float = 1.0) -> Iterator[IOBuffer]:
+        raise NotImplementedError("Needs to be mocked")
+
     @overrides(Transceiver.get_core_state_count)
     def get_core_state_count(
             self, app_id: int, state: CPUState,
             xys: Optional[Iterable[Tuple[int, int]]] = None) -> int:
         raise NotImplementedError("Needs to be mocked")
 
+    @overrides(Transceiver.get_core_state_counts)
+    def get_core_state_counts(
+            self, app_id: int, states: Iterable[CPUState],
+            xys: Optional[Iterable[Tuple[int, int]]] = None
+            ) -> Dict[CPUState, int]:
+        raise NotImplementedError("Needs to be mocked")
+
     @overrides(Transceiver.execute_flood)
     def execute_flood(
             self, core_subsets: CoreSubsets,
@@ -116,6 +128,12 @@ class MockableTransceiver(ExtendableTransceiver):
             n_bytes: Optional[int] = None, wait: bool = False):
         pass
 
+    @overrides(Transceiver.execute_binaries)
+    def execute_binaries(
+            self, executable_targets: ExecutableTargets, app_id: int, *,
+            wait: bool = False):
+        pass
+
     @overrides(Transceiver.read_fpga_register)
     def read_fpga_register(
             self, fpga_num: int, register: int, board: int = 0) -> int:
@@ -142,6 +160,17 @@ class MockableTransceiver(ExtendableTransceiver):
         # Hope the return is never used as it will be wrong
         return (-1, -1)
 
+    @overrides(Transceiver.write_memory_batch)
+    def write_memory_batch(
+            self, items: Iterable[Tuple[int, int, int, bytes]], *,
+            cpu: int = 0, get_sum: bool = False) -> List[int]:
+        checksums = list()
+        for x, y, base_address, data in items:
+            self.write_memory(x, y, base_address, data, cpu=cpu)
+            checksums.append(-1)
+        # Hope the return is never used as it will be wrong
+        return checksums
+
     @overrides(Transceiver.write_user)
     def write_user(
             self, x: int, y: int, p: int, user: UserRegister, value: int):
@@ -153,6 +182,19 @@ class MockableTransceiver(ExtendableTransceiver):
             cpu: int = 0) -> bytearray:
         raise NotImplementedError("Needs to be mocked")
 
+    @overrides(Transceiver.read_memory_into)
+    def read_memory_into(
+            self, x: int, y: int, base_address: int, buffer,
+            offset: int = 0, length: Optional[int] = None,
+            cpu: int = 0) -> int:
+        raise NotImplementedError("Needs to be mocked")
+
+    @overrides(Transceiver.read_memory_batch)
+    def read_memory_batch(
+            self, regions: Iterable[Tuple[int, int, int, int]],
+            cpu: int = 0) -> List[bytearray]:
+        raise NotImplementedError("Needs to be mocked")
+
     @overrides(Transceiver.read_word)
     def read_word(
             self, x: int, y: int, base_address: int, cpu: int = 0) -> int:
@@ -15,7 +15,7 @@
 # pylint: disable=too-many-arguments
 
 from typing import (
-    BinaryIO, Collection, Dict, FrozenSet, Iterable,
+    BinaryIO, Collection, Dict, FrozenSet, Iterable, Iterator,
     List, Optional, Set, Tuple, Union)
 from spinn_utilities.abstract_base import abstractmethod
 from spinn_utilities.progress_bar import ProgressBar
@@ -29,8 +29,8 @@ from spinnman.connections.udp_packet_connections import (
 from spinnman.messages.scp.enums import Signal
 from spinnman.messages.sdp import SDPMessage
 from spinnman.model import (
-    CPUInfos, DiagnosticFilter, IOBuffer, RouterDiagnostics,
-    VersionInfo)
+    CPUInfos, DiagnosticFilter, ExecutableTargets, IOBuffer,
+    RouterDiagnostics, VersionInfo)
 from spinnman.model.enums import CPUState, UserRegister
 from spinnman.processes import MostDirectConnectionSelector
 
@@ -284,7 +284,8 @@ class Transceiver(object):
             specified, the buffers from all of the cores on all of the chips
             on the board are obtained.
         :return: An iterable of the buffers, which may not be in the order
-            of core_subsets
+            of core_subsets; the buffers are read while they are iterated
+            over, so the caller should not block between them
         :rtype: iterable(IOBuffer)
         :raise SpinnmanIOException:
             If there is an error communicating with the board
@@ -299,6 +300,36 @@ class Transceiver(object):
         # Used by IOBufExtractor
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def follow_iobuf(self, core_subsets: CoreSubsets,
+                     interval: float = 1.0) -> Iterator[IOBuffer]:
+        """
+        Follow the IOBUF buffers of a number of processors while they run,
+        producing each line as it is written.  Each poll reads only the
+        header of the buffer each core is writing and the text added since
+        the last poll, with all the cores read together.
+
+        :param ~spinn_machine.CoreSubsets core_subsets:
+            A set of chips and cores from which to follow the buffers
+        :param float interval: The time between polls, in seconds
+        :return: An unending iterable of the lines; each is an IOBuffer
+            whose text is one line, without its newline.  Text after the
+            last newline is not produced; use
+            :py:meth:`~spinnman.processes.FollowIOBufProcess.flush` to get
+            it.
+        :rtype: iterable(IOBuffer)
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If core_subsets contains invalid items
+            * If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def get_core_state_count(
             self, app_id: int, state: CPUState,
@@ -325,6 +356,31 @@ class Transceiver(object):
         """
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def get_core_state_counts(
+            self, app_id: int, states: Iterable[CPUState],
+            xys: Optional[Iterable[Tuple[int, int]]] = None
+            ) -> Dict[CPUState, int]:
+        """
+        Get a count of the number of cores in each of several states.  All
+        the states are counted in a single round of requests, so this is
+        cheaper than calling :py:meth:`get_core_state_count` for each state.
+
+        :param int app_id:
+            The ID of the application from which to get the counts.
+        :param iterable(CPUState) states: The states to count
+        :param list(int,int) xys: The chips to query, or None for all
+        :return: A count of the cores in each of the states
+        :rtype: dict(CPUState, int)
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def execute_flood(
             self, core_subsets: CoreSubsets,
@@ -374,6 +430,36 @@ class Transceiver(object):
         # run_system_application._load_application
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def execute_binaries(
+            self, executable_targets: ExecutableTargets, app_id: int, *,
+            wait: bool = False):
+        """
+        Start all the binaries of a set of executable targets on their
+        cores, using flood fill.  Binary files with the same contents are
+        loaded once, for all of their cores, and the copying of the
+        binaries around the machine overlaps, so this is faster than
+        calling :py:meth:`execute_flood` for each binary.
+
+        :param ExecutableTargets executable_targets:
+            The binaries to be executed and the cores to execute them on
+        :param int app_id:
+            The ID of the application with which to associate the binaries
+        :param bool wait:
+            True if the processors should enter a "wait" state on loading
+        :raise SpinnmanIOException:
+            * If there is an error communicating with the board
+            * If there is an error reading a binary
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If one of the specified cores is not valid
+            * If `app_id` is an invalid application ID
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def read_fpga_register(
             self, fpga_num: int, register: int, board: int = 0) -> int:
@@ -470,6 +556,37 @@ class Transceiver(object):
         """
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def write_memory_batch(
+            self, items: Iterable[Tuple[int, int, int, bytes]], *,
+            cpu: int = 0, get_sum: bool = False) -> List[int]:
+        """
+        Write many pieces of data to the SDRAM on the board at once.  The
+        writes of all the pieces share the same pipelines, so the writes to
+        different boards happen at the same time, and pieces on the same chip
+        that are next to each other are written with the same packets.
+
+        :param items:
+            The pieces to write, each as (x, y, base_address, data), where
+            the data is a bytes, bytearray or other buffer
+        :type items: iterable(tuple(int,int,int,bytes))
+        :param int cpu: The optional CPU to write to
+        :param bool get_sum: whether to return checksums or 0s
+        :return: The checksum of each piece, in the order given (0 if
+            get_sum=False)
+        :rtype: list(int)
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If pieces to be written to the same chip overlap
+            * If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def write_user(
             self, x: int, y: int, p: int, user: UserRegister, value: int):
@@ -527,6 +644,75 @@ class Transceiver(object):
         """
         raise NotImplementedError("abstractmethod")
 
+    @abstractmethod
+    def read_memory_into(
+            self, x: int, y: int, base_address: int, buffer,
+            offset: int = 0, length: Optional[int] = None,
+            cpu: int = 0) -> int:
+        """
+        Read some areas of memory (usually SDRAM) from the board directly
+        into an existing buffer, without allocating memory for the data.
+
+        :param int x:
+            The x-coordinate of the chip where the memory is to be read from
+        :param int y:
+            The y-coordinate of the chip where the memory is to be read from
+        :param int base_address:
+            The address in SDRAM where the region of memory to be read starts
+        :param buffer: Where to put the data; any writable contiguous buffer,
+            such as a bytearray, memoryview, mmap or numpy array
+        :param int offset: Where in the buffer to put the data, in bytes
+        :param length: The length of the data to be read in bytes, or `None`
+            to fill the rest of the buffer
+        :type length: int or None
+        :param int cpu:
+            the core ID used to read the memory of; should usually be 0 when
+            reading from SDRAM, but may be other values when reading from DTCM.
+        :return: The number of bytes read
+        :rtype: int
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If one of `x`, `y`, `cpu`, `base_address` or `length` is invalid
+            * If the buffer is not writable or is too small
+            * If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
+    @abstractmethod
+    def read_memory_batch(
+            self, regions: Iterable[Tuple[int, int, int, int]],
+            cpu: int = 0) -> List[bytearray]:
+        """
+        Read many areas of memory (usually SDRAM) from the board at once.
+        The reads of all the regions share the same pipelines, so the reads
+        from different boards happen at the same time, and regions on the
+        same chip that overlap or touch are read with the same packets.
+
+        :param regions:
+            The regions to read, each as (x, y, base_address, length)
+        :type regions: iterable(tuple(int,int,int,int))
+        :param int cpu:
+            the core ID used to read the memory of; should usually be 0 when
+            reading from SDRAM, but may be other values when reading from DTCM.
+        :return: The data read from each region, in the order given
+        :rtype: list(bytearray)
+        :raise SpinnmanIOException:
+            If there is an error communicating with the board
+        :raise SpinnmanInvalidPacketException:
+            If a packet is received that is not in the valid format
+        :raise SpinnmanInvalidParameterException:
+            * If one of the coordinates, addresses or lengths is invalid
+            * If a packet is received that has invalid parameters
+        :raise SpinnmanUnexpectedResponseCodeException:
+            If a response indicates an error during the exchange
+        """
+        raise NotImplementedError("abstractmethod")
+
     @abstractmethod
     def read_word(
             self, x: int, y: int, base_address: int, cpu: int = 0) -> int:
@@ -588,6 +774,11 @@ class Transceiver(object):
         Waits for the specified cores running the given application to be
         in some target state or states. Handles failures.
 
+        The target and error states are counted together in one round of
+        requests.  The time between polls grows while the count does not
+        change, and cores found in a target state by a full check are not
+        checked again.
+
         :param ~spinn_machine.CoreSubsets all_core_subsets:
             the cores to check are in a given sync state
         :param int app_id: the application ID that being used by the simulation
@@ -598,7 +789,8 @@ class Transceiver(object):
         :param float timeout:
             The amount of time to wait in seconds for the cores to reach one
             of the states
-        :param float time_between_polls: Time between checking the state
+        :param float time_between_polls:
+            Time between checking the state while cores are changing state
         :param set(CPUState) error_states:
             Set of states that the application can be in that indicate an
             error, and so should raise an exception
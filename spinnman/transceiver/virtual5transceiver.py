@@ -16,7 +16,7 @@
 from typing import Dict, Iterable, Optional, Union
 from spinn_utilities.overrides import overrides
 from spinn_machine import CoreSubsets, Machine, virtual_machine
-from spinnman.constants import N_RETRIES
+from spinnman.constants import N_RETRIES, SCP_TIMEOUT
 from spinnman.exceptions import SpinnmanIOException
 from spinnman.messages.scp.abstract_messages import AbstractSCPRequest
 from spinnman.messages.spinnaker_boot import SystemVariableDefinition
@@ -61,10 +61,11 @@ class Virtual5Transceiver(Version5Transceiver):
             self, chip_x: int = AbstractSCPRequest.DEFAULT_DEST_X_COORD,
             chip_y: int = AbstractSCPRequest.DEFAULT_DEST_Y_COORD,
             connection_selector: Optional[ConnectionSelector] = None,
-            n_retries: int = N_RETRIES) -> VersionInfo:
+            n_retries: int = N_RETRIES,
+            timeout: float = SCP_TIMEOUT) -> VersionInfo:
         try:
             return super()._get_scamp_version(
-                chip_x, chip_y, connection_selector, n_retries)
+                chip_x, chip_y, connection_selector, n_retries, timeout)
         except SpinnmanIOException:
             version = VersionInfo(
                 b'@\x00\x07\x08\xff\x00\x00\x00\x00\x00\x80\x00\x02\x00\x00\n'
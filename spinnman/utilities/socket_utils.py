@@ -18,7 +18,7 @@ apply some consistency to things.
 
 import logging
 import socket
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 from spinn_utilities.log import FormatAdapter
 from spinnman.exceptions import SpinnmanIOException, SpinnmanTimeoutException
 
@@ -129,6 +129,51 @@ def receive_message(
         raise SpinnmanIOException(f"Error receiving: {e}") from e
 
 
+def receive_message_into(
+        sock: socket.socket, timeout: Optional[float], buffer) -> int:
+    """
+    Wrapper round recv_into() system call.
+
+    :return: The number of bytes written into the buffer
+    :rtype: int
+    """
+    try:
+        sock.settimeout(timeout)
+        return sock.recv_into(buffer)
+    except socket.timeout as e:
+        raise SpinnmanTimeoutException("receive", timeout) from e
+    except Exception as e:  # pylint: disable=broad-except
+        raise SpinnmanIOException(f"Error receiving: {e}") from e
+
+
+def receive_messages_into(
+        sock: socket.socket, timeout: Optional[float],
+        buffers: Sequence[memoryview]) -> List[int]:
+    """
+    Wait for a message, then receive it and every other message already
+    queued, up to one for each buffer.  Python does not expose
+    ``recvmmsg()``, so this is a loop of recv_into() system calls, only the
+    first of which waits.
+
+    :param float timeout: How long to wait for the first message
+    :param list(memoryview) buffers: Where to write each message
+    :return: The number of bytes written into each buffer used, in order
+    :rtype: list(int)
+    """
+    sizes = [receive_message_into(sock, timeout, buffers[0])]
+    try:
+        sock.settimeout(0.0)
+        for buffer in buffers[1:]:
+            sizes.append(sock.recv_into(buffer))
+    except (BlockingIOError, InterruptedError):
+        pass
+    except Exception as e:  # pylint: disable=broad-except
+        raise SpinnmanIOException(f"Error receiving: {e}") from e
+    finally:
+        sock.settimeout(timeout)
+    return sizes
+
+
 def receive_message_and_address(
         sock: socket.socket, timeout: Optional[float], size: int) -> Tuple[
             bytes, Tuple[str, int]]:
@@ -144,7 +189,8 @@ def receive_message_and_address(
         raise SpinnmanIOException(f"Error receiving: {e}") from e
 
 
-def send_message(sock: socket.socket, data: bytes):
+def send_message(
+        sock: socket.socket, data: Union[bytes, bytearray, memoryview]):
     """
     Wrapper round send() system call.
     """
@@ -154,6 +200,25 @@ def send_message(sock: socket.socket, data: bytes):
         raise SpinnmanIOException(f"Error sending: {e}") from e
 
 
+def send_messages(sock: socket.socket, datagrams: Iterable[bytes]) -> int:
+    """
+    Wrapper round a loop of send() system calls, as Python does not expose
+    ``sendmmsg()``.  Each message is sent whole by one call, or an error is
+    raised.
+
+    :return: The number of messages sent
+    :rtype: int
+    """
+    n_sent = 0
+    try:
+        for data in datagrams:
+            sock.send(data)
+            n_sent += 1
+    except Exception as e:  # pylint: disable=broad-except
+        raise SpinnmanIOException(f"Error sending: {e}") from e
+    return n_sent
+
+
 def send_message_to_address(
         sock: socket.socket, data: bytes, address: Tuple[str, int]):
     """
@@ -0,0 +1,71 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+from numpy import uint32
+
+_UNSIGNED_WORD = 0xFFFFFFFF
+_WORD_SIZE = 4
+
+
+class WordChecksum(object):
+    """
+    A running checksum of data as SCAMP computes it: the sum, modulo
+    2^32, of the little-endian words of the data, with any part
+    word at the end padded with zeros.  Data can be added in pieces of any
+    length; the pieces are summed as if they were one block, without
+    copying them.
+    """
+    __slots__ = (
+        "_sum",
+        "_tail")
+
+    def __init__(self):
+        self._sum = 0
+        # The bytes of a part word left over from the last update
+        self._tail = b""
+
+    def update(self, data) -> None:
+        """
+        Add some data to the checksum.
+
+        :param data: The data to add; any contiguous buffer
+        :type data: bytes or bytearray or memoryview
+        """
+        view = memoryview(data).cast("B")
+        if self._tail:
+            n_fill = min(_WORD_SIZE - len(self._tail), len(view))
+            self._tail += bytes(view[:n_fill])
+            view = view[n_fill:]
+            if len(self._tail) < _WORD_SIZE:
+                return
+            self._sum += int.from_bytes(self._tail, "little")
+            self._tail = b""
+        n_words, n_extra = divmod(len(view), _WORD_SIZE)
+        if n_words:
+            self._sum = (self._sum + int(numpy.sum(
+                numpy.frombuffer(view, dtype=uint32, count=n_words),
+                dtype=uint32))) & _UNSIGNED_WORD
+        if n_extra:
+            self._tail = bytes(view[n_words * _WORD_SIZE:])
+
+    @property
+    def value(self) -> int:
+        """
+        The checksum of all the data added so far.
+
+        :rtype: int
+        """
+        return (self._sum + int.from_bytes(self._tail, "little")) & \
+            _UNSIGNED_WORD
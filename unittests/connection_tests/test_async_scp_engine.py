@@ -0,0 +1,97 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+from spinnman.config_setup import unittest_setup
+from spinnman.connections import AsyncSCPEngine
+from spinnman.exceptions import SpinnmanTimeoutException
+from spinnman.processes import FixedConnectionSelector
+from unittests.fake_scamp import FakeSCAMP
+
+
+class TestAsyncSCPEngine(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def _run(self, scamp, coroutine_function, timeout=1.0):
+        connection = scamp.connection()
+
+        async def main():
+            async with AsyncSCPEngine(
+                    FixedConnectionSelector(connection),
+                    timeout=timeout) as engine:
+                return engine, await coroutine_function(engine)
+
+        try:
+            return asyncio.run(main())
+        finally:
+            connection.close()
+            scamp.close()
+
+    def test_read_memory(self):
+        base = 0x60000010
+        engine, data = self._run(
+            FakeSCAMP(), lambda engine: engine.read_memory(0, 0, base, 1000))
+        self.assertEqual(
+            bytes((base + i) & 0xFF for i in range(1000)), bytes(data))
+        self.assertEqual(0, engine.n_resent)
+
+    def test_write_memory(self):
+        scamp = FakeSCAMP()
+        data = bytes(range(256)) * 2 + b"end"
+        self._run(
+            scamp, lambda engine: engine.write_memory(0, 0, 0x1000, data))
+        self.assertEqual(data, b"".join(
+            scamp.written[address] for address in sorted(scamp.written)))
+
+    def test_resend_on_timeout(self):
+        engine, data = self._run(
+            FakeSCAMP(n_drop=2),
+            lambda engine: engine.read_memory(0, 0, 0, 8), timeout=0.2)
+        self.assertEqual(bytes(range(8)), bytes(data))
+        self.assertEqual(2, engine.n_timeouts)
+        self.assertEqual(2, engine.n_resent)
+
+    def test_bad_packet(self):
+        scamp = FakeSCAMP()
+        connection = scamp.connection()
+
+        async def main():
+            async with AsyncSCPEngine(
+                    FixedConnectionSelector(connection)) as engine:
+                # This is waiting when the engine first reads the connection
+                scamp.socket.sendto(
+                    b"\x00\x00", ("127.0.0.1", connection.local_port))
+                return engine, await engine.read_memory(0, 0, 0, 8)
+
+        try:
+            engine, data = asyncio.run(main())
+        finally:
+            connection.close()
+            scamp.close()
+        self.assertEqual(bytes(range(8)), bytes(data))
+        self.assertEqual(1, engine.n_bad_packets)
+        self.assertEqual(0, engine.n_resent)
+
+    def test_timeout(self):
+        with self.assertRaises(SpinnmanTimeoutException):
+            self._run(
+                FakeSCAMP(n_drop=1000),
+                lambda engine: engine.read_memory(0, 0, 0, 8), timeout=0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+from threading import Event
+import time
+import unittest
+from spinnman.config_setup import unittest_setup
+from spinnman.connections import (
+    BatchConnectionListener, ListenerQueuePolicy)
+from spinnman.connections.abstract_classes import Listenable
+from spinnman.connections.udp_packet_connections import (
+    EIEIOConnection, UDPConnection)
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.messages.eieio.data_messages import EIEIODataMessage
+
+
+class _Source(Listenable):
+    """
+    Messages to be listened to, which are added by the test.
+    """
+
+    def __init__(self):
+        self.messages = deque()
+
+    def get_receive_method(self):
+        return self.__receive
+
+    def __receive(self):
+        message = self.messages.popleft()
+        if message == "bad":
+            raise ValueError("bad message")
+        return message
+
+    def is_ready_to_receive(self, timeout=0):
+        if not self.messages and timeout:
+            time.sleep(min(timeout, 0.01))
+        return bool(self.messages)
+
+
+def _wait_for(condition):
+    end = time.monotonic() + 5.0
+    while not condition():
+        if time.monotonic() > end:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+class TestBatchConnectionListener(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_eieio_in_order(self):
+        receiver = EIEIOConnection(local_host="127.0.0.1")
+        sender = EIEIOConnection(
+            remote_host="127.0.0.1", remote_port=receiver.local_port)
+        listener = BatchConnectionListener(receiver, timeout=0.05)
+        batches = list()
+        listener.add_callback(batches.append)
+        listener.start()
+        try:
+            messages = EIEIODataMessage.create_from_arrays(range(5000))
+            sender.send_eieio_messages(messages)
+            _wait_for(lambda: listener.n_received == len(messages))
+        finally:
+            listener.close()
+            sender.close()
+            receiver.close()
+        keys = [
+            key for batch in batches for message in batch
+            for key in message.read_keys_and_payloads()[0]]
+        self.assertEqual(list(range(5000)), keys)
+        self.assertEqual(0, listener.n_dropped)
+        self.assertEqual(0, listener.queue_depth)
+
+    def test_eieio_invalid_datagram(self):
+        receiver = EIEIOConnection(local_host="127.0.0.1")
+        sender = EIEIOConnection(
+            remote_host="127.0.0.1", remote_port=receiver.local_port)
+        raw_sender = UDPConnection(
+            remote_host="127.0.0.1", remote_port=receiver.local_port)
+        listener = BatchConnectionListener(receiver, timeout=0.05)
+        batches = list()
+        listener.add_callback(batches.append)
+        try:
+            # All of these are waiting when the listener first receives
+            messages = EIEIODataMessage.create_from_arrays(range(200))
+            sender.send_eieio_messages(messages[:1])
+            raw_sender.send(b"\x00")
+            sender.send_eieio_messages(messages[1:])
+            listener.start()
+            _wait_for(lambda: listener.n_received == len(messages))
+        finally:
+            listener.close()
+            raw_sender.close()
+            sender.close()
+            receiver.close()
+        keys = [
+            key for batch in batches for message in batch
+            for key in message.read_keys_and_payloads()[0]]
+        self.assertEqual(list(range(200)), keys)
+        self.assertEqual(1, listener.n_invalid)
+
+    def test_invalid_message(self):
+        source = _Source()
+        source.messages.extend([0, 1, "bad", 2, 3])
+        listener = BatchConnectionListener(source, timeout=0.05)
+        received = list()
+        listener.add_callback(received.extend)
+        listener.start()
+        try:
+            _wait_for(lambda: listener.n_received == 4)
+        finally:
+            listener.close()
+        self.assertEqual([0, 1, 2, 3], received)
+        self.assertEqual(1, listener.n_invalid)
+        self.assertEqual(0, listener.n_dropped)
+
+    def _run_blocked(self, policy):
+        """
+        Send 10 messages that block the callback, and then 90 more to a
+        queue that has space for 20.
+        """
+        source = _Source()
+        listener = BatchConnectionListener(
+            source, timeout=0.05, max_batch=10, queue_size=20, policy=policy)
+        in_callback = Event()
+        release = Event()
+        received = list()
+
+        def callback(messages):
+            in_callback.set()
+            release.wait()
+            received.extend(messages)
+
+        listener.add_callback(callback)
+        source.messages.extend(range(10))
+        listener.start()
+        try:
+            in_callback.wait()
+            source.messages.extend(range(10, 100))
+            if policy == ListenerQueuePolicy.BLOCK:
+                _wait_for(lambda: listener.n_received == 40)
+            else:
+                _wait_for(lambda: listener.n_received == 100)
+            self.assertEqual(20, listener.queue_depth)
+            self.assertEqual(20, listener.max_queue_depth)
+            release.set()
+            _wait_for(lambda: not source.messages)
+        finally:
+            release.set()
+            listener.close()
+        return listener, received
+
+    def test_block(self):
+        listener, received = self._run_blocked(ListenerQueuePolicy.BLOCK)
+        self.assertEqual(list(range(100)), received)
+        self.assertEqual(0, listener.n_dropped)
+
+    def test_drop_newest(self):
+        listener, received = self._run_blocked(
+            ListenerQueuePolicy.DROP_NEWEST)
+        self.assertEqual(list(range(30)), received)
+        self.assertEqual(70, listener.n_dropped)
+
+    def test_drop_oldest(self):
+        listener, received = self._run_blocked(
+            ListenerQueuePolicy.DROP_OLDEST)
+        self.assertEqual(list(range(10)) + list(range(80, 100)), received)
+        self.assertEqual(70, listener.n_dropped)
+
+    def test_invalid(self):
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            BatchConnectionListener(_Source(), max_batch=0)
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            BatchConnectionListener(_Source(), max_batch=10, queue_size=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+from spinnman.config_setup import unittest_setup
+from spinnman.connections import SCPRequestPipeLine
+from spinnman.messages.scp.impl import ReadMemory
+from unittests.fake_scamp import FakeSCAMP
+
+
+class TestSCPRequestPipeLine(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_only_expired_requests_are_resent(self):
+        scamp = FakeSCAMP(n_drop=1)
+        connection = scamp.connection()
+        responses = list()
+        try:
+            pipeline = SCPRequestPipeLine(
+                connection, n_channels=8, intermediate_channel_waits=7,
+                packet_timeout=0.2)
+            pipeline.send_request(
+                ReadMemory((0, 0, 0), 0, 4), responses.append, None)
+            time.sleep(0.15)
+            for address in range(4, 32, 4):
+                pipeline.send_request(
+                    ReadMemory((0, 0, 0), address, 4), responses.append,
+                    None)
+            pipeline.finish()
+        finally:
+            connection.close()
+            scamp.close()
+        self.assertEqual(8, len(responses))
+        self.assertEqual(1, pipeline.n_timeouts)
+        self.assertEqual(1, pipeline.n_resent)
+        self.assertEqual(0, pipeline.n_duplicate_replies)
+
+    def test_waiting_replies_are_read_before_timeout(self):
+        scamp = FakeSCAMP()
+        connection = scamp.connection()
+        responses = list()
+        try:
+            pipeline = SCPRequestPipeLine(
+                connection, n_channels=8, intermediate_channel_waits=7,
+                packet_timeout=0.2)
+            for address in range(0, 16, 4):
+                pipeline.send_request(
+                    ReadMemory((0, 0, 0), address, 4), responses.append,
+                    None)
+            # The replies wait in the socket until after the timeout
+            time.sleep(0.3)
+            pipeline.finish()
+        finally:
+            connection.close()
+            scamp.close()
+        self.assertEqual(4, len(responses))
+        self.assertEqual(0, pipeline.n_timeouts)
+        self.assertEqual(0, pipeline.n_resent)
+        self.assertEqual(0, pipeline.n_duplicate_replies)
+
+    def test_late_replies_are_counted(self):
+        scamp = FakeSCAMP(delay=0.3)
+        connection = scamp.connection()
+        responses = list()
+        try:
+            pipeline = SCPRequestPipeLine(
+                connection, n_channels=8, intermediate_channel_waits=7,
+                packet_timeout=0.2)
+            pipeline.send_request(
+                ReadMemory((0, 0, 0), 0, 4), responses.append, None)
+            pipeline.finish()
+            time.sleep(0.3)
+            pipeline.send_request(
+                ReadMemory((0, 0, 0), 4, 4), responses.append, None)
+            pipeline.finish()
+        finally:
+            connection.close()
+            scamp.close()
+        self.assertEqual(2, len(responses))
+        self.assertGreaterEqual(pipeline.n_resent, 1)
+        self.assertGreaterEqual(pipeline.n_duplicate_replies, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
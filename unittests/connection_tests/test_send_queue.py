@@ -0,0 +1,151 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+from spinnman.config_setup import unittest_setup
+from spinnman.connections import SendQueue
+from spinnman.connections.udp_packet_connections import (
+    EIEIOConnection, UDPConnection)
+from spinnman.exceptions import (
+    SpinnmanInvalidParameterException, SpinnmanIOException)
+from spinnman.messages.eieio.data_messages import EIEIODataMessage
+
+
+class _FailingConnection(UDPConnection):
+    """
+    A connection that fails to send after sending some datagrams.
+    """
+
+    def __init__(self, n_ok, **kwargs):
+        super().__init__(**kwargs)
+        self.n_ok = n_ok
+
+    def send_many(self, datagrams):
+        n_sent = 0
+        for data in datagrams:
+            if not self.n_ok:
+                raise SpinnmanIOException("send failed")
+            self.n_ok -= 1
+            self.send(data)
+            n_sent += 1
+        return n_sent
+
+
+class TestSendQueue(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def _receive(self, receiver, n_messages):
+        received = list()
+        while len(received) < n_messages:
+            received.extend(
+                bytes(data) for data in receiver.receive_many(1.0))
+        return received
+
+    def test_flush_in_order(self):
+        receivers = [UDPConnection(local_host="127.0.0.1") for _ in range(2)]
+        senders = [
+            UDPConnection(
+                remote_host="127.0.0.1", remote_port=receiver.local_port)
+            for receiver in receivers]
+        try:
+            queue = SendQueue()
+            messages = [bytes((i, )) * 4 for i in range(100)]
+            queue.add_all(senders[0], messages[:50])
+            queue.add(senders[1], b"other")
+            queue.add_all(senders[0], messages[50:])
+            self.assertEqual(101, queue.n_pending)
+            queue.flush()
+            self.assertEqual(0, queue.n_pending)
+            self.assertEqual(101, queue.n_sent)
+            self.assertGreater(queue.packets_per_second, 0)
+            self.assertEqual(messages, self._receive(receivers[0], 100))
+            self.assertEqual([b"other"], self._receive(receivers[1], 1))
+        finally:
+            for connection in senders + receivers:
+                connection.close()
+
+    def test_rate(self):
+        receiver = UDPConnection(local_host="127.0.0.1")
+        sender = UDPConnection(
+            remote_host="127.0.0.1", remote_port=receiver.local_port)
+        try:
+            # A burst of 10 goes at once, and the other 20 take 0.1 seconds
+            queue = SendQueue(rate=200, burst=10)
+            messages = [bytes((i, )) for i in range(30)]
+            queue.add_all(sender, messages)
+            start = time.perf_counter()
+            queue.flush()
+            self.assertGreaterEqual(time.perf_counter() - start, 0.09)
+            self.assertEqual(messages, self._receive(receiver, 30))
+        finally:
+            sender.close()
+            receiver.close()
+
+    def test_send_eieio_messages(self):
+        receiver = EIEIOConnection(local_host="127.0.0.1")
+        sender = EIEIOConnection(
+            remote_host="127.0.0.1", remote_port=receiver.local_port)
+        try:
+            messages = EIEIODataMessage.create_from_arrays(range(1000))
+            sender.send_eieio_messages(messages)
+            self.assertEqual(
+                [message.bytestring for message in messages],
+                self._receive(receiver, len(messages)))
+        finally:
+            sender.close()
+            receiver.close()
+
+    def test_send_error(self):
+        receiver = UDPConnection(local_host="127.0.0.1")
+        sender = _FailingConnection(
+            2, remote_host="127.0.0.1", remote_port=receiver.local_port)
+        try:
+            queue = SendQueue()
+            messages = [bytes((i, )) for i in range(5)]
+            queue.add_all(sender, messages)
+            with self.assertRaises(SpinnmanIOException):
+                queue.flush()
+            # The datagram that failed is still queued
+            self.assertEqual(2, queue.n_sent)
+            self.assertEqual(3, queue.n_pending)
+            sender.n_ok = 3
+            queue.flush()
+            self.assertEqual(messages, self._receive(receiver, 5))
+        finally:
+            sender.close()
+            receiver.close()
+
+    def test_empty_datagram(self):
+        receiver = UDPConnection(local_host="127.0.0.1")
+        sender = UDPConnection(
+            remote_host="127.0.0.1", remote_port=receiver.local_port)
+        try:
+            self.assertEqual(2, sender.send_many([b"", b"end"]))
+            self.assertEqual([b"", b"end"], self._receive(receiver, 2))
+        finally:
+            sender.close()
+            receiver.close()
+
+    def test_invalid(self):
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            SendQueue(rate=0)
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            SendQueue(burst=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
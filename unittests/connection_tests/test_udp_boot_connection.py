@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import socket
+import time
 import unittest
 from spinnman.connections.udp_packet_connections import BootConnection
+from spinnman.constants import UDP_BOOT_CONNECTION_DEFAULT_PORT
 from spinnman.config_setup import unittest_setup
 
 
@@ -26,6 +29,30 @@ class MyTestCase(unittest.TestCase):
         udp_connect = BootConnection()
         self.assertIsNotNone(udp_connect)
 
+    def test_send_boot_packets(self):
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            receiver.bind(("127.0.0.1", UDP_BOOT_CONNECTION_DEFAULT_PORT))
+        except OSError:
+            receiver.close()
+            raise unittest.SkipTest("boot port in use")
+        receiver.settimeout(1.0)
+        connection = BootConnection(remote_host="127.0.0.1")
+        packets = [bytes((i, )) * 16 for i in range(3)]
+        try:
+            start = time.monotonic()
+            connection.send_boot_packets(packets, interval=0.3)
+            elapsed = time.monotonic() - start
+            received = [receiver.recv(64) for _ in packets]
+        finally:
+            connection.close()
+            receiver.close()
+        self.assertEqual(packets, received)
+        # Two gaps between three packets, and no wait after the last, which
+        # would take it to 0.9 seconds
+        self.assertGreaterEqual(elapsed, 0.6)
+        self.assertLess(elapsed, 0.9)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,78 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from spinnman.config_setup import unittest_setup
+from spinnman.connections.udp_packet_connections import (
+    EIEIOConnection, UDPConnection)
+from spinnman.exceptions import SpinnmanTimeoutException
+from spinnman.messages.eieio import EIEIOType
+from spinnman.messages.eieio.data_messages import EIEIODataMessage
+
+
+class TestUDPConnection(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_receive_many(self):
+        receiver = UDPConnection(local_host="127.0.0.1")
+        sender = UDPConnection(
+            remote_host="127.0.0.1", remote_port=receiver.local_port)
+        try:
+            messages = [bytes((i, )) * (i + 1) for i in range(200)]
+            for message in messages:
+                sender.send(message)
+            received = [bytes(data) for data in receiver.receive_many(1.0)]
+            # Messages can trickle in, but none are lost or reordered
+            while len(received) < len(messages):
+                received.extend(
+                    bytes(data) for data in receiver.receive_many(1.0))
+            self.assertEqual(messages, received)
+
+            # The ring is reused without overwriting the last messages
+            sender.send(b"next")
+            last = receiver.receive_many(1.0)
+            self.assertEqual([b"next"], [bytes(data) for data in last])
+            sender.send(b"after")
+            self.assertEqual(
+                [b"after"], [bytes(data) for data in receiver.receive_many()])
+            self.assertEqual(b"next", bytes(last[0]))
+
+            with self.assertRaises(SpinnmanTimeoutException):
+                receiver.receive_many(0.01)
+        finally:
+            sender.close()
+            receiver.close()
+
+    def test_receive_eieio_messages(self):
+        receiver = EIEIOConnection(local_host="127.0.0.1")
+        sender = EIEIOConnection(
+            remote_host="127.0.0.1", remote_port=receiver.local_port)
+        try:
+            for message in EIEIODataMessage.create_from_arrays(
+                    range(300), eieio_type=EIEIOType.KEY_32_BIT):
+                sender.send_eieio_message(message)
+            keys = list()
+            while len(keys) < 300:
+                for message in receiver.receive_eieio_messages(1.0):
+                    keys.extend(message.read_keys_and_payloads()[0])
+            self.assertEqual(list(range(300)), keys)
+        finally:
+            sender.close()
+            receiver.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+from spinnman.config_setup import unittest_setup
+from spinnman.connections import SCPRequestPipeLine
+from spinnman.connections.window_controllers import (
+    AIMDSCPWindowController, DelaySCPWindowController,
+    FixedSCPWindowController, RTTEstimator)
+from spinnman.messages.scp.impl import ReadMemory
+from unittests.fake_scamp import FakeSCAMP
+
+
+class TestWindowControllers(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_rtt_estimator(self):
+        rtt = RTTEstimator(1.0, min_rto=0.01)
+        self.assertIsNone(rtt.srtt)
+        self.assertEqual(1.0, rtt.rto)
+        rtt.add_sample(0.1)
+        self.assertAlmostEqual(0.1, rtt.srtt)
+        self.assertAlmostEqual(0.05, rtt.rttvar)
+        self.assertAlmostEqual(0.3, rtt.rto)
+        for _ in range(100):
+            rtt.add_sample(0.1)
+        self.assertAlmostEqual(0.1, rtt.srtt)
+        self.assertLess(rtt.rto, 0.11)
+        rtt.back_off()
+        rtt.back_off()
+        self.assertLess(rtt.rto, 0.44)
+        for _ in range(10):
+            rtt.back_off()
+        self.assertEqual(1.0, rtt.rto)
+
+    def test_fixed(self):
+        controller = FixedSCPWindowController(5)
+        controller.on_response(0.1)
+        controller.on_timeout(time.monotonic())
+        self.assertEqual(5, controller.window)
+        self.assertEqual(1, controller.n_responses)
+        self.assertEqual(1, controller.n_timeouts)
+
+    def test_aimd(self):
+        controller = AIMDSCPWindowController(8, min_window=2, max_window=12)
+        # The window grows by about one for each window of responses
+        for _ in range(9):
+            controller.on_response(0.001)
+        self.assertEqual(9, controller.window)
+        for _ in range(1000):
+            controller.on_response(0.001)
+        self.assertEqual(12, controller.window)
+        sent_at = time.monotonic()
+        controller.on_timeout(sent_at)
+        self.assertEqual(6, controller.window)
+        # Timeouts of requests sent before the decrease do not shrink it
+        controller.on_timeout(sent_at)
+        self.assertEqual(6, controller.window)
+        controller.on_timeout(time.monotonic())
+        self.assertEqual(3, controller.window)
+        for _ in range(10):
+            controller.on_timeout(time.monotonic())
+        self.assertEqual(2, controller.window)
+
+    def test_delay(self):
+        controller = DelaySCPWindowController(8, max_window=20)
+        for _ in range(100):
+            controller.on_response(0.001)
+        self.assertEqual(0.001, controller.base_rtt)
+        grown = controller.window
+        self.assertGreater(grown, 8)
+        for _ in range(100):
+            controller.on_response(0.01)
+        self.assertLess(controller.window, grown)
+
+    def test_pipeline_resends_only_the_window(self):
+        scamp = FakeSCAMP(n_drop=8)
+        connection = scamp.connection()
+        controller = AIMDSCPWindowController(8)
+        try:
+            pipeline = SCPRequestPipeLine(
+                connection, packet_timeout=0.2, window_controller=controller)
+            responses = list()
+            for address in range(0, 32, 4):
+                pipeline.send_request(
+                    ReadMemory((0, 0, 0), address, 4), responses.append,
+                    None)
+            pipeline.finish()
+        finally:
+            connection.close()
+            scamp.close()
+        self.assertEqual(8, len(responses))
+        # The first timeout halves the window, so only half of the requests
+        # are resent; the rest are resent at the next timeout, which does not
+        # shrink the window again
+        self.assertEqual(2, pipeline.n_timeouts)
+        self.assertEqual(8, pipeline.n_resent)
+        self.assertEqual(2, controller.n_timeouts)
+        self.assertEqual(5, controller.window)
+        # Resent requests are not measured
+        self.assertEqual(0, pipeline.rtt.n_samples)
+
+
+if __name__ == '__main__':
+    unittest.main()
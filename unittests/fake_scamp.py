@@ -0,0 +1,122 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import struct
+import threading
+import time
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
+from spinnman.messages.sdp import SDPFlag
+
+_REQUEST = struct.Struct("<2x4xBB2xHH3I")
+_REPLY_HEADER = struct.Struct("<2xB7xHH")
+_WORD = struct.Struct("<I")
+
+
+class FakeSCAMP(object):
+    """
+    A minimal SCAMP on the loopback interface, for testing the sending and
+    receiving of SCP requests.  Reads are answered from the regions in
+    ``memory`` if they are within one, or otherwise with the low byte of
+    each address, and writes are recorded and acknowledged.  State counts
+    are answered from ``counts``, keyed by application ID and state.  Every
+    other request is acknowledged, with the data in ``payloads`` for its
+    command if there is any, and all requests are recorded in ``requests``
+    as their command, chip coordinates and arguments.  Requests of a
+    command in ``errors`` are first answered with the results in its list
+    instead, in turn.
+    """
+
+    def __init__(self, n_drop=0, delay=0.0):
+        """
+        :param int n_drop: The number of requests to ignore at the start
+        :param float delay: The time to wait before sending each response
+        """
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(("127.0.0.1", 0))
+        self.socket.settimeout(0.01)
+        self.port = self.socket.getsockname()[1]
+        self.n_drop = n_drop
+        self.delay = delay
+        self.n_received = 0
+        self.written = dict()
+        self.memory = dict()
+        self.counts = dict()
+        self.payloads = dict()
+        self.errors = dict()
+        self.requests = list()
+        self.__pending = list()
+        self.__running = True
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def connection(self, chip_x=0, chip_y=0):
+        """
+        Make a connection that talks to this SCAMP.
+
+        :rtype: SCAMPConnection
+        """
+        return SCAMPConnection(
+            chip_x, chip_y, remote_host="127.0.0.1", remote_port=self.port)
+
+    def __run(self):
+        while self.__running:
+            now = time.monotonic()
+            while self.__pending and self.__pending[0][0] <= now:
+                _, reply, address = self.__pending.pop(0)
+                self.socket.sendto(reply, address)
+            try:
+                data, address = self.socket.recvfrom(512)
+            except socket.timeout:
+                continue
+            self.n_received += 1
+            if self.n_drop > 0:
+                self.n_drop -= 1
+                continue
+            self.__pending.append(
+                (time.monotonic() + self.delay, self.__reply(data), address))
+
+    def __reply(self, data):
+        y, x, cmd, seq, arg1, arg2, arg3 = _REQUEST.unpack_from(data)
+        self.requests.append((cmd, x, y, arg1, arg2, arg3))
+        if self.errors.get(cmd):
+            return _REPLY_HEADER.pack(
+                SDPFlag.REPLY_NOT_EXPECTED.value,
+                self.errors[cmd].pop(0).value, seq)
+        reply = bytearray(_REPLY_HEADER.pack(
+            SDPFlag.REPLY_NOT_EXPECTED.value, SCPResult.RC_OK.value, seq))
+        if cmd == SCPCommand.CMD_READ.value:
+            reply += self.__read(arg1, arg2)
+        elif cmd == SCPCommand.CMD_COUNT.value:
+            reply += _WORD.pack(self.counts.get((arg1, arg2), 0))
+        elif cmd == SCPCommand.CMD_WRITE.value:
+            self.written[arg1] = bytes(data[_REQUEST.size:])
+        else:
+            reply += self.payloads.get(cmd, b"")
+        return reply
+
+    def __read(self, address, length):
+        for base, data in self.memory.items():
+            if base <= address and address + length <= base + len(data):
+                return data[address - base:address - base + length]
+        return bytes((address + i) & 0xFF for i in range(length))
+
+    def close(self):
+        """
+        Stop responding and close the socket.
+        """
+        self.__running = False
+        self.__thread.join()
+        self.socket.close()
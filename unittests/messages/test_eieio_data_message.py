@@ -0,0 +1,171 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy
+from spinnman.config_setup import unittest_setup
+from spinnman.exceptions import (
+    SpinnmanInvalidPacketException, SpinnmanInvalidParameterException)
+from spinnman.messages.eieio import (
+    EIEIOPrefix, EIEIOType, read_eieio_data_arrays, read_eieio_data_message)
+from spinnman.messages.eieio.data_messages import EIEIODataMessage
+
+
+def _build(eieio_type, elements, **kwargs):
+    message = EIEIODataMessage.create(eieio_type, **kwargs)
+    for element in elements:
+        if eieio_type.payload_bytes:
+            message.add_key_and_payload(*element)
+        else:
+            message.add_key(element)
+    return message.bytestring
+
+
+def _elements(data):
+    message = read_eieio_data_message(data, 0)
+    keys, payloads = list(), list()
+    while message.is_next_element:
+        element = message.next_element
+        keys.append(element.key)
+        payloads.append(getattr(element, "payload", None))
+    return keys, payloads
+
+
+class TestEIEIODataMessage(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_read_keys_and_payloads(self):
+        datagrams = [
+            _build(EIEIOType.KEY_16_BIT, [1, 2, 0xFFFF]),
+            _build(EIEIOType.KEY_32_BIT, [1, 0xFFFFFFFF], key_prefix=0x10),
+            _build(EIEIOType.KEY_16_BIT, [3, 4], key_prefix=0xABCD,
+                   prefix_type=EIEIOPrefix.UPPER_HALF_WORD),
+            _build(EIEIOType.KEY_16_BIT, [5], timestamp=0x1234),
+            _build(EIEIOType.KEY_PAYLOAD_16_BIT, [(1, 2), (3, 0xFFFF)]),
+            _build(EIEIOType.KEY_PAYLOAD_32_BIT, [(7, 8)],
+                   payload_prefix=0x100),
+            _build(EIEIOType.KEY_32_BIT, [])]
+        for data in datagrams:
+            keys, payloads = read_eieio_data_message(
+                data, 0).read_keys_and_payloads()
+            expected_keys, expected_payloads = _elements(data)
+            self.assertEqual(expected_keys, keys.tolist())
+            if payloads is None:
+                self.assertTrue(all(p is None for p in expected_payloads))
+            else:
+                self.assertEqual(expected_payloads, payloads.tolist())
+
+    def test_read_after_next_element(self):
+        message = read_eieio_data_message(
+            _build(EIEIOType.KEY_PAYLOAD_32_BIT, [(1, 2), (3, 4), (5, 6)]),
+            0)
+        self.assertEqual(1, message.next_element.key)
+        keys, payloads = message.read_keys_and_payloads()
+        self.assertEqual([3, 5], keys.tolist())
+        self.assertEqual([4, 6], payloads.tolist())
+        self.assertFalse(message.is_next_element)
+
+    def test_read_eieio_data_arrays(self):
+        keys, payloads = read_eieio_data_arrays([
+            _build(EIEIOType.KEY_32_BIT, [1, 2]),
+            _build(EIEIOType.KEY_16_BIT, [3], key_prefix=0x100)])
+        self.assertEqual([1, 2, 0x103], keys.tolist())
+        self.assertIsNone(payloads)
+        keys, payloads = read_eieio_data_arrays([
+            _build(EIEIOType.KEY_PAYLOAD_32_BIT, [(1, 2)]),
+            _build(EIEIOType.KEY_PAYLOAD_16_BIT, [(3, 4), (5, 6)])])
+        self.assertEqual([1, 3, 5], keys.tolist())
+        self.assertEqual([2, 4, 6], payloads.tolist())
+        with self.assertRaises(SpinnmanInvalidPacketException):
+            read_eieio_data_arrays([
+                _build(EIEIOType.KEY_32_BIT, [1]),
+                _build(EIEIOType.KEY_PAYLOAD_32_BIT, [(1, 2)])])
+
+    def test_short_message(self):
+        data = _build(EIEIOType.KEY_32_BIT, [1, 2, 3])
+        with self.assertRaises(SpinnmanInvalidPacketException):
+            read_eieio_data_message(
+                data[:-2], 0).read_keys_and_payloads()
+
+    def test_create_from_arrays(self):
+        keys = numpy.arange(100, dtype=numpy.uint32)
+        payloads = keys * 2
+        messages = EIEIODataMessage.create_from_arrays(
+            keys, payloads, eieio_type=EIEIOType.KEY_PAYLOAD_32_BIT)
+        self.assertEqual(
+            [31, 31, 31, 7], [message.n_elements for message in messages])
+        read_keys, read_payloads = read_eieio_data_arrays(
+            [message.bytestring for message in messages])
+        self.assertEqual(keys.tolist(), read_keys.tolist())
+        self.assertEqual(payloads.tolist(), read_payloads.tolist())
+
+        # The same as adding the elements one at a time
+        message = EIEIODataMessage.create(
+            EIEIOType.KEY_PAYLOAD_32_BIT, timestamp=5)
+        for key, payload in zip(range(10), range(10, 20)):
+            message.add_key_and_payload(key, payload)
+        self.assertEqual([message.bytestring], [
+            bulk.bytestring for bulk in EIEIODataMessage.create_from_arrays(
+                range(10), range(10, 20),
+                eieio_type=EIEIOType.KEY_PAYLOAD_32_BIT, timestamp=5)])
+
+    def test_create_from_arrays_chooses_type(self):
+        messages = EIEIODataMessage.create_from_arrays([1, 2, 3])
+        self.assertEqual(
+            EIEIOType.KEY_16_BIT, messages[0].eieio_header.eieio_type)
+        messages = EIEIODataMessage.create_from_arrays([1, 0x10000])
+        self.assertEqual(
+            EIEIOType.KEY_32_BIT, messages[0].eieio_header.eieio_type)
+        messages = EIEIODataMessage.create_from_arrays([1, 2], [3, 0x10000])
+        self.assertEqual(
+            EIEIOType.KEY_PAYLOAD_32_BIT, messages[0].eieio_header.eieio_type)
+
+        # Keys with the same upper half-word send it as a prefix
+        keys = numpy.arange(0x12340000, 0x12340000 + 200)
+        messages = EIEIODataMessage.create_from_arrays(keys)
+        header = messages[0].eieio_header
+        self.assertEqual(EIEIOType.KEY_16_BIT, header.eieio_type)
+        self.assertEqual(0x1234, header.prefix)
+        self.assertEqual(EIEIOPrefix.UPPER_HALF_WORD, header.prefix_type)
+        self.assertEqual([126, 74], [m.n_elements for m in messages])
+        read_keys, _ = read_eieio_data_arrays(
+            [message.bytestring for message in messages])
+        self.assertEqual(keys.tolist(), read_keys.tolist())
+
+    def test_create_from_arrays_checks(self):
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            EIEIODataMessage.create_from_arrays(
+                [0x10000], eieio_type=EIEIOType.KEY_16_BIT)
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            EIEIODataMessage.create_from_arrays([-1])
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            EIEIODataMessage.create_from_arrays([1, 2], [3])
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            EIEIODataMessage.create_from_arrays(
+                [1], eieio_type=EIEIOType.KEY_PAYLOAD_16_BIT)
+        # Too big for any type, even with a shared upper half-word
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            EIEIODataMessage.create_from_arrays([2**32 + 5, 2**32 + 6])
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            EIEIODataMessage.create_from_arrays([1, 2], [3, 2**32])
+
+    def test_create_from_no_arrays(self):
+        self.assertEqual([], EIEIODataMessage.create_from_arrays([]))
+        self.assertEqual([], EIEIODataMessage.create_from_arrays([], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
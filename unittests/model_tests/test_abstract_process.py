@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 from spinn_utilities.config_holder import set_config
 from spinnman.processes.abstract_multi_connection_process import (
     AbstractMultiConnectionProcess)
@@ -20,8 +21,10 @@ from spinnman.config_setup import unittest_setup
 from spinnman.connections.udp_packet_connections import SCAMPConnection
 from spinnman.exceptions import (
     SpinnmanTimeoutException, SpinnmanGenericProcessException)
-from spinnman.processes import RoundRobinConnectionSelector
+from spinnman.processes import (
+    MostDirectConnectionSelector, RoundRobinConnectionSelector)
 import pytest
+from unittests.fake_scamp import FakeSCAMP
 
 
 class MockProcess(AbstractMultiConnectionProcess):
@@ -45,3 +48,39 @@ def test_error_print():
     process = MockProcess(RoundRobinConnectionSelector([connection]))
     with pytest.raises(SpinnmanGenericProcessException):
         process.test()
+
+
+class ReadProcess(AbstractMultiConnectionProcess):
+    def read(self, boards, n_reads):
+        data = dict()
+        with self._collect_responses():
+            for address in range(0, n_reads * 4, 4):
+                for x in boards:
+                    self._send_request(
+                        ReadMemory((x, 0, 0), address, 4),
+                        functools.partial(self.__store, data, x, address))
+        return data
+
+    @staticmethod
+    def __store(data, x, address, response):
+        data[x, address] = bytes(
+            response.data[response.offset:response.offset + 4])
+
+
+def test_multiple_connections():
+    unittest_setup()
+    set_config("Machine", "version", 5)
+    scamps = [FakeSCAMP(delay=0.05) for _ in range(4)]
+    connections = [scamp.connection(x, 0) for x, scamp in enumerate(scamps)]
+    try:
+        process = ReadProcess(MostDirectConnectionSelector(connections))
+        data = process.read(range(len(scamps)), 20)
+    finally:
+        for connection in connections:
+            connection.close()
+        for scamp in scamps:
+            scamp.close()
+    assert len(data) == 80
+    for (x, address), value in data.items():
+        assert value == bytes(range(address, address + 4)), x
+    assert all(scamp.n_received == 20 for scamp in scamps)
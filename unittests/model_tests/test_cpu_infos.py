@@ -78,6 +78,33 @@ class TestCpuInfos(unittest.TestCase):
         self.assertSetEqual(set(infos1),
                             {(0, 0, 1), (0, 0, 2), (1, 0, 1), (1, 0, 2)})
 
+    def test_lookup_and_counts(self):
+        infos = CPUInfos()
+        infos.add_info(CPUInfo.mock_info(0, 0, 1, 5, CPUState.RUNNING))
+        infos.add_info(CPUInfo.mock_info(0, 0, 2, 6, CPUState.FINISHED))
+        infos.add_info(CPUInfo.mock_info(1, 0, 1, 7, CPUState.FINISHED))
+        # Adding a core again replaces its info but keeps its place
+        infos.add_info(CPUInfo.mock_info(0, 0, 1, 9, CPUState.WATCHDOG))
+        self.assertEqual([(0, 0, 1), (0, 0, 2), (1, 0, 1)], list(infos))
+        self.assertEqual(3, len(infos))
+
+        info = infos.get_cpu_info(0, 0, 1)
+        self.assertEqual(CPUState.WATCHDOG, info.state)
+        self.assertEqual(9, info.physical_cpu_id)
+        self.assertEqual("scamp-3", info.application_name)
+        self.assertTrue(infos.is_core(1, 0, 1))
+        self.assertFalse(infos.is_core(1, 1, 1))
+        with self.assertRaises(KeyError):
+            infos.get_cpu_info(1, 1, 1)
+
+        self.assertEqual({CPUState.WATCHDOG: 1, CPUState.FINISHED: 2},
+                         infos.count_states())
+        groups = infos.group_by_state()
+        self.assertEqual([(0, 0, 2), (1, 0, 1)],
+                         list(groups[CPUState.FINISHED]))
+        self.assertEqual(3, len(infos.infos_for_app_id(0)))
+        self.assertEqual(0, len(infos.infos_for_app_id(16)))
+
 
 if __name__ == '__main__':
     unittest.main()
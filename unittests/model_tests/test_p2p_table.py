@@ -0,0 +1,70 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import struct
+import unittest
+import numpy
+from spinnman.config_setup import unittest_setup
+from spinnman.model import P2PTable
+from spinnman.model.enums import P2PTableRoute
+
+
+def _column(routes):
+    """
+    Pack a column of routes into words as the router does.
+    """
+    data = b""
+    for start in range(0, len(routes), 8):
+        word = 0
+        for i, route in enumerate(routes[start:start + 8]):
+            word |= route.value << (3 * i)
+        data += struct.pack("<I", word)
+    return data
+
+
+class TestP2PTable(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_decode(self):
+        width, height = 5, 11
+        rng = numpy.random.default_rng(1)
+        expected = {
+            (x, y): P2PTableRoute(int(rng.integers(8)))
+            for x in range(width) for y in range(height)}
+        column_data = [
+            (b"\xff" * 3 + _column([expected[x, y] for y in range(height)]),
+             3) for x in range(width)]
+        table = P2PTable(width, height, column_data)
+        routed = [xy for xy, route in expected.items()
+                  if route != P2PTableRoute.NONE]
+        self.assertEqual(routed, list(table.iterchips()))
+        self.assertEqual(len(routed), table.n_routes)
+        for (x, y), route in expected.items():
+            self.assertEqual(route, table.get_route(x, y))
+            self.assertEqual(route != P2PTableRoute.NONE,
+                             table.is_route(x, y))
+        self.assertFalse(table.is_route(width, 0))
+        self.assertEqual(P2PTableRoute.NONE, table.get_route(0, height))
+
+    def test_large(self):
+        width = height = 256
+        column = _column([P2PTableRoute.EAST] * height)
+        table = P2PTable(width, height, [(column, 0)] * width)
+        self.assertEqual(width * height, table.n_routes)
+        self.assertLessEqual(table.routes.nbytes, width * height)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinn_machine import Chip, CoreSubsets
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+from spinnman.config_setup import unittest_setup
+from spinnman.data import SpiNNManDataView
+from spinnman.data.spinnman_data_writer import SpiNNManDataWriter
+from spinnman.messages.scp.enums import SCPCommand
+from spinnman.processes import (
+    ApplicationCopyRunProcess, MostDirectConnectionSelector)
+from spinnman.utilities.word_checksum import WordChecksum
+from unittests.fake_scamp import FakeSCAMP
+
+_ADDRESS = 0x67800000
+
+
+def _machine_with_parent_links(n_boards):
+    """
+    Make a virtual machine in which each chip has a parent link, on the
+    breadth-first tree from the boot chip.
+    """
+    machine = virtual_machine_by_boards(n_boards)
+    parents = {(0, 0): None}
+    order = [(0, 0)]
+    for xy in order:
+        for link in machine[xy].router.links:
+            child = (link.destination_x, link.destination_y)
+            if child not in parents:
+                parents[child] = xy
+                order.append(child)
+    tree = SpiNNManDataView.get_machine_version().create_machine(
+        machine.width, machine.height)
+    for chip in machine.chips:
+        parent_link = None
+        if parents[chip.x, chip.y] is not None:
+            parent_link = next(
+                link.source_link_id for link in chip.router.links
+                if (link.destination_x, link.destination_y) ==
+                parents[chip.x, chip.y])
+        tree.add_chip(Chip(
+            chip.x, chip.y, chip.scamp_processors_ids,
+            chip.placable_processors_ids, chip.router, chip.sdram,
+            chip.nearest_ethernet_x, chip.nearest_ethernet_y,
+            chip.ip_address, chip.tag_ids, parent_link))
+    return tree, parents
+
+
+class TestApplicationCopyRunProcess(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def test_load_and_run(self):
+        machine, parents = _machine_with_parent_links(2)
+        SpiNNManDataWriter.mock().set_machine(machine)
+        binary_a = bytes(range(256)) * 2 + bytes(88)
+        binary_b = bytes(range(255, -1, -1)) + bytes(44)
+        cores_a = CoreSubsets()
+        for x, y in ((3, 3), (7, 7), (8, 4), (11, 8)):
+            cores_a.add_processor(x, y, 1)
+        cores_b = CoreSubsets()
+        for x, y in ((0, 0), (2, 1), (4, 8)):
+            cores_b.add_processor(x, y, 2)
+
+        scamp = FakeSCAMP(delay=0.002)
+        connection = scamp.connection()
+        try:
+            process = ApplicationCopyRunProcess(
+                MostDirectConnectionSelector([connection]))
+            process.load_and_run(
+                [(binary_a, cores_a), (binary_b, cores_b)], _ADDRESS, 30,
+                False)
+        finally:
+            connection.close()
+            scamp.close()
+
+        checksums = dict()
+        for name, data in (("a", binary_a), ("b", binary_b)):
+            checksum = WordChecksum()
+            checksum.update(data)
+            checksums[checksum.value & 0x1FFFFFFF] = name
+
+        # The binaries are written to the boot chip in order, in packets
+        written = [
+            index for index, request in enumerate(scamp.requests)
+            if request[0] == SCPCommand.CMD_WRITE.value]
+        self.assertEqual(5, len(written))
+        writes = {"a": written[:3], "b": written[3:]}
+
+        # When each chip got each binary
+        got = {(0, 0, "a"): writes["a"][-1]}
+        for index, (cmd, x, y, arg1, _arg2, _arg3) in enumerate(
+                scamp.requests):
+            if cmd == SCPCommand.CMD_APP_COPY_RUN.value:
+                name = checksums[arg1 >> 3]
+                self.assertNotIn((x, y, name), got)
+                got[x, y, name] = index
+            elif cmd == SCPCommand.CMD_AR.value:
+                # Binary b runs on the boot chip after it is written
+                self.assertGreater(index, writes["b"][-1])
+                got[0, 0, "b"] = index
+
+        # Exactly the chips on the way to the cores get each binary
+        for name, cores in (("a", cores_a), ("b", cores_b)):
+            needed = set()
+            for subset in cores:
+                xy = (subset.x, subset.y)
+                while xy is not None:
+                    needed.add(xy)
+                    xy = parents[xy]
+            self.assertEqual(
+                needed, {(x, y) for x, y, n in got if n == name})
+
+        # Each chip copies from its parent after the parent has the binary
+        for (x, y, name), index in got.items():
+            parent = parents[x, y]
+            if parent is not None:
+                self.assertGreater(index, got[parent + (name, )])
+
+        # The second binary is written before the first has finished copying
+        self.assertLess(
+            writes["b"][0],
+            max(index for (_, _, name), index in got.items() if name == "a"))
+        self.assertEqual(binary_b[:256], scamp.written[_ADDRESS])
+
+
+if __name__ == '__main__':
+    unittest.main()
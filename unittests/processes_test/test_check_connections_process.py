@@ -0,0 +1,52 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import N_RETRIES
+from spinnman.messages.scp.enums import SCPCommand, SCPResult
+from spinnman.processes import CheckConnectionsProcess
+from unittests.fake_scamp import FakeSCAMP
+
+# Chip information with the Ethernet up, and no cores
+_CHIP_INFO = struct.pack("<3I20x4B", 1 << 25, 0, 0, 10, 11, 12, 13)
+
+
+class TestCheckConnectionsProcess(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_retry_after_error(self):
+        scamp = FakeSCAMP()
+        scamp.payloads[SCPCommand.CMD_INFO.value] = _CHIP_INFO
+        # The chip is busy for longer than the retries of the first round,
+        # which is an IO error, but it is still asked again in the next
+        scamp.errors[SCPCommand.CMD_INFO.value] = [
+            SCPResult.RC_P2P_BUSY] * (N_RETRIES + 1)
+        connection = scamp.connection()
+        try:
+            chip_infos = CheckConnectionsProcess(
+                [connection]).check_connections(2)
+        finally:
+            connection.close()
+            scamp.close()
+        self.assertEqual([(0, 0)], list(chip_infos))
+        self.assertEqual("10.11.12.13", chip_infos[0, 0].ethernet_ip_address)
+        self.assertEqual(N_RETRIES + 2, len(scamp.requests))
+
+
+if __name__ == '__main__':
+    unittest.main()
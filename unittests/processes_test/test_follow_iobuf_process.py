@@ -0,0 +1,118 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from spinn_machine import CoreSubsets
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import CPU_IOBUF_ADDRESS_OFFSET
+from spinnman.processes import FixedConnectionSelector, FollowIOBufProcess
+from spinnman.utilities.utility_functions import get_vcpu_address
+from unittests.fake_scamp import FakeSCAMP
+
+_IOBUF_SIZE = 1000
+_BUFFER = 0x70000000
+
+
+class TestFollowIOBufProcess(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        self.scamp = FakeSCAMP()
+        self.connection = self.scamp.connection()
+        self.selector = FixedConnectionSelector(self.connection)
+
+    def tearDown(self):
+        self.connection.close()
+        self.scamp.close()
+
+    def _set_buffer(self, n, text, next_n=None):
+        next_address = 0 if next_n is None else _BUFFER + next_n * 0x1000
+        data = struct.pack("<I8xI", next_address, len(text)) + text.encode()
+        self.scamp.memory[_BUFFER + n * 0x1000] = data.ljust(
+            _IOBUF_SIZE + 16, b"\0")
+
+    def _lines(self, process):
+        return [(iobuf.p, iobuf.iobuf) for iobuf in process.poll()]
+
+    def test_follow(self):
+        vcpu = get_vcpu_address(1) + CPU_IOBUF_ADDRESS_OFFSET
+        self.scamp.memory[vcpu] = struct.pack("<I", 0)
+        core_subsets = CoreSubsets()
+        core_subsets.add_processor(0, 0, 1)
+        process = FollowIOBufProcess(self.selector, core_subsets)
+
+        # Nothing to read until the core has a buffer
+        self.assertEqual([], self._lines(process))
+        self.scamp.memory[vcpu] = struct.pack("<I", _BUFFER)
+        self._set_buffer(0, "")
+        self.assertEqual([], self._lines(process))
+
+        # A part line is kept until the rest arrives
+        self._set_buffer(0, "first\nsec")
+        self.assertEqual([(1, "first")], self._lines(process))
+        n_received = self.scamp.n_received
+        self._set_buffer(0, "first\nsecond\n" + "x" * 600 + "\n")
+        self.assertEqual([(1, "second"), (1, "x" * 600)],
+                         self._lines(process))
+        # The header and the new text only
+        self.assertEqual(n_received + 4, self.scamp.n_received)
+
+        # Nothing new costs only the header
+        n_received = self.scamp.n_received
+        self.assertEqual([], self._lines(process))
+        self.assertEqual(n_received + 1, self.scamp.n_received)
+
+        # When a buffer is full, the next is followed
+        self._set_buffer(0, "first\nsecond\n" + "x" * 600 + "\nend", 1)
+        self._set_buffer(1, " of first\nnext\n")
+        self.assertEqual([(1, "end of first"), (1, "next")],
+                         self._lines(process))
+        self._set_buffer(1, " of first\nnext\nlast\n")
+        self.assertEqual([(1, "last")], self._lines(process))
+
+    def _follow_one(self):
+        vcpu = get_vcpu_address(1) + CPU_IOBUF_ADDRESS_OFFSET
+        self.scamp.memory[vcpu] = struct.pack("<I", _BUFFER)
+        core_subsets = CoreSubsets()
+        core_subsets.add_processor(0, 0, 1)
+        return vcpu, FollowIOBufProcess(self.selector, core_subsets)
+
+    def test_reset(self):
+        vcpu, process = self._follow_one()
+        self._set_buffer(0, "one\ntwo\nthr")
+        self.assertEqual([(1, "one"), (1, "two")], self._lines(process))
+
+        # The core is loaded again, with its buffers somewhere else
+        self._set_buffer(0, "new")
+        self.scamp.memory[vcpu] = struct.pack("<I", _BUFFER + 0x2000)
+        self._set_buffer(2, "again\n")
+        self.assertEqual([(1, "thr"), (1, "again")], self._lines(process))
+
+        # The core is loaded again, with its buffers in the same place
+        self._set_buffer(2, "b\n")
+        self.assertEqual([(1, "b")], self._lines(process))
+
+    def test_flush(self):
+        _, process = self._follow_one()
+        self._set_buffer(0, "first\nno newline")
+        self.assertEqual([(1, "first")], self._lines(process))
+        self.assertEqual(
+            [(1, "no newline")],
+            [(iobuf.p, iobuf.iobuf) for iobuf in process.flush()])
+        self.assertEqual([], process.flush())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import SYSTEM_VARIABLE_BASE_ADDRESS
+from spinnman.messages.spinnaker_boot import SystemVariableDefinition
+from spinnman.processes import (
+    GetIPAddressesProcess, MostDirectConnectionSelector)
+from unittests.fake_scamp import FakeSCAMP
+
+
+class TestGetIPAddressesProcess(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def test_get_ip_addresses(self):
+        address = (SYSTEM_VARIABLE_BASE_ADDRESS +
+                   SystemVariableDefinition.ethernet_ip_address.offset)
+        scamps = [FakeSCAMP(delay=0.05) for _ in range(4)]
+        connections = [
+            scamp.connection(x, 0) for x, scamp in enumerate(scamps)]
+        for x, scamp in enumerate(scamps):
+            scamp.memory[address] = bytes((10, 11, 12, x))
+        try:
+            process = GetIPAddressesProcess(
+                MostDirectConnectionSelector(connections))
+            ip_addresses = process.get_ip_addresses(
+                (x, 0) for x in range(len(scamps)))
+        finally:
+            for connection in connections:
+                connection.close()
+            for scamp in scamps:
+                scamp.close()
+        self.assertEqual(
+            {(x, 0): f"10.11.12.{x}" for x in range(len(scamps))},
+            ip_addresses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+import struct
+import tempfile
+import unittest
+from spinnman.config_setup import unittest_setup
+from spinnman.model import ChipSummaryInfo, P2PTable
+from spinnman.processes import FixedConnectionSelector, GetMachineProcess
+from unittests.fake_scamp import FakeSCAMP
+
+
+class TestGetMachineProcess(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        self.scamp = FakeSCAMP()
+        self.connection = self.scamp.connection()
+        self.selector = FixedConnectionSelector(self.connection)
+
+    def tearDown(self):
+        self.connection.close()
+        self.scamp.close()
+
+    def test_read_boot_key(self):
+        process = GetMachineProcess(self.selector)
+        # The fake answers with the low byte of each address
+        self.assertEqual(
+            (0x1f1e1d1c, 0x5f5e5d5c), process._read_boot_key(0, 0))
+
+    def test_cache(self):
+        # A 1 x 1 machine, with a route to its only chip
+        p2p_table = P2PTable(1, 1, [(b"\0\1\2\3", 0)])
+        process = GetMachineProcess(self.selector)
+        process._p2p_column_data = [(b"\0\1\2\3", 0)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = os.path.join(temp_dir, "machine.cache")
+            loaded = GetMachineProcess(self.selector)
+            self.assertFalse(loaded._load_cache(cache_file, (1, 2), 1, 1))
+            # Nothing is saved until every chip has replied
+            process._save_cache(cache_file, (1, 2), p2p_table)
+            self.assertFalse(os.path.exists(cache_file))
+            info = struct.pack("<3I", 1 << 25, 1234, 5678) + bytes(28)
+            process._chip_info = {(0, 0): ChipSummaryInfo(info, 0, 0, 0)}
+            process._chip_info_data = {(0, 0): info}
+            process._physical_to_virtual_map = {(0, 0): b"\1\2"}
+            process._virtual_to_physical_map = {(0, 0): b"\3\4"}
+            process._save_cache(cache_file, (1, 2), p2p_table)
+            self.assertFalse(loaded._load_cache(cache_file, (1, 3), 1, 1))
+            self.assertTrue(loaded._load_cache(cache_file, (1, 2), 1, 1))
+
+            # A cache that is missing a chip is not used
+            with open(cache_file, encoding="utf-8") as f:
+                cache = json.load(f)
+            chips = cache["chips"]
+            cache["chips"] = []
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            empty = GetMachineProcess(self.selector)
+            self.assertFalse(empty._load_cache(cache_file, (1, 2), 1, 1))
+            # Nor is one from another version
+            cache["chips"] = chips
+            cache["version"] = 0
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            self.assertFalse(empty._load_cache(cache_file, (1, 2), 1, 1))
+            with open(cache_file, "wb") as f:
+                f.write(b"not a cache")
+            self.assertFalse(empty._load_cache(cache_file, (1, 2), 1, 1))
+            self.assertEqual({}, empty._chip_info)
+        self.assertEqual([(b"\0\1\2\3", 0)], loaded._p2p_column_data)
+        self.assertEqual([(0, 0)], list(loaded._chip_info))
+        self.assertEqual(
+            process._chip_info[0, 0].largest_free_sdram_block,
+            loaded._chip_info[0, 0].largest_free_sdram_block)
+        self.assertEqual(info, loaded._chip_info_data[0, 0])
+        self.assertEqual({(0, 0): b"\1\2"}, loaded._physical_to_virtual_map)
+        self.assertEqual({(0, 0): b"\3\4"}, loaded._virtual_to_physical_map)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from spinn_utilities.config_holder import set_config
+from spinnman.config_setup import unittest_setup
+from spinnman.model.enums import CPUState
+from spinnman.processes import (
+    GetNCoresInStateProcess, MostDirectConnectionSelector)
+from unittests.fake_scamp import FakeSCAMP
+
+
+class TestGetNCoresInStateProcess(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def test_get_n_cores_in_states(self):
+        scamps = [FakeSCAMP(delay=0.05) for _ in range(3)]
+        connections = [
+            scamp.connection(x, 0) for x, scamp in enumerate(scamps)]
+        for x, scamp in enumerate(scamps):
+            scamp.counts[17, CPUState.RUNNING.value] = 10 + x
+            scamp.counts[17, CPUState.FINISHED.value] = x
+            scamp.counts[16, CPUState.FINISHED.value] = 100
+        try:
+            process = GetNCoresInStateProcess(
+                MostDirectConnectionSelector(connections))
+            counts = process.get_n_cores_in_states(
+                [(x, 0) for x in range(len(scamps))], 17,
+                [CPUState.RUNNING, CPUState.FINISHED, CPUState.WATCHDOG])
+        finally:
+            for connection in connections:
+                connection.close()
+            for scamp in scamps:
+                scamp.close()
+        self.assertEqual({
+            CPUState.RUNNING: 33, CPUState.FINISHED: 3,
+            CPUState.WATCHDOG: 0}, counts)
+        # Each Ethernet chip is asked once about each state
+        self.assertEqual([3, 3, 3], [scamp.n_received for scamp in scamps])
+
+    def test_get_state_histogram(self):
+        scamp = FakeSCAMP()
+        connection = scamp.connection()
+        scamp.counts[16, CPUState.READY.value] = 5
+        scamp.counts[17, CPUState.READY.value] = 2
+        scamp.counts[17, CPUState.SYNC0.value] = 7
+        try:
+            process = GetNCoresInStateProcess(
+                MostDirectConnectionSelector([connection]))
+            histogram = process.get_state_histogram(
+                [(0, 0)], [16, 17], [CPUState.READY, CPUState.SYNC0])
+        finally:
+            connection.close()
+            scamp.close()
+        self.assertEqual({
+            16: {CPUState.READY: 5, CPUState.SYNC0: 0},
+            17: {CPUState.READY: 2, CPUState.SYNC0: 7}}, histogram)
+        self.assertEqual(4, scamp.n_received)
+
+
+if __name__ == '__main__':
+    unittest.main()
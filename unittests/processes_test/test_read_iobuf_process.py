@@ -0,0 +1,115 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+from spinn_machine import CoreSubsets
+from spinn_utilities.config_holder import set_config
+from spinnman.config_setup import unittest_setup
+from spinnman.constants import CPU_IOBUF_ADDRESS_OFFSET
+from spinnman.processes import (
+    FixedConnectionSelector, MostDirectConnectionSelector, ReadIOBufProcess)
+from spinnman.utilities.utility_functions import get_vcpu_address
+from unittests.fake_scamp import FakeSCAMP
+
+_IOBUF_SIZE = 1000
+
+
+class TestReadIOBufProcess(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        self.scamp = FakeSCAMP()
+        self.connection = self.scamp.connection()
+        self.selector = FixedConnectionSelector(self.connection)
+
+    def tearDown(self):
+        self.connection.close()
+        self.scamp.close()
+
+    def _add_iobuf(self, p, *texts, scamp=None):
+        """
+        Put a chain of buffers in memory, and the address of the first in
+        the core's IOBUF address.
+        """
+        memory = (scamp or self.scamp).memory
+        address = 0
+        # Build the chain from the end, so each buffer knows the next
+        for n, text in reversed(list(enumerate(texts))):
+            next_address = address
+            address = 0x70000000 + p * 0x10000 + n * 0x1000
+            data = struct.pack(
+                "<I8xI", next_address, len(text)) + text.encode("ascii")
+            # The buffer is always the same size; the text may not fill it
+            memory[address] = data.ljust(_IOBUF_SIZE + 16, b"\0")
+        memory[
+            get_vcpu_address(p) + CPU_IOBUF_ADDRESS_OFFSET] = struct.pack(
+                "<I", address)
+
+    def test_read_iobuf(self):
+        long_text = "".join(f"line {i}\n" for i in range(120))
+        self._add_iobuf(1, long_text, "the second buffer\n")
+        self._add_iobuf(2)
+        self._add_iobuf(3, "hello\n")
+        core_subsets = CoreSubsets()
+        for p in (1, 2, 3):
+            core_subsets.add_processor(0, 0, p)
+        iobufs = {
+            iobuf.p: iobuf.iobuf
+            for iobuf in ReadIOBufProcess(self.selector).read_iobuf(
+                _IOBUF_SIZE, core_subsets)}
+        self.assertEqual({
+            1: long_text + "the second buffer\n", 2: "", 3: "hello\n"},
+            iobufs)
+
+    def test_stop_early(self):
+        core_subsets = CoreSubsets()
+        for p in range(1, 9):
+            self._add_iobuf(p, f"{p}\n" * 400)
+            core_subsets.add_processor(0, 0, p)
+        iobufs = ReadIOBufProcess(self.selector).read_iobuf(
+            _IOBUF_SIZE, core_subsets)
+        next(iter(iobufs))
+        iobufs.close()
+        # The replies to the reads in progress have all been received
+        self.assertFalse(self.connection.is_ready_to_receive(0.1))
+
+    def test_read_iobuf_boards(self):
+        set_config("Machine", "version", 5)
+        scamps = [FakeSCAMP(delay=0.05) for _ in range(3)]
+        connections = [
+            scamp.connection(x, 0) for x, scamp in enumerate(scamps)]
+        core_subsets = CoreSubsets()
+        for x, scamp in enumerate(scamps):
+            for p in range(1, 5):
+                self._add_iobuf(p, f"{x} {p}\n" * 100, "end\n", scamp=scamp)
+                core_subsets.add_processor(x, 0, p)
+        try:
+            process = ReadIOBufProcess(
+                MostDirectConnectionSelector(connections))
+            iobufs = {
+                (iobuf.x, iobuf.p): iobuf.iobuf
+                for iobuf in process.read_iobuf(_IOBUF_SIZE, core_subsets)}
+        finally:
+            for connection in connections:
+                connection.close()
+            for scamp in scamps:
+                scamp.close()
+        self.assertEqual(12, len(iobufs))
+        for (x, p), iobuf in iobufs.items():
+            self.assertEqual(f"{x} {p}\n" * 100 + "end\n", iobuf)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mmap
+import unittest
+import numpy
+from spinnman.config_setup import unittest_setup
+from spinnman.exceptions import SpinnmanInvalidParameterException
+from spinnman.processes import FixedConnectionSelector, ReadMemoryProcess
+from unittests.fake_scamp import FakeSCAMP
+
+
+def _expected(address, length):
+    return bytes((address + i) & 0xFF for i in range(length))
+
+
+class TestReadMemoryProcess(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        self.scamp = FakeSCAMP()
+        self.connection = self.scamp.connection()
+        self.selector = FixedConnectionSelector(self.connection)
+
+    def tearDown(self):
+        self.connection.close()
+        self.scamp.close()
+
+    def test_read_memory(self):
+        data = ReadMemoryProcess(self.selector).read_memory(
+            (0, 0, 0), 0x1003, 1000)
+        self.assertEqual(_expected(0x1003, 1000), data)
+
+    def test_read_into_numpy(self):
+        array = numpy.zeros(300, dtype=numpy.uint32)
+        n_bytes = ReadMemoryProcess(self.selector).read_memory_into(
+            (0, 0, 0), 0x2000, array, offset=8, length=600)
+        self.assertEqual(600, n_bytes)
+        data = array.tobytes()
+        self.assertEqual(bytes(8), data[:8])
+        self.assertEqual(_expected(0x2000, 600), data[8:608])
+        self.assertEqual(bytes(592), data[608:])
+
+    def test_read_into_mmap(self):
+        with mmap.mmap(-1, 1024) as buffer:
+            n_bytes = ReadMemoryProcess(self.selector).read_memory_into(
+                (0, 0, 0), 0x10, buffer, offset=24)
+            self.assertEqual(1000, n_bytes)
+            self.assertEqual(_expected(0x10, 1000), buffer[24:])
+
+    def test_bad_buffer(self):
+        process = ReadMemoryProcess(self.selector)
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            process.read_memory_into((0, 0, 0), 0, bytes(10))
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            process.read_memory_into((0, 0, 0), 0, bytearray(10), 4, 8)
+
+    def test_read_memory_batch(self):
+        regions = [
+            (0, 0, 0x1000, 100),
+            # Overlaps the first
+            (0, 0, 0x1050, 400),
+            # Touches the second, and spans more than one packet
+            (0, 0, 0x11E0, 500),
+            # Inside the third
+            (0, 0, 0x1200, 8),
+            # Away from the others
+            (0, 0, 0x8000, 4),
+            (1, 1, 0x1000, 16),
+            (0, 0, 0x9000, 0)]
+        data = ReadMemoryProcess(self.selector).read_memory_batch(regions)
+        self.assertEqual(len(regions), len(data))
+        for (_, _, address, length), region_data in zip(regions, data):
+            self.assertEqual(_expected(address, length), region_data)
+        # 0x1000 to 0x13D4 in 4 packets, plus one for each of the others
+        self.assertEqual(6, self.scamp.n_received)
+
+
+if __name__ == '__main__':
+    unittest.main()
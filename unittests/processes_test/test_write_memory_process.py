@@ -0,0 +1,122 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import struct
+import time
+import unittest
+import numpy
+from spinnman.config_setup import unittest_setup
+from spinnman.exceptions import (
+    SpinnmanInvalidParameterException, SpinnmanIOException)
+from spinnman.processes import FixedConnectionSelector, WriteMemoryProcess
+from spinnman.utilities.word_checksum import WordChecksum
+from unittests.fake_scamp import FakeSCAMP
+
+
+def _word_sum(data):
+    data = bytes(data) + bytes(-len(data) % 4)
+    return sum(struct.unpack(f"<{len(data) // 4}I", data)) & 0xFFFFFFFF
+
+
+class TestWriteMemoryProcess(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        self.scamp = FakeSCAMP()
+        self.connection = self.scamp.connection()
+        self.selector = FixedConnectionSelector(self.connection)
+
+    def tearDown(self):
+        self.connection.close()
+        self.scamp.close()
+
+    def test_write_memory_batch(self):
+        items = [
+            (0, 0, 0x1000, bytes(range(100))),
+            # Next to the first, so they are written together
+            (0, 0, 0x1064, bytes(range(200))),
+            (0, 0, 0x1000 + 300, bytes(range(256)) * 2),
+            # Away from the others
+            (0, 0, 0x2000, b"\x01\x02\x03\x04\x05"),
+            (0, 0, 0x3000, b"")]
+        checksums = WriteMemoryProcess(self.selector).write_memory_batch(
+            items, get_sum=True)
+        written = self.scamp.written
+        self.assertEqual([0x1000, 0x1100, 0x1200, 0x1300, 0x2000],
+                         sorted(written))
+        self.assertEqual(
+            b"".join(data for _, _, _, data in items[:3]),
+            b"".join(written[address]
+                     for address in (0x1000, 0x1100, 0x1200, 0x1300)))
+        self.assertEqual(items[3][3], written[0x2000])
+        self.assertEqual(_word_sum(items[0][3]), checksums[0])
+        self.assertEqual(0x04030201 + 5, checksums[3])
+        self.assertEqual(0, checksums[4])
+
+    def test_overlapping_items(self):
+        process = WriteMemoryProcess(self.selector)
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            process.write_memory_batch([
+                (0, 0, 0x1000, bytes(8)), (0, 0, 0x1004, bytes(8))])
+        # An overlap on a later chip stops the writes to every chip
+        with self.assertRaises(SpinnmanInvalidParameterException):
+            process.write_memory_batch([
+                (0, 0, 0x1000, bytes(8)), (1, 0, 0x1000, bytes(8)),
+                (1, 0, 0x1004, bytes(8))])
+        # Give anything that was sent time to arrive
+        time.sleep(0.1)
+        self.assertEqual(0, self.scamp.n_received)
+
+    def test_word_checksum(self):
+        data = numpy.random.bytes(100003)
+        checksum = WordChecksum()
+        self.assertEqual(0, checksum.value)
+        # Pieces of awkward sizes are summed as if they were one block
+        offset = 0
+        for size in (1, 2, 5, 3, 4, 1, 99000, 987):
+            checksum.update(memoryview(data)[offset:offset + size])
+            offset += size
+        self.assertEqual(len(data), offset)
+        self.assertEqual(_word_sum(data), checksum.value)
+
+    def test_write_with_sum(self):
+        process = WriteMemoryProcess(self.selector)
+        data = numpy.random.bytes(70001)
+        self.assertEqual(
+            _word_sum(data[3:70000]), process.write_memory_from_bytearray(
+                (0, 0, 0), 0x1000, data, 3, 69997, get_sum=True))
+        self.assertEqual(data[3:259], self.scamp.written[0x1000])
+        self.assertEqual(data[3:70000], b"".join(
+            self.scamp.written[address]
+            for address in range(0x1000, 0x1000 + 69997, 256)))
+        self.assertEqual(
+            _word_sum(data), process.write_memory_from_reader(
+                (0, 0, 0), 0x1000, io.BytesIO(data), len(data),
+                get_sum=True))
+
+    def test_reader_too_short(self):
+        process = WriteMemoryProcess(self.selector)
+        with self.assertRaises(SpinnmanIOException):
+            process.write_memory_from_reader(
+                (0, 0, 0), 0x1000, io.BytesIO(bytes(1000)), 1001,
+                get_sum=True)
+        # What was read is still written before the error
+        self.assertEqual(bytes(1000), b"".join(
+            self.scamp.written[address]
+            for address in range(0x1000, 0x1000 + 1000, 256)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+# Copyright (c) 2024 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from spinn_utilities.config_holder import set_config
+from spinn_machine import CoreSubsets
+from spinnman.config_setup import unittest_setup
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.exceptions import (
+    SpiNNManCoresNotInStateException, SpinnmanIOException)
+from spinnman.model import CPUInfo, CPUInfos, ExecutableTargets
+from spinnman.model.enums import CPUState, ExecutableType
+from spinnman.processes import ApplicationCopyRunProcess
+from spinnman.transceiver.version5transceiver import Version5Transceiver
+
+
+class _NoBoardTransceiver(Version5Transceiver):
+    """
+    A transceiver with a connection to nothing, which does not boot.
+    """
+
+    def __init__(self):
+        super().__init__([SCAMPConnection(remote_host="127.0.0.1")])
+
+    def _ensure_board_is_ready(self, n_retries=5, extra_boot_values=None):
+        pass
+
+
+class _StateTransceiver(_NoBoardTransceiver):
+    """
+    A transceiver whose cores are in the states given, and which moves the
+    cores on to the next states each time that it is asked about them one
+    by one.
+    """
+
+    def __init__(self, states):
+        """
+        :param list(dict) states:
+            The state of each core, by its (x, y, p), as they change
+        """
+        self.states = list(states)
+        super().__init__()
+
+    def get_core_state_counts(self, app_id, states, xys=None):
+        return {state: sum(
+            1 for core_state in self.states[0].values()
+            if core_state == state) for state in states}
+
+    def get_cpu_infos(self, core_subsets=None, states=None, include=True):
+        infos = CPUInfos()
+        for (x, y, p), state in self.states[0].items():
+            if (core_subsets.is_core(x, y, p) and
+                    (state in states) == include):
+                infos.add_info(CPUInfo.mock_info(x, y, p, 0, state))
+        if len(self.states) > 1:
+            self.states.pop(0)
+        return infos
+
+
+class TestBaseTransceiver(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def test_core_fails_after_ready(self):
+        cores = CoreSubsets()
+        cores.add_processor(0, 0, 1)
+        cores.add_processor(0, 0, 2)
+        # Core 1 is ready when it is first checked, and then fails as
+        # core 2 becomes ready
+        transceiver = _StateTransceiver([
+            {(0, 0, 1): CPUState.READY, (0, 0, 2): CPUState.RUNNING},
+            {(0, 0, 1): CPUState.RUN_TIME_EXCEPTION,
+             (0, 0, 2): CPUState.READY}])
+        with self.assertRaises(SpiNNManCoresNotInStateException) as context:
+            transceiver.wait_for_cores_to_be_in_state(
+                cores, 17, CPUState.READY, timeout=1.0,
+                time_between_polls=0.001, counts_between_full_check=1)
+        self.assertEqual(
+            [(0, 0, 1)], list(context.exception.failed_core_states()))
+        transceiver.close()
+
+    def test_execute_binaries(self):
+        targets = ExecutableTargets()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            binaries = [os.path.join(temp_dir, name)
+                        for name in ("a.aplx", "b.aplx", "c.aplx")]
+            for binary, data in zip(binaries, (b"same", b"same", b"diff")):
+                with open(binary, "wb") as f:
+                    f.write(data)
+            for p, binary in enumerate(binaries, 1):
+                targets.add_processor(
+                    binary, 0, 0, p, ExecutableType.USES_SIMULATION_INTERFACE)
+            transceiver = _NoBoardTransceiver()
+            try:
+                with patch.object(
+                        ApplicationCopyRunProcess, "load_and_run") as load:
+                    transceiver.execute_binaries(targets, 17, wait=True)
+                    # The files with the same contents are loaded once
+                    load.assert_called_once()
+                    loads, _address, app_id, wait = load.call_args.args
+                    self.assertEqual((17, True), (app_id, wait))
+                    self.assertEqual(
+                        [(b"same", {(0, 0, 1), (0, 0, 2)}),
+                         (b"diff", {(0, 0, 3)})],
+                        [(data, {
+                            (subset.x, subset.y, p)
+                            for subset in cores.core_subsets
+                            for p in subset.processor_ids})
+                         for data, cores in loads])
+
+                    targets.add_processor(
+                        os.path.join(temp_dir, "missing.aplx"), 0, 0, 4,
+                        ExecutableType.USES_SIMULATION_INTERFACE)
+                    with self.assertRaises(SpinnmanIOException):
+                        transceiver.execute_binaries(targets, 17)
+                    load.assert_called_once()
+            finally:
+                transceiver.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
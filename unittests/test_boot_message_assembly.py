@@ -12,10 +12,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
+import os
 import unittest
+from spinn_utilities.config_holder import set_config
 import spinnman.messages.spinnaker_boot.spinnaker_boot_message as boot_msg
 from spinnman.config_setup import unittest_setup
-from spinnman.messages.spinnaker_boot import SpinnakerBootOpCode
+from spinnman.messages.spinnaker_boot import (
+    SpinnakerBootMessages, SpinnakerBootOpCode, SystemVariableDefinition)
+from spinnman.messages.spinnaker_boot.system_variable_boot_values import (
+    SystemVariableBootValues)
+
+
+def _baseline_packets(extra_boot_values):
+    """
+    Build the boot packets one block at a time from the boot image, as
+    they were built before the packets were cached.
+    """
+    boot_values = SystemVariableBootValues()
+    boot_values.set_value(SystemVariableDefinition.hardware_version, 5)
+    boot_values.set_value(SystemVariableDefinition.is_root_chip, 1)
+    for variable, value in extra_boot_values.items():
+        boot_values.set_value(variable, value)
+    boot_data = array.array("I")
+    with open(os.path.join(
+            os.path.dirname(boot_msg.__file__), "boot_data", "scamp.boot"),
+            "rb") as f:
+        boot_data.frombytes(f.read())
+    boot_data[96:128] = array.array("I", boot_values.bytestring)[:32]
+    boot_data.byteswap()
+    data = boot_data.tobytes()
+    n_blocks = -(-len(data) // 1024)
+    messages = [boot_msg.SpinnakerBootMessage(
+        SpinnakerBootOpCode.FLOOD_FILL_START, 0, 0, n_blocks - 1)]
+    for block_id in range(n_blocks):
+        messages.append(boot_msg.SpinnakerBootMessage(
+            SpinnakerBootOpCode.FLOOD_FILL_BLOCK, (255 << 8) | block_id, 0, 0,
+            data[block_id * 1024:(block_id + 1) * 1024]))
+    messages.append(boot_msg.SpinnakerBootMessage(
+        SpinnakerBootOpCode.FLOOD_FILL_CONTROL, 1, 0, 0))
+    return [message.bytestring for message in messages]
 
 
 class TestSpiNNakerBootMessage(unittest.TestCase):
@@ -31,6 +67,45 @@ class TestSpiNNakerBootMessage(unittest.TestCase):
         self.assertEqual(msg.operand_2, 0)
         self.assertEqual(msg.operand_3, 0)
 
+    def test_boot_messages(self):
+        set_config("Machine", "version", 5)
+        # The time is fixed so that the packets can be compared
+        extra_boot_values = {
+            SystemVariableDefinition.led_0: 0x1234,
+            SystemVariableDefinition.unix_timestamp: 1234567890,
+            SystemVariableDefinition.boot_signature: 1234567890}
+        messages = SpinnakerBootMessages(extra_boot_values)
+        packets = list(messages.packets)
+        self.assertTrue(all(
+            isinstance(packet, memoryview) for packet in packets))
+        self.assertEqual(
+            _baseline_packets(extra_boot_values),
+            [bytes(packet) for packet in packets])
+        boot_messages = list(messages.messages)
+        self.assertEqual(
+            [bytes(packet) for packet in packets],
+            [bytes(message.bytestring) for message in boot_messages])
+        self.assertEqual(
+            SpinnakerBootOpCode.FLOOD_FILL_START, boot_messages[0].opcode)
+        self.assertEqual(len(packets) - 3, boot_messages[0].operand_3)
+        self.assertEqual(
+            SpinnakerBootOpCode.FLOOD_FILL_CONTROL, boot_messages[-1].opcode)
+        for block_id, message in enumerate(boot_messages[1:-1]):
+            self.assertEqual(
+                SpinnakerBootOpCode.FLOOD_FILL_BLOCK, message.opcode)
+            self.assertEqual(block_id, message.operand_1 & 0xFF)
+
+        # Only the system variables differ between sets of messages, and
+        # the shared packets are not changed
+        other = [bytes(packet) for packet in SpinnakerBootMessages(
+            {SystemVariableDefinition.led_0: 0x5678}).packets]
+        differ = [
+            i for i, (a, b) in enumerate(zip(packets, other)) if a != b]
+        self.assertEqual([1], differ)
+        self.assertNotEqual(bytes(packets[1]), other[1])
+        self.assertEqual(bytes(packets[1][:402]), other[1][:402])
+        self.assertEqual(bytes(packets[1][530:]), other[1][530:])
+
 
 if __name__ == '__main__':
     unittest.main()